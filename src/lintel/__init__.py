@@ -1,5 +1,5 @@
 from enum import Enum
-from typing import Union
+from typing import Any, Union
 
 import astroid
 
@@ -16,6 +16,17 @@ class Convention(Enum):
     GOOGLE = "google"
 
 
+class Parser(Enum):
+    """The parsers that can build the syntax tree of a module.
+
+    ``ast`` builds a reduced tree that only contains what the checks need, while ``astroid``
+    builds the complete tree.
+    """
+
+    AST = "ast"
+    ASTROID = "astroid"
+
+
 CHECKED_NODE_TYPES = Union[
     astroid.ClassDef,
     astroid.FunctionDef,
@@ -140,6 +151,14 @@ CONVENTION_ERRORS = {
     },
 }
 
+from ._instrumentation import OPERATION_COUNTS, count_operation, count_operations
+
+# isort: split
+
+from ._dunder_all import get_dunder_all, set_module_tree
+
+# isort: split
+
 from ._config import (
     DEFAULT_MATCH,
     DEFAULT_MATCH_DIR,
@@ -148,27 +167,91 @@ from ._config import (
     IllegalConfiguration,
     load_config,
 )
-from ._file_discovery import discover_files
 from ._utils import *
 
 # isort: split
 
+from ._blank_lines import BlankLines, get_blank_lines
+from ._tokens import DocstringToken, get_docstring_token, scan_docstring_tokens
+
+# isort: split
+
+from ._file_discovery import discover_files, iter_files, sort_by_recency
+from ._wordlists import get_imperative_blacklist, get_imperative_verbs, stem
+
+# isort: split
 
-from ._docstring import Docstring, Section, get_docstring_from_doc_node
-from ._docstring_error import DocstringError
+from ._docstring import (
+    Docstring,
+    Section,
+    Summary,
+    get_docstring_from_doc_node,
+    release_docstring,
+)
+from ._docstring_error import DocstringError, ErrorRecord
 from ._get_checks import get_checks
-from ._wordlists import IMPERATIVE_BLACKLIST, IMPERATIVE_VERBS, stem
 
 # isort: split
 
+from ._columns import COLUMNAR_CHECKS, DocstringColumns, get_columnar_checks
 from ._get_error_codes import (
     _get_definition_line,
     get_all_error_codes,
     get_error_codes,
     get_error_codes_to_skip,
     get_line_noqa,
+    get_module_noqa,
 )
+from ._observer import PHASES, CompositeObserver, Observer, combine_observers
+from ._parsers import (
+    PARSERS,
+    build_module,
+    is_docstring_statement,
+    parse_module,
+    parse_tree,
+    parse_with_ast,
+    parse_with_astroid,
+)
+from ._skeleton import Skeleton, scan_skeleton
+
+# isort: split
+
+from ._check_plan import CheckPlan
+
+# isort: split
+
+from ._memory import AllocationSite, MemoryProfiler, MemoryUsage
+from ._metrics import MetricsExporter
+from ._profiling import Definition, Profiler, Timing
+from ._progress import ProgressMeter
+from ._reporters import (
+    REPORTERS,
+    GitHubReporter,
+    JsonLinesReporter,
+    JUnitReporter,
+    OutputFormat,
+    Reporter,
+    SarifReporter,
+)
+from ._statistics import Statistics
+from ._tracing import Tracer
 
 # isort: split
 
 from ._check_source import check_source
+
+# isort: split
+
+#: The functions that load the former module-level wordlists on first access
+_LAZY_WORDLISTS = {
+    "IMPERATIVE_VERBS": get_imperative_verbs,
+    "IMPERATIVE_BLACKLIST": get_imperative_blacklist,
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Load the wordlists that used to be module attributes only when they are accessed."""
+    if name in _LAZY_WORDLISTS:
+        return _LAZY_WORDLISTS[name]()
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
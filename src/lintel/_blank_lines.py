@@ -0,0 +1,85 @@
+"""An index of the blank lines of a module."""
+
+from typing import List, Sequence
+from weakref import WeakKeyDictionary
+
+from astroid import Module
+
+from lintel import count_operation, get_source_lines, is_blank
+
+_BLANK_LINES: "WeakKeyDictionary[Module, BlankLines]" = WeakKeyDictionary()
+
+
+class BlankLines:
+    """Answer how many blank lines precede or follow a line in constant time.
+
+    Built in one pass over the lines from a blank-line mask. ``above[i]`` and ``below[i]`` are
+    prefix and suffix sums over the mask that restart at every line with content, i.e., the number
+    of consecutive blank lines that end or start at line ``i``. Lines are 1-based and lines after
+    the end of the module count as blank, like :func:`linecache.getline` returns empty strings for
+    them.
+    """
+
+    def __init__(self, lines: Sequence[str]) -> None:
+        """Index the blank lines.
+
+        Args:
+            lines: The lines of the module.
+        """
+        count_operation("blank_line_index")
+
+        self.mask = [False, *(is_blank(line) for line in lines)]
+        """Whether a line is blank. The first entry is a placeholder for line 0."""
+
+        n_lines = len(lines)
+
+        self.above: List[int] = [0] * (n_lines + 1)
+        self.below: List[int] = [0] * (n_lines + 2)
+
+        for i_line in range(1, n_lines + 1):
+            if self.mask[i_line]:
+                self.above[i_line] = self.above[i_line - 1] + 1
+
+        for i_line in range(n_lines, 0, -1):
+            if self.mask[i_line]:
+                self.below[i_line] = self.below[i_line + 1] + 1
+
+        self._n_lines = n_lines
+
+    def n_blanks_before(self, lineno: int) -> int:
+        """Return the number of blank lines directly before a line."""
+        previous_lineno = lineno - 1
+
+        if previous_lineno > self._n_lines:
+            return previous_lineno - self._n_lines + self.above[self._n_lines]
+
+        return self.above[max(previous_lineno, 0)]
+
+    def n_blanks_after(self, lineno: int, last_lineno: int) -> int:
+        """Return the number of blank lines directly after a line up to and including another."""
+        n_lines_after = max(last_lineno - lineno, 0)
+        first_lineno = lineno + 1
+
+        if first_lineno > self._n_lines:
+            return n_lines_after
+
+        n_blanks = self.below[first_lineno]
+
+        # Blank lines that reach the end of the module continue indefinitely
+        if first_lineno + n_blanks > self._n_lines:
+            return n_lines_after
+
+        return min(n_blanks, n_lines_after)
+
+
+def get_blank_lines(module: Module) -> BlankLines:
+    """Return the blank line index of a module.
+
+    The index is only built once per module.
+    """
+    try:
+        return _BLANK_LINES[module]
+    except KeyError:
+        blank_lines = _BLANK_LINES[module] = BlankLines(get_source_lines(module))
+
+        return blank_lines
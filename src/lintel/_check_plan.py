@@ -0,0 +1,87 @@
+"""The checks to run on a module and the parts of the module they cannot find errors in."""
+
+from bisect import bisect_left
+from typing import Iterable, Optional, Tuple, Type
+
+from astroid import ClassDef, FunctionDef
+
+from lintel import (
+    CHECKED_NODE_TYPES,
+    DocstringError,
+    Skeleton,
+    count_operation,
+    is_public,
+)
+
+
+class CheckPlan:
+    """The selected checks for a module and the subtrees that can be skipped.
+
+    A subtree is skipped if none of the checks can find an error in it:
+
+    * Checks that need a docstring cannot find errors if there is no docstring in the subtree.
+    * Checks that are only applicable to public nodes cannot find errors if no node in the subtree
+      is public. That is the case if the subtree's root is private and there is no '__dunder__'
+      definition in the subtree, because every other definition in it is private too.
+    """
+
+    def __init__(self, checks: Iterable[Type[DocstringError]], skeleton: Optional[Skeleton]):
+        """Plan the checks.
+
+        Args:
+            checks: The checks to run in the order in which they should be run.
+            skeleton: The skeleton of the module. Nothing is skipped if it is not known.
+        """
+        self.checks = list(checks)
+
+        missing_docstring_checks = [
+            check for check in self.checks if check.applicable_if_doc_string_is_missing
+        ]
+
+        self._checks_definitions = any(
+            check.is_applicable_to(ClassDef) or check.is_applicable_to(FunctionDef)
+            for check in self.checks
+        )
+        self._needs_docstrings = len(missing_docstring_checks) < len(self.checks)
+        self._needs_missing_docstrings = len(missing_docstring_checks) > 0
+        self._needs_public_nodes = all(check.only_public for check in missing_docstring_checks)
+
+        self._skeleton = skeleton
+
+    def can_find_errors_in(self, node: CHECKED_NODE_TYPES) -> bool:
+        """Return whether any check can find an error in a class or function or its descendants."""
+        if not self._checks_definitions:
+            return False
+
+        if self._skeleton is None:
+            return True
+
+        if self._needs_docstrings and self._has_docstring(node.lineno, node.end_lineno):
+            return True
+
+        if self._needs_missing_docstrings and (
+            not self._needs_public_nodes
+            or self._has_dunder(node.lineno, node.end_lineno)
+            or is_public(node)
+        ):
+            return True
+
+        count_operation("pruned_subtree")
+
+        return False
+
+    def _has_docstring(self, first_lineno: int, last_lineno: int) -> bool:
+        assert self._skeleton is not None
+
+        return _has_line_between(self._skeleton.docstring_lines, first_lineno, last_lineno)
+
+    def _has_dunder(self, first_lineno: int, last_lineno: int) -> bool:
+        assert self._skeleton is not None
+
+        return _has_line_between(self._skeleton.dunder_definitions, first_lineno, last_lineno)
+
+
+def _has_line_between(lines: Tuple[int, ...], first_lineno: int, last_lineno: int) -> bool:
+    i_line = bisect_left(lines, first_lineno)
+
+    return i_line < len(lines) and lines[i_line] <= last_lineno
@@ -1,27 +1,41 @@
 """Parsed source code checkers for docstring violations."""
 
-import re
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 
-import astroid
 from astroid import Module
 
 from lintel import (
     CHECKED_NODE_TYPES,
+    COLUMNAR_CHECKS,
     NODES_TO_CHECK,
+    CheckPlan,
     Configuration,
+    DocstringColumns,
     DocstringError,
+    Observer,
+    build_module,
+    compile_regex,
+    count_operation,
     get_checks,
     get_decorator_names,
+    get_docstring_from_doc_node,
     get_error_codes,
     get_error_codes_to_skip,
+    parse_module,
+    parse_tree,
+    read_source,
+    release_docstring,
+    scan_skeleton,
+    set_source,
 )
 
 
 def check_source(
     file_path: Path,
     config: Configuration = Configuration(),
+    observer: Observer = Observer(),
+    max_errors: Optional[int] = None,
 ) -> List[DocstringError]:
     """Check a Python source file for docstring errors.
 
@@ -29,54 +43,153 @@ def check_source(
         file_path: Path to the Python file.
         config: The configuration to use for error checking.
             Defaults to Configuration().
+        observer: Hooks that get notified while checking, e.g., for profiling.
+            Defaults to an observer that does nothing.
+        max_errors: Stop checking after this many errors. Observers are only notified about
+            the errors that are returned. Defaults to no limit.
+
+    If ``config.columnar`` is set, the simple checks in :data:`lintel.COLUMNAR_CHECKS` are
+    evaluated once over the docstrings of all nodes instead of once per node. Observers are
+    not notified about single runs of those checks then.
     """
     codes_to_check_base = get_error_codes(config)
-    module = _parse_file(file_path)
-    module_wide_skipped_errors = get_error_codes_to_skip(module)
 
-    errors: List[DocstringError] = []
+    with observer.file(file_path):
+        try:
+            with observer.phase("read"):
+                source = read_source(file_path)
 
-    nodes = [module]
+            with observer.phase("parse"):
+                tree = parse_tree(source.text, file_path, config.parser)
 
-    while len(nodes) > 0:
-        node = nodes.pop()
+                # No astroid tree is built for files that no selected check can find errors in
+                skeleton = scan_skeleton(tree, source.text)
+
+                if not skeleton.needs_checking(codes_to_check_base):
+                    return []
 
-        nodes.extend(_get_child_nodes_to_check(node))
+                module = build_module(tree, source.text, file_path, config.parser)
+                set_source(module, source)
 
-        if _skip_node(node, config):
-            continue
+            with observer.phase("noqa"):
+                module_wide_skipped_errors = get_error_codes_to_skip(module)
+
+            errors: List[DocstringError] = []
 
-        inline_skipped_errors = get_error_codes_to_skip(node, config.ignore_inline_noqa)
+            plan = CheckPlan(
+                (
+                    check
+                    for check in get_checks()
+                    if check.error_code() in codes_to_check_base - module_wide_skipped_errors
+                ),
+                skeleton,
+            )
 
-        codes_to_check = codes_to_check_base - module_wide_skipped_errors - inline_skipped_errors
+            columns = DocstringColumns() if config.columnar else None
+            columnar_checks = [
+                check
+                for check in plan.checks
+                if columns is not None and check.error_code() in COLUMNAR_CHECKS
+            ]
+            per_node_checks = [check for check in plan.checks if check not in columnar_checks]
+            checked_nodes: List[CHECKED_NODE_TYPES] = []
 
-        for check in get_checks():
-            if check.error_code() in codes_to_check:
-                found_errors = check.check(node, config)
+            # Columnar errors are sorted in between, so they can only be limited after sorting
+            limit = max_errors if columns is None else None
 
-                errors.extend(found_errors)
+            nodes = [module]
 
-                if found_errors and check.terminal:
-                    break
+            while len(nodes) > 0 and (limit is None or len(errors) < limit):
+                node = nodes.pop()
+
+                with observer.definition(node):
+                    with observer.phase("traversal"):
+                        nodes.extend(
+                            child
+                            for child in _get_child_nodes_to_check(node)
+                            if plan.can_find_errors_in(child)
+                        )
+
+                        if _skip_node(node, config):
+                            continue
+
+                    with observer.phase("noqa"):
+                        inline_skipped_errors = get_error_codes_to_skip(
+                            node, config.ignore_inline_noqa
+                        )
+
+                    codes_to_check = (
+                        codes_to_check_base - module_wide_skipped_errors - inline_skipped_errors
+                    )
+
+                    checked_nodes.append(node)
+
+                    with observer.phase("checks"):
+                        for check in per_node_checks:
+                            count_operation("check_iteration")
+
+                            if check.error_code() in codes_to_check:
+                                found_errors = observer.run_check(check, node, config)
+
+                                if limit is not None:
+                                    found_errors = found_errors[: limit - len(errors)]
+
+                                errors.extend(found_errors)
+
+                                if columns is None:
+                                    for error in found_errors:
+                                        observer.error_found(error)
+
+                                if (found_errors and check.terminal) or (
+                                    limit is not None and len(errors) >= limit
+                                ):
+                                    break
+                        else:
+                            # Columnar checks are never terminal and need a non-empty docstring
+                            if columns is not None and node.doc_node is not None:
+                                docstring = get_docstring_from_doc_node(node, config)
+
+                                if docstring.content != "":
+                                    columns.append(docstring, codes_to_check)
+
+            if columns is not None:
+                with observer.phase("checks"):
+                    errors.extend(error for _, error in columns.evaluate(columnar_checks))
+
+                # Report errors in the same order as when every check runs per node
+                node_order = {id(node): i_node for i_node, node in enumerate(checked_nodes)}
+                check_order = {
+                    check.error_code(): i_check for i_check, check in enumerate(plan.checks)
+                }
+
+                errors.sort(
+                    key=lambda error: (node_order[id(error.node)], check_order[error.error_code()])
+                )
+
+                if max_errors is not None:
+                    del errors[max_errors:]
+
+                for error in errors:
+                    observer.error_found(error)
+        finally:
+            # The reused docstring of the last node would keep the module's tree alive
+            release_docstring()
 
     return errors
 
 
-def _parse_file(file_path: Path) -> Module:
-    with open(file_path, mode="r", encoding="utf-8") as file:
-        source = file.read()
+def _parse_file(file_path: Path, config: Configuration = Configuration()) -> Module:
+    source = read_source(file_path)
+    module = parse_module(source.text, file_path, config.parser)
+    set_source(module, source)
 
-    return astroid.parse(source, module_name=file_path.stem, path=file_path.as_posix())
+    return module
 
 
 def _get_child_nodes_to_check(
     node: CHECKED_NODE_TYPES,
 ) -> List[CHECKED_NODE_TYPES]:
-    return [
-        child_node
-        for child_node in list(node.get_children())
-        if isinstance(child_node, NODES_TO_CHECK)
-    ]
+    return [child_node for child_node in node.body if isinstance(child_node, NODES_TO_CHECK)]
 
 
 def _skip_node(node: CHECKED_NODE_TYPES, config: Configuration) -> bool:
@@ -84,7 +197,7 @@ def _skip_node(node: CHECKED_NODE_TYPES, config: Configuration) -> bool:
     decorator_names = get_decorator_names(node)
 
     if config.ignore_decorators is not None and any(
-        len(re.compile(config.ignore_decorators).findall(decorator_name)) > 0
+        len(compile_regex(config.ignore_decorators).findall(decorator_name)) > 0
         for decorator_name in decorator_names
     ):
         return True
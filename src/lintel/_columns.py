@@ -0,0 +1,148 @@
+"""Columnar evaluation of simple checks over many docstrings at once."""
+
+import string
+from itertools import takewhile
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Type
+
+from lintel import CHECKED_NODE_TYPES, Docstring, DocstringError, get_checks, is_blank
+
+#: The parameters of the error found for each docstring, None if no error was found
+_Hits = List[Optional[List[Any]]]
+
+
+class DocstringColumns:
+    """The features that simple checks need of many docstrings, one list per feature.
+
+    The docstrings can come from any number of nodes and files. Every feature is extracted in a
+    single pass over the docstrings, so the checks only evaluate predicates over the lists.
+    """
+
+    def __init__(self) -> None:
+        """Create empty columns."""
+        self.nodes: List[CHECKED_NODE_TYPES] = []
+        """The node of each docstring."""
+        self.error_codes: List[Set[str]] = []
+        """The error codes to check for each docstring."""
+        self.n_lines: List[int] = []
+        """The number of lines of each docstring."""
+        self.n_content_lines: List[int] = []
+        """The number of lines with content of each docstring."""
+        self.has_closing_line: List[bool] = []
+        """Whether only indentation precedes the closing quotes of each docstring."""
+        self.n_blanks_after_summary: List[Optional[int]] = []
+        """The blank lines between summary and description, None without a description."""
+        self.has_surrounding_space: List[bool] = []
+        """Whether spaces surround the text of each docstring."""
+        self.summary_lines: List[str] = []
+        """The summary line of each docstring."""
+        self.first_words: List[str] = []
+        """The first word of each docstring."""
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def append(self, docstring: Docstring, error_codes: Set[str]) -> None:
+        """Extract the features of a non-empty docstring.
+
+        Args:
+            docstring: The docstring to extract the features from.
+            error_codes: The error codes to check for the docstring, e.g., without the codes that
+                are suppressed with ``# noqa`` comments.
+        """
+        lines = docstring.lines
+        summary = docstring.summary
+        description_lines = docstring.content.strip().split("\n")[1:]
+
+        self.nodes.append(docstring.parent_node)
+        self.error_codes.append(error_codes)
+        self.n_lines.append(len(lines))
+        self.n_content_lines.append(sum(1 for line in lines if not is_blank(line)))
+        self.has_closing_line.append(is_blank(docstring.content.rpartition("\n")[2]))
+        self.n_blanks_after_summary.append(
+            len(list(takewhile(is_blank, description_lines))) if description_lines else None
+        )
+        self.has_surrounding_space.append(bool(summary.leading_space or summary.trailing_space))
+        self.summary_lines.append(summary.line)
+        self.first_words.append(summary.first_word)
+
+    def evaluate(self, checks: Iterable[Type[DocstringError]]) -> List[Tuple[int, DocstringError]]:
+        """Evaluate checks over all docstrings.
+
+        Args:
+            checks: The checks to evaluate. Each must be in :data:`COLUMNAR_CHECKS`.
+
+        Returns:
+            The errors found with the index of the docstring that they were found in.
+        """
+        errors: List[Tuple[int, DocstringError]] = []
+
+        for check in checks:
+            error_code = check.error_code()
+            hits = COLUMNAR_CHECKS[error_code](self)
+
+            for i_row, parameters in enumerate(hits):
+                if parameters is not None and error_code in self.error_codes[i_row]:
+                    error = check(self.nodes[i_row])
+                    error.parameters = parameters
+                    errors.append((i_row, error))
+
+        return errors
+
+
+def get_columnar_checks() -> List[Type[DocstringError]]:
+    """Return the checks that can be evaluated over docstring columns."""
+    return [check for check in get_checks() if check.error_code() in COLUMNAR_CHECKS]
+
+
+def _check_d200(columns: DocstringColumns) -> _Hits:
+    return [
+        [n_lines] if n_content_lines == 1 and n_lines > 1 else None
+        for n_lines, n_content_lines in zip(columns.n_lines, columns.n_content_lines)
+    ]
+
+
+def _check_d205(columns: DocstringColumns) -> _Hits:
+    return [
+        [n_blanks] if n_blanks is not None and n_blanks != 1 else None
+        for n_blanks in columns.n_blanks_after_summary
+    ]
+
+
+def _check_d209(columns: DocstringColumns) -> _Hits:
+    return [
+        [] if n_lines > 1 and not has_closing_line else None
+        for n_lines, has_closing_line in zip(columns.n_lines, columns.has_closing_line)
+    ]
+
+
+def _check_d210(columns: DocstringColumns) -> _Hits:
+    return [[] if has_space else None for has_space in columns.has_surrounding_space]
+
+
+def _check_ends_with(columns: DocstringColumns, chars: Tuple[str, ...]) -> _Hits:
+    return [
+        [line[-1]] if line and not line.endswith(chars) else None for line in columns.summary_lines
+    ]
+
+
+def _check_d403(columns: DocstringColumns) -> _Hits:
+    return [
+        [word.capitalize(), word]
+        if word not in (word.upper(), word.capitalize())
+        and not word.startswith("'")
+        and all(char in string.ascii_letters or char == "'" for char in word)
+        else None
+        for word in columns.first_words
+    ]
+
+
+#: The checks that only depend on docstring columns by error code
+COLUMNAR_CHECKS: Dict[str, Callable[[DocstringColumns], _Hits]] = {
+    "D200": _check_d200,
+    "D205": _check_d205,
+    "D209": _check_d209,
+    "D210": _check_d210,
+    "D400": lambda columns: _check_ends_with(columns, (".",)),
+    "D403": _check_d403,
+    "D415": lambda columns: _check_ends_with(columns, (".", "!", "?")),
+}
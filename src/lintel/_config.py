@@ -1,16 +1,17 @@
 """Configuration file parsing and utilities."""
 
+import hashlib
+import json
 import logging
 import re
 import sys
 from configparser import ConfigParser
 from configparser import Error as ConfigParserError
+from enum import Enum
 from pathlib import Path
-from typing import Optional, Set, Union
+from typing import Any, Dict, FrozenSet, Iterable, Mapping, Optional, Tuple, Type, TypeVar, Union
 
-from pydantic import BaseModel, Extra, ValidationError, validator
-
-from lintel import Convention
+from lintel import Convention, Parser
 
 from ._version import __version__
 
@@ -30,60 +31,254 @@ PROJECT_CONFIG_FILES = (SETUP_CFG, TOX_INI, PYPROJECT_TOML)
 
 DEFAULT_MATCH = r'(?!test_).*\.py$'
 DEFAULT_MATCH_DIR = r'[^\.].*'
-DEFAULT_PROPERTY_DECORATORS = {
-    "property",
-    "cached_property",
-    "functools.cached_property",
+DEFAULT_PROPERTY_DECORATORS = frozenset(
+    {
+        "property",
+        "cached_property",
+        "functools.cached_property",
+    }
+)
+
+ERROR_CODE_RE = re.compile(r"D\d+\b")
+
+E = TypeVar("E", bound=Enum)
+
+_FIELDS = (
+    "convention",
+    "select",
+    "ignore",
+    "add_select",
+    "add_ignore",
+    "match",
+    "match_dir",
+    "ignore_decorators",
+    "property_decorators",
+    "ignore_inline_noqa",
+    "verbose",
+    "parser",
+    "columnar",
+)
+
+_BOOL_STRINGS = {
+    "0": False,
+    "off": False,
+    "f": False,
+    "false": False,
+    "n": False,
+    "no": False,
+    "1": True,
+    "on": True,
+    "t": True,
+    "true": True,
+    "y": True,
+    "yes": True,
 }
 
 
-class Configuration(BaseModel):
-    """The docstring checker configuration."""
-
-    convention: Convention = Convention.DEFAULT
-    select: Set[str] = set()
-    ignore: Set[str] = set()
-    add_select: Set[str] = set()
-    add_ignore: Set[str] = set()
-    match: str = DEFAULT_MATCH
-    match_dir: str = DEFAULT_MATCH_DIR
-    ignore_decorators: Optional[str] = None
-    property_decorators: Set[str] = DEFAULT_PROPERTY_DECORATORS
-    ignore_inline_noqa: bool = False
-    verbose: bool = False
-
-    @validator('select', pre=True)
-    def parse_select(cls, v: Union[str, Set[str]]) -> Set[str]:
-        if isinstance(v, str):
-            return set(re.findall(r"D\d+\b", v))
-        return v
-
-    @validator('ignore', pre=True)
-    def parse_ignore(cls, v: Union[str, Set[str]]) -> Set[str]:
-        if isinstance(v, str):
-            return set(re.findall(r"D\d+\b", v))
-        return v
-
-    @validator('add_select', pre=True)
-    def parse_add_select(cls, v: Union[str, Set[str]]) -> Set[str]:
-        if isinstance(v, str):
-            return set(re.findall(r"D\d+\b", v))
-        return v
-
-    @validator('add_ignore', pre=True)
-    def parse_add_ignore(cls, v: Union[str, Set[str]]) -> Set[str]:
-        if isinstance(v, str):
-            return set(re.findall(r"D\d+\b", v))
-        return v
-
-    @validator('property_decorators', pre=True)
-    def parse_property_decorators(cls, v: Union[str, Set[str]]) -> Set[str]:
-        if isinstance(v, str):
-            return set(v.split(",")) - {""}
-        return v
-
-    class Config:
-        extra = Extra.forbid
+class Configuration:
+    """The docstring checker configuration.
+
+    Configurations are immutable and hashable, so they can be shared between processes and used
+    as cache keys. Use :meth:`replace` to derive a modified configuration.
+    """
+
+    __slots__ = (*_FIELDS, "_digest")
+
+    convention: Convention
+    select: FrozenSet[str]
+    ignore: FrozenSet[str]
+    add_select: FrozenSet[str]
+    add_ignore: FrozenSet[str]
+    match: str
+    match_dir: str
+    ignore_decorators: Optional[str]
+    property_decorators: FrozenSet[str]
+    ignore_inline_noqa: bool
+    verbose: bool
+    parser: Parser
+    columnar: bool
+    _digest: Optional[str]
+
+    def __init__(
+        self,
+        *,
+        convention: Union[Convention, str] = Convention.DEFAULT,
+        select: Union[str, Iterable[str]] = (),
+        ignore: Union[str, Iterable[str]] = (),
+        add_select: Union[str, Iterable[str]] = (),
+        add_ignore: Union[str, Iterable[str]] = (),
+        match: str = DEFAULT_MATCH,
+        match_dir: str = DEFAULT_MATCH_DIR,
+        ignore_decorators: Optional[str] = None,
+        property_decorators: Union[str, Iterable[str]] = DEFAULT_PROPERTY_DECORATORS,
+        ignore_inline_noqa: Union[bool, str] = False,
+        verbose: Union[bool, str] = False,
+        parser: Union[Parser, str] = Parser.AST,
+        columnar: Union[bool, str] = False,
+    ) -> None:
+        """Validate and set the configuration values.
+
+        Raises:
+            IllegalConfiguration: If a value has an invalid type or content.
+        """
+        _set = object.__setattr__
+        _set(self, "convention", _parse_enum("convention", convention, Convention))
+        _set(self, "select", _parse_error_codes("select", select))
+        _set(self, "ignore", _parse_error_codes("ignore", ignore))
+        _set(self, "add_select", _parse_error_codes("add_select", add_select))
+        _set(self, "add_ignore", _parse_error_codes("add_ignore", add_ignore))
+        _set(self, "match", _parse_str("match", match))
+        _set(self, "match_dir", _parse_str("match_dir", match_dir))
+        _set(
+            self,
+            "ignore_decorators",
+            None
+            if ignore_decorators is None
+            else _parse_str("ignore_decorators", ignore_decorators),
+        )
+        _set(
+            self,
+            "property_decorators",
+            _parse_property_decorators("property_decorators", property_decorators),
+        )
+        _set(self, "ignore_inline_noqa", _parse_bool("ignore_inline_noqa", ignore_inline_noqa))
+        _set(self, "verbose", _parse_bool("verbose", verbose))
+        _set(self, "parser", _parse_enum("parser", parser, Parser))
+        _set(self, "columnar", _parse_bool("columnar", columnar))
+        _set(self, "_digest", None)
+
+    @classmethod
+    def from_dict(cls, settings: Mapping[str, Any]) -> "Configuration":
+        """Create a configuration from a mapping of option names to values.
+
+        Raises:
+            IllegalConfiguration: If an option is unknown or has an invalid value.
+        """
+        for key in settings:
+            if key not in _FIELDS:
+                raise IllegalConfiguration(f"{key}: extra fields not permitted")
+
+        return cls(**settings)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the configuration values as a dictionary."""
+        return {field: getattr(self, field) for field in _FIELDS}
+
+    def replace(self, **changes: Any) -> "Configuration":
+        """Return a copy of the configuration with the given values replaced."""
+        return self.from_dict({**self.as_dict(), **changes})
+
+    @property
+    def digest(self) -> str:
+        """A stable hash of the configuration values, e.g., for use as a cache key."""
+        digest = self._digest
+
+        if digest is None:
+            values = {field: _serialize(value) for field, value in self.as_dict().items()}
+
+            serialized = json.dumps(values, sort_keys=True, separators=(",", ":"))
+
+            digest = hashlib.sha256(serialized.encode()).hexdigest()
+            object.__setattr__(self, "_digest", digest)
+
+        return digest
+
+    def _values(self) -> Tuple[Any, ...]:
+        return tuple(getattr(self, field) for field in _FIELDS)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(
+            f"Cannot set {name!r}: configurations are immutable, use replace() instead."
+        )
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"Cannot delete {name!r}: configurations are immutable.")
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Configuration):
+            return NotImplemented
+
+        return self._values() == other._values()
+
+    def __hash__(self) -> int:
+        return hash(self._values())
+
+    def __repr__(self) -> str:
+        values = ", ".join(f"{field}={value!r}" for field, value in self.as_dict().items())
+        return f"{self.__class__.__name__}({values})"
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (self.__class__.from_dict, (self.as_dict(),))
+
+    def __copy__(self) -> "Configuration":
+        return self
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "Configuration":
+        return self
+
+
+def _serialize(value: Any) -> Any:
+    if isinstance(value, frozenset):
+        return sorted(value)
+
+    if isinstance(value, Enum):
+        return value.value
+
+    return value
+
+
+def _parse_enum(field: str, value: Union[E, str], enum: Type[E]) -> E:
+    try:
+        return enum(value)
+    except ValueError:
+        permitted = ", ".join(repr(member.value) for member in enum)
+        raise IllegalConfiguration(
+            f"{field}: value is not a valid enumeration member; permitted: {permitted}"
+        ) from None
+
+
+def _parse_error_codes(field: str, value: Union[str, Iterable[str]]) -> FrozenSet[str]:
+    if isinstance(value, str):
+        return frozenset(ERROR_CODE_RE.findall(value))
+
+    return _parse_str_set(field, value)
+
+
+def _parse_property_decorators(field: str, value: Union[str, Iterable[str]]) -> FrozenSet[str]:
+    if isinstance(value, str):
+        return frozenset(value.split(",")) - {""}
+
+    return _parse_str_set(field, value)
+
+
+def _parse_str_set(field: str, value: Iterable[str]) -> FrozenSet[str]:
+    if not isinstance(value, (set, frozenset, list, tuple)):
+        raise IllegalConfiguration(f"{field}: value is not a valid set")
+
+    if not all(isinstance(item, str) for item in value):
+        raise IllegalConfiguration(f"{field}: str type expected")
+
+    return frozenset(value)
+
+
+def _parse_str(field: str, value: str) -> str:
+    if not isinstance(value, str):
+        raise IllegalConfiguration(f"{field}: str type expected")
+
+    return value
+
+
+def _parse_bool(field: str, value: Union[bool, str]) -> bool:
+    if isinstance(value, bool):
+        return value
+
+    if isinstance(value, int) and value in (0, 1):
+        return bool(value)
+
+    if isinstance(value, str) and value.lower() in _BOOL_STRINGS:
+        return _BOOL_STRINGS[value.lower()]
+
+    raise IllegalConfiguration(f"{field}: value could not be parsed to a boolean")
 
 
 def load_config(config_path: Path) -> Configuration:
@@ -132,9 +327,11 @@ def _load_config_file(config_path: Path) -> Configuration:
     config_dict = {k.replace("-", "_"): v for k, v in config_dict.items()}
 
     try:
-        return Configuration.parse_obj(config_dict)
-    except ValidationError:
-        raise IllegalConfiguration(f"Invalid lintel settings in '{config_path}'.")
+        return Configuration.from_dict(config_dict)
+    except IllegalConfiguration as error:
+        raise IllegalConfiguration(
+            f"Invalid lintel settings in '{config_path}'. {error}"
+        ) from error
 
 
 class IllegalConfiguration(Exception):
@@ -1,29 +1,36 @@
 """Contains a docstring class."""
 
-import linecache
 import re
+from dataclasses import dataclass, field
+from functools import lru_cache
 from textwrap import dedent
-from typing import Dict, List, Optional, Set, Tuple
-
-from pydantic import BaseModel
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple
 
 from lintel import (
     CHECKED_NODE_TYPES,
     Configuration,
     Convention,
+    DocstringToken,
+    count_operation,
+    get_docstring_token,
+    get_source_lines,
     has_content,
     is_blank,
     leading_space,
     pairwise,
+    stem,
+    strip_non_alphanumeric,
 )
 
 
-class SectionUnderline(BaseModel):
+@dataclass
+class SectionUnderline:
     line: str
     i_line: int
 
 
-class Section(BaseModel):
+@dataclass
+class Section:
     """Holds information about a docstring section.
 
     * Section Name
@@ -39,10 +46,38 @@ class Section(BaseModel):
     previous_line: str
     line: str
     following_lines: List[str]
-    underline: Optional[SectionUnderline] = None
-    content_lines: List[str] = []
     i_line: int
     is_last_section: bool
+    underline: Optional[SectionUnderline] = None
+    content_lines: List[str] = field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        count_operation("section_line", len(self.following_lines))
+
+
+class Summary(NamedTuple):
+    """The summary line of a docstring, analyzed once for all checks that look at it."""
+
+    line: str
+    """The first line of the docstring text without surrounding whitespace."""
+    first_word: str
+    """The first word of the docstring text."""
+    stripped_first_word: str
+    """The first word without non-alphanumeric characters."""
+    last_char: str
+    """The last character of the summary line, empty if the docstring has no text."""
+    leading_space: str
+    """The spaces before the text on the first line of the docstring."""
+    trailing_space: str
+    """The spaces after the text of a one-line docstring."""
+
+    @property
+    def stemmed_first_word(self) -> str:
+        """The stem of the lower-case stripped first word.
+
+        Only computed when needed, because the stemmer is expensive to load.
+        """
+        return stem(self.stripped_first_word.lower())
 
 
 class Docstring:
@@ -60,9 +95,13 @@ class Docstring:
         if parent_node.doc_node is None:
             raise ValueError(f"Node '{parent_node.name}' does not have a doc node.")
 
+        count_operation("docstring")
+
         self.parent_node = parent_node
         self.node = parent_node.doc_node
         self.convention = convention
+        self._content = str(self.node.value).expandtabs()
+        self._summary: Optional[Summary] = None
         self._sections: List[Section] = []
 
         self._parameters: List[str] = []
@@ -73,30 +112,44 @@ class Docstring:
     @property
     def content(self) -> str:
         """The docstring content."""
-        return str(self.node.value).expandtabs()
+        return self._content
 
     @property
     def raw(self) -> str:
         """The raw docstring lines."""
         return "\n".join(
             l.rstrip()
-            for l in linecache.getlines(self.parent_node.root().file)[
+            for l in get_source_lines(self.parent_node.root())[
                 self.node.fromlineno - 1 : self.node.end_lineno
             ]
         )
 
+    @property
+    def summary(self) -> Summary:
+        """The analysis of the summary line, which is only computed once."""
+        if self._summary is None:
+            self._summary = _analyze_summary(self._content)
+
+        return self._summary
+
     @property
     def lines(self) -> List[str]:
         """The lines of the docstring without triple quotes."""
         return self.content.splitlines()
 
+    @property
+    def token(self) -> DocstringToken:
+        """The string token of the docstring with its prefix, quotes and position.
+
+        Raises:
+            ValueError: If the string token of the docstring cannot be found.
+        """
+        return get_docstring_token(self.parent_node.root(), self.node)
+
     @property
     def indent(self) -> str:
         """The indentation used for the first line of the docstring."""
-        # Get the text before the quotation marks on the first line of the docstring
-        pre_text = re.findall("(.*?)[uU]?[rR]?(\"\"\"|\'\'\')", self.raw.splitlines()[0])[0][0]
-
-        return "".join(' ' for _ in pre_text)
+        return self.token.indent
 
     @property
     def line_indents(self) -> List[str]:
@@ -123,31 +176,37 @@ class Docstring:
         return self._parameters
 
     def _parse_sections(self) -> None:
+        count_operation("parse_sections")
+
         if self.convention not in SECTION_NAMES:
             return
 
-        lower_section_names = [s.lower() for s in SECTION_NAMES[self.convention]]
+        lines = self.lines
+        lower_section_names = {s.lower() for s in SECTION_NAMES[self.convention]}
 
+        # The following lines are only filled in once the false positives are ruled out, so that
+        # docstrings with many lines that look like section names take linear time, too.
         sections = [
             Section(
-                name=_get_leading_words(line.strip()),
-                previous_line=self.lines[i_line - 1],
+                name=_get_leading_words(line),
+                previous_line=lines[i_line - 1],
                 line=line,
-                following_lines=self.lines[i_line + 1 :],
+                following_lines=[],
                 i_line=i_line,
                 is_last_section=False,
             )
-            for i_line, line in enumerate(self.lines)
-            if _get_leading_words(line.lower()) in lower_section_names and i_line > 0
+            for i_line, line in enumerate(lines)
+            if i_line > 0 and _get_leading_words(line.lower()) in lower_section_names
         ]
 
         # Rule out false positives.
         sections = [section for section in sections if _is_docstring_section(section)]
 
-        # Trim the `following lines` field to only reach the next section name.
-        for this_section, next_section in pairwise(sections, None):
-            end = -1 if next_section is None else next_section.i_line
-            this_section.following_lines = self.lines[this_section.i_line + 1 : end]  # type: ignore
+        # The following lines only reach the next section name.
+        for i_section, section in enumerate(sections):
+            end = sections[i_section + 1].i_line if i_section + 1 < len(sections) else -1
+            section.following_lines = lines[section.i_line + 1 : end]
+            count_operation("section_line", len(section.following_lines))
 
         # Determine section underline and content lines
         for section in sections:
@@ -178,11 +237,45 @@ def get_docstring_from_doc_node(
     node: CHECKED_NODE_TYPES,
     config: Configuration,
 ) -> Docstring:
-    """Retrieve the docstring of an astroid node."""
+    """Retrieve the docstring of an astroid node.
+
+    The checks of a node run one after another, so the docstring of the last node is reused.
+    """
     if node.doc_node is None:
         raise ValueError("Node does not have a doc node.")
 
-    return Docstring(node, config.convention)
+    return _get_docstring(node, config.convention)
+
+
+@lru_cache(maxsize=1)
+def _get_docstring(node: CHECKED_NODE_TYPES, convention: Convention) -> Docstring:
+    return Docstring(node, convention)
+
+
+def release_docstring() -> None:
+    """Forget the docstring that :func:`get_docstring_from_doc_node` reuses.
+
+    The docstring references its node, so it keeps the syntax tree of the node's module alive.
+    """
+    _get_docstring.cache_clear()
+
+
+def _analyze_summary(content: str) -> Summary:
+    first_line, _, other_lines = content.partition("\n")
+    line = content.strip().partition("\n")[0]
+    words = line.split(maxsplit=1)
+    first_word = words[0] if words else ""
+
+    return Summary(
+        line=line,
+        first_word=first_word,
+        stripped_first_word=strip_non_alphanumeric(first_word),
+        last_char=line[-1:],
+        leading_space=first_line[: len(first_line) - len(first_line.lstrip(" "))],
+        trailing_space=(
+            first_line[len(first_line.rstrip(" ")) :] if not other_lines and line else ""
+        ),
+    )
 
 
 def _get_leading_words(line: str) -> str:
@@ -190,7 +283,7 @@ def _get_leading_words(line: str) -> str:
 
     For example, if `line` is "  Hello world!!!", returns "Hello world".
     """
-    result = re.compile(r"[\w ]+").match(line.strip())
+    result = LEADING_WORDS_RE.match(line.strip())
     if result is not None:
         return result.group()
 
@@ -339,25 +432,71 @@ def _parse_google_parameters(section: Section) -> List[str]:
         )
     ).strip()
 
-    args_sections: List[str] = []
+    args_sections: List[List[str]] = []
     for line in args_content.splitlines(keepends=True):
         if not line[:1].isspace():
             # This line is the start of documentation for the next
             # parameter because it doesn't start with any whitespace.
-            args_sections.append(line)
+            args_sections.append([line])
         else:
             # This is a continuation of documentation for the last
             # parameter because it does start with whitespace.
-            args_sections[-1] += line
+            args_sections[-1].append(line)
 
     for args_section in args_sections:
-        match = GOOGLE_ARGS_REGEX.match(args_section)
-        if match:
-            docstring_args.append(match.group(1))
+        count_operation("argument_line", len(args_section))
+        name = _get_google_argument_name("".join(args_section))
+        if name is not None:
+            docstring_args.append(name)
 
     return docstring_args
 
 
+def _get_google_argument_name(text: str) -> Optional[str]:
+    r"""Return the name of a documented argument, e.g., ``name (type): Description.``.
+
+    Matches the same texts as ``^\s*(\w+)\s*(\(.*?\))?\s*:\n?\s*.+``, but scans the text once.
+    The regular expression backtracks in quadratic time on long runs of whitespace.
+    """
+    name_match = WORD_RE.match(text, _skip_whitespace(text, 0))
+
+    if name_match is None:
+        return None
+
+    i_char = _skip_whitespace(text, name_match.end())
+
+    # The description needs a character that is not a newline somewhere after the colon
+    end = len(text.rstrip("\n"))
+
+    if text.startswith(":", i_char):
+        return name_match.group() if i_char + 1 < end else None
+
+    if text.startswith("(", i_char):
+        # The type must close on the same line, but any closing bracket followed by a colon will do
+        line_end = text.find("\n", i_char)
+        line_end = len(text) if line_end == -1 else line_end
+        i_closing = text.find(")", i_char + 1, line_end)
+
+        while i_closing != -1:
+            i_colon = _skip_whitespace(text, i_closing + 1)
+
+            if text.startswith(":", i_colon) and i_colon + 1 < end:
+                return name_match.group()
+
+            i_closing = text.find(")", i_closing + 1, line_end)
+
+    return None
+
+
+def _skip_whitespace(text: str, i_char: int) -> int:
+    """Return the index of the first character from `i_char` on that is not whitespace."""
+    match = WHITESPACE_RE.match(text, i_char)
+
+    assert match
+
+    return match.end()
+
+
 SECTION_NAMES: Dict[Convention, Set[str]] = {
     Convention.NUMPY: {
         'Short Summary',
@@ -406,29 +545,11 @@ SECTION_NAMES: Dict[Convention, Set[str]] = {
     },
 }
 
-# Examples that will be matched -
-# "     random: Test" where random will be captured as the param
-# " random         : test" where random will be captured as the param
-# "  random_t (Test) : test  " where random_t will be captured as the param
-# Matches anything that fulfills all the following conditions:
-GOOGLE_ARGS_REGEX = re.compile(
-    # Begins with 0 or more whitespace characters
-    r"^\s*"
-    # Followed by 1 or more unicode chars, numbers or underscores
-    # The above is captured as the first group as this is the paramater name.
-    r"(\w+)"
-    # Followed by 0 or more whitespace characters
-    r"\s*"
-    # Matches patterns contained within round brackets.
-    # The `.*?`matches any sequence of characters in a non-greedy
-    # way (denoted by the `*?`)
-    r"(\(.*?\))?"
-    # Followed by 0 or more whitespace chars
-    r"\s*"
-    # Followed by a colon
-    r":"
-    # Might have a new line and leading whitespace
-    r"\n?\s*"
-    # Followed by 1 or more characters - which is the docstring for the parameter
-    ".+"
-)
+#: Matches the leading words of a line
+LEADING_WORDS_RE = re.compile(r"[\w ]+")
+
+#: Matches a word, e.g., the name of an argument
+WORD_RE = re.compile(r"\w+")
+
+#: Matches any whitespace including newlines
+WHITESPACE_RE = re.compile(r"\s*")
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import os
-from typing import Any, List, Optional, Union
+from typing import Any, Dict, List, NamedTuple, Optional, Union
 
 from astroid import AsyncFunctionDef, ClassDef, FunctionDef, Module
 
@@ -16,6 +16,31 @@ from lintel import (
 )
 
 
+class ErrorRecord(NamedTuple):
+    """A compact representation of an error that does not reference the syntax tree."""
+
+    code: str
+    file: str
+    line: int
+    node_type: str
+    node_name: str
+    description: str
+    """The formatted description of the error."""
+
+    @property
+    def message(self) -> str:
+        """Return the error message without context about the file."""
+        return f"{self.code}: {self.description}"
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return a JSON serializable representation of the record."""
+        return self._asdict()
+
+    def __str__(self) -> str:
+        """Return the string output for this error."""
+        return f"{self.file}:{self.line} in {self.node_type} '{self.node_name}' -> {self.message}"
+
+
 class DocstringError:
     """Linting error in docstring."""
 
@@ -32,6 +57,8 @@ class DocstringError:
     """Whether this error should be checked for if the node's docstring is empty."""
     terminal = False
     """Whether this error should skip subsequent error checks for a node."""
+    only_public = False
+    """Whether this error is only found for public nodes, see :func:`lintel.is_public`."""
     parameters: Optional[list[Any]] = None
     """Parameters used for formatting the description."""
 
@@ -46,6 +73,16 @@ class DocstringError:
     def error_code(cls) -> str:
         return cls.__name__
 
+    @classmethod
+    def is_applicable_to(cls, node_type: type) -> bool:
+        """Return whether this error can be found for nodes of the given type."""
+        applicable_nodes = cls.applicable_nodes
+
+        if not isinstance(applicable_nodes, (tuple, list)):
+            applicable_nodes = (applicable_nodes,)
+
+        return any(issubclass(node_type, node) for node in applicable_nodes)
+
     @property
     def file_name(self):
         """Return the file this error originates from."""
@@ -74,17 +111,30 @@ class DocstringError:
     @property
     def message(self) -> str:
         """Returns the error message without context about the file."""
+        return f"{self.error_code()}: {self.formatted_description}"
+
+    @property
+    def formatted_description(self) -> str:
+        """Return the description formatted with the error's parameters."""
         if self.parameters is None:
             self.parameters = []
 
-        return f"{self.error_code()}: {self.description.format(*self.parameters)}"
+        return self.description.format(*self.parameters)
+
+    def to_record(self) -> ErrorRecord:
+        """Return a compact representation of this error."""
+        return ErrorRecord(
+            code=self.error_code(),
+            file=self.file_name,
+            line=self.line,
+            node_type=self.node_type,
+            node_name=self.node_name,
+            description=self.formatted_description,
+        )
 
     def __str__(self) -> str:
         """Return the string output for this error."""
-        return (
-            f"{self.file_name}:{self.line} in {self.node_type} '{self.node_name}' -> "
-            + self.message
-        )
+        return str(self.to_record())
 
     def __repr__(self) -> str:
         return str(self)
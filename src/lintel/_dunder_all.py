@@ -0,0 +1,365 @@
+"""A static index of the names that modules export in ``__all__``."""
+
+import ast
+import hashlib
+import sys
+from pathlib import Path
+from typing import Dict, FrozenSet, List, NamedTuple, Optional, Set, Tuple
+from weakref import WeakKeyDictionary
+
+from astroid import Module
+
+from lintel import count_operation
+
+#: The names in ``__all__``, None if they are not known
+_Names = Optional[Tuple[str, ...]]
+
+#: A module name and the number of leading dots of a relative import
+_ModuleReference = Tuple[str, int]
+
+
+class _FileDunderAll(NamedTuple):
+    """The names that a module file exports and what they were evaluated from."""
+
+    digest: bytes
+    """The digest of the file's content."""
+    names: _Names
+    """The names in the module's ``__all__``."""
+    dependencies: Tuple[Tuple[Path, _Names], ...]
+    """The modules whose ``__all__`` was imported with the names that were found in them."""
+
+
+#: The exported names of module files by their resolved path
+_FILE_DUNDER_ALL: Dict[Path, _FileDunderAll] = {}
+
+#: The module files that are being evaluated, to break import cycles
+_EVALUATING: Set[Path] = set()
+
+_MODULE_DUNDER_ALL: "WeakKeyDictionary[Module, Optional[FrozenSet[str]]]" = WeakKeyDictionary()
+
+#: The ``ast`` trees that modules were built from until their ``__all__`` is evaluated
+_MODULE_TREES: "WeakKeyDictionary[Module, ast.Module]" = WeakKeyDictionary()
+
+
+def get_dunder_all(module: Module) -> Optional[FrozenSet[str]]:
+    """Return the names in a module's ``__all__`` or None if they are not known.
+
+    ``__all__`` is evaluated statically from its assignments and from augmentations with ``+=``,
+    ``extend`` and ``append`` in the module's scope. Statements in branches, e.g., of ``if`` and
+    ``try`` statements, can only add names, because they might not run. Lists and tuples of
+    strings can be concatenated and can reference the ``__all__`` of other modules, which are
+    found on disk and evaluated statically, too. Every module file is only evaluated again if
+    its content or the ``__all__`` of a module that it imports from changed.
+
+    Like astroid, augmentations that cannot be evaluated, e.g., ``__all__.extend(get_names())``,
+    are ignored. Names are not known if the module doesn't define ``__all__``, if ``__all__`` is
+    imported as a whole or if it is assigned in any other way.
+    """
+    try:
+        return _MODULE_DUNDER_ALL[module]
+    except KeyError:
+        path = Path(module.file) if module.file else None
+        tree = _MODULE_TREES.pop(module, None)
+
+        if path is not None and path.is_file():
+            names = _get_file_dunder_all(path, module.file_bytes, tree)
+        else:
+            names = _scan_dunder_all(module.file_bytes, None, [], tree)
+
+        dunder_all = _MODULE_DUNDER_ALL[module] = None if names is None else frozenset(names)
+
+        return dunder_all
+
+
+def set_module_tree(module: Module, tree: ast.Module) -> None:
+    """Share the ``ast`` tree that a module was built from, so that it is not parsed again.
+
+    Only the module's scope is evaluated, so function bodies may have been pruned.
+    """
+    _MODULE_TREES[module] = tree
+
+
+def _get_file_dunder_all(
+    path: Path, source: Optional[bytes] = None, tree: Optional[ast.Module] = None
+) -> _Names:
+    path = path.resolve()
+
+    # Modules that import each other's __all__ end up with unknown names
+    if path in _EVALUATING:
+        return None
+
+    if source is None:
+        try:
+            source = path.read_bytes()
+        except OSError:
+            return None
+
+    digest = hashlib.blake2b(source, digest_size=16).digest()
+    cached = _FILE_DUNDER_ALL.get(path)
+
+    _EVALUATING.add(path)
+
+    try:
+        if (
+            cached is not None
+            and cached.digest == digest
+            and all(
+                _get_file_dunder_all(dependency) == names
+                for dependency, names in cached.dependencies
+            )
+        ):
+            return cached.names
+
+        dependencies: List[Tuple[Path, _Names]] = []
+        names = _scan_dunder_all(source, path, dependencies, tree)
+        _FILE_DUNDER_ALL[path] = _FileDunderAll(digest, names, tuple(dependencies))
+
+        return names
+    finally:
+        _EVALUATING.discard(path)
+
+
+def _scan_dunder_all(
+    source: bytes,
+    path: Optional[Path],
+    dependencies: List[Tuple[Path, _Names]],
+    tree: Optional[ast.Module] = None,
+) -> _Names:
+    if b"__all__" not in source:
+        return None
+
+    count_operation("dunder_all_scan")
+
+    if tree is None:
+        count_operation("ast_parse")
+
+        try:
+            tree = ast.parse(source)
+        except (SyntaxError, ValueError):
+            return None
+
+    values: Dict[str, _Names] = {}
+    modules: Dict[str, _ModuleReference] = {}
+
+    def evaluate(node: ast.expr) -> _Names:
+        if isinstance(node, (ast.List, ast.Tuple)):
+            names: List[str] = []
+
+            for element in node.elts:
+                if isinstance(element, ast.Constant) and isinstance(element.value, str):
+                    names.append(element.value)
+                elif isinstance(element, ast.Starred):
+                    starred = evaluate(element.value)
+
+                    if starred is None:
+                        return None
+
+                    names.extend(starred)
+
+            return tuple(names)
+
+        if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Add):
+            left = evaluate(node.left)
+            right = evaluate(node.right)
+
+            return None if left is None or right is None else left + right
+
+        if isinstance(node, ast.Name):
+            return values.get(node.id)
+
+        if (
+            isinstance(node, ast.Attribute)
+            and node.attr == "__all__"
+            and isinstance(node.value, ast.Name)
+            and node.value.id in modules
+        ):
+            return _get_imported_dunder_all(modules[node.value.id], path, dependencies)
+
+        return None
+
+    def assign(name: str, value: _Names, is_nested: bool) -> None:
+        # Statements in branches might not run, so they can only add to what is known
+        if not is_nested or name not in values:
+            values[name] = value
+            return
+
+        current = values[name]
+
+        if current is not None and value is not None:
+            values[name] = current + value
+
+    def augment(name: str, augmentation: _Names) -> None:
+        # Like astroid, keep the names that are known if an augmentation cannot be evaluated
+        current = values.get(name)
+
+        if current is not None and augmentation is not None:
+            values[name] = current + augmentation
+
+    def visit(statements: List[ast.stmt], is_nested: bool) -> None:
+        for statement in statements:
+            if isinstance(statement, ast.Import):
+                for alias in statement.names:
+                    if alias.asname is None:
+                        top_level_name = alias.name.split(".")[0]
+                        modules[top_level_name] = (top_level_name, 0)
+                        values[top_level_name] = None
+                    else:
+                        modules[alias.asname] = (alias.name, 0)
+                        values[alias.asname] = None
+
+            elif isinstance(statement, ast.ImportFrom):
+                for alias in statement.names:
+                    name = alias.asname or alias.name
+
+                    # An imported __all__ names what another module exports, not this one
+                    if alias.name == "__all__" and name != "__all__":
+                        assign(
+                            name,
+                            _get_imported_dunder_all(
+                                (statement.module or "", statement.level), path, dependencies
+                            ),
+                            is_nested,
+                        )
+                    else:
+                        values[name] = None
+
+                    modules[name] = (
+                        ".".join(filter(None, (statement.module, alias.name))),
+                        statement.level,
+                    )
+
+            elif isinstance(statement, ast.Assign):
+                value = evaluate(statement.value)
+
+                for target in statement.targets:
+                    for target_name in _get_assigned_names(target):
+                        assign(
+                            target_name, value if isinstance(target, ast.Name) else None, is_nested
+                        )
+                        modules.pop(target_name, None)
+
+            elif isinstance(statement, ast.AnnAssign) and statement.value is not None:
+                for target_name in _get_assigned_names(statement.target):
+                    assign(target_name, evaluate(statement.value), is_nested)
+                    modules.pop(target_name, None)
+
+            elif isinstance(statement, ast.AugAssign) and isinstance(statement.target, ast.Name):
+                augment(
+                    statement.target.id,
+                    evaluate(statement.value) if isinstance(statement.op, ast.Add) else None,
+                )
+
+            elif _is_dunder_all_call(statement):
+                assert isinstance(statement, ast.Expr) and isinstance(statement.value, ast.Call)
+                assert isinstance(statement.value.func, ast.Attribute)
+
+                method = statement.value.func.attr
+                arguments = statement.value.args
+
+                if len(arguments) != 1:
+                    augmentation = None
+                elif method == "extend":
+                    augmentation = evaluate(arguments[0])
+                elif isinstance(arguments[0], ast.Constant) and isinstance(arguments[0].value, str):
+                    augmentation = (arguments[0].value,)
+                else:
+                    augmentation = None
+
+                augment("__all__", augmentation)
+
+            elif isinstance(statement, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+                values[statement.name] = None
+                modules.pop(statement.name, None)
+
+            else:
+                # Branches, e.g., 'if hasattr(os, "fork"): __all__.append("fork")'
+                for body in _get_nested_bodies(statement):
+                    visit(body, is_nested=True)
+
+    visit(tree.body, is_nested=False)
+
+    return values.get("__all__")
+
+
+def _get_assigned_names(target: ast.expr) -> List[str]:
+    return [
+        node.id
+        for node in ast.walk(target)
+        if isinstance(node, ast.Name) and isinstance(node.ctx, ast.Store)
+    ]
+
+
+def _get_nested_bodies(statement: ast.stmt) -> List[List[ast.stmt]]:
+    """Return the blocks of a compound statement that are in the same scope, e.g., branches."""
+    bodies = [getattr(statement, field, []) for field in ("body", "orelse", "finalbody")]
+    bodies.extend(handler.body for handler in getattr(statement, "handlers", []))
+    bodies.extend(case.body for case in getattr(statement, "cases", []))
+
+    return [body for body in bodies if body]
+
+
+def _is_dunder_all_call(statement: ast.stmt) -> bool:
+    return (
+        isinstance(statement, ast.Expr)
+        and isinstance(statement.value, ast.Call)
+        and isinstance(statement.value.func, ast.Attribute)
+        and statement.value.func.attr in ("extend", "append")
+        and isinstance(statement.value.func.value, ast.Name)
+        and statement.value.func.value.id == "__all__"
+    )
+
+
+def _get_imported_dunder_all(
+    reference: _ModuleReference, importer: Optional[Path], dependencies: List[Tuple[Path, _Names]]
+) -> _Names:
+    module_path = _find_module(reference, importer)
+
+    if module_path is None:
+        return None
+
+    names = _get_file_dunder_all(module_path)
+    dependencies.append((module_path, names))
+
+    return names
+
+
+def _find_module(reference: _ModuleReference, importer: Optional[Path]) -> Optional[Path]:
+    """Find the file of a module without importing it.
+
+    Relative imports are resolved against the importing module. Absolute imports are resolved
+    against the root of the importing module's package and then against ``sys.path``.
+    """
+    name, level = reference
+
+    if level > 0:
+        if importer is None:
+            return None
+
+        roots = [importer.parents[level - 1]] if level <= len(importer.parents) else []
+    else:
+        roots = [_get_package_root(importer)] if importer is not None else []
+        roots.extend(Path(entry or ".") for entry in sys.path)
+
+    parts = name.split(".") if name else []
+
+    for root in roots:
+        candidates = [root.joinpath(*parts, "__init__.py")]
+
+        if parts:
+            candidates.append(root.joinpath(*parts[:-1], f"{parts[-1]}.py"))
+
+        for candidate in candidates:
+            if candidate.is_file():
+                return candidate
+
+    return None
+
+
+def _get_package_root(module_path: Path) -> Path:
+    """Return the directory that contains the top-level package of a module."""
+    root = module_path.parent
+
+    while (root / "__init__.py").is_file() and root.parent != root:
+        root = root.parent
+
+    return root
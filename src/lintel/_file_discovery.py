@@ -1,25 +1,48 @@
 import os
-import re
 from pathlib import Path
-from typing import List, Set
+from typing import Iterable, Iterator, List, Set
 
-from lintel import Configuration
+from lintel import Configuration, compile_regex
 
 
 def discover_files(paths: List[Path], config: Configuration) -> Set[Path]:
+    return set(iter_files(paths, config))
+
+
+def iter_files(paths: List[Path], config: Configuration) -> Iterator[Path]:
+    """Yield the files to check one by one.
+
+    Directories are only walked as far as the files are consumed.
+    """
     discovered_files: Set[Path] = set()
 
     for path in paths:
-        if path.is_file() and re.compile(config.match).match(path.name):
-            discovered_files.add(path)
+        if path.is_file() and compile_regex(config.match).match(path.name):
+            if path not in discovered_files:
+                discovered_files.add(path)
+                yield path
 
         if path.is_dir():
             for dirpath, dirnames, filenames in os.walk(path):
                 # Do not recurse into folders that don't match the regex
-                dirnames[:] = [n for n in dirnames if re.compile(config.match_dir).match(n)]
+                dirnames[:] = [n for n in dirnames if compile_regex(config.match_dir).match(n)]
 
                 for filename in filenames:
-                    if re.compile(config.match).match(filename):
-                        discovered_files.add(Path(dirpath) / filename)
+                    if compile_regex(config.match).match(filename):
+                        file = Path(dirpath) / filename
+
+                        if file not in discovered_files:
+                            discovered_files.add(file)
+                            yield file
+
+
+def sort_by_recency(files: Iterable[Path]) -> List[Path]:
+    """Return the files ordered by their modification time, most recent first."""
+
+    def get_mtime(file: Path) -> float:
+        try:
+            return file.stat().st_mtime
+        except OSError:
+            return 0.0
 
-    return discovered_files
+    return sorted(files, key=get_mtime, reverse=True)
@@ -4,10 +4,23 @@ from typing import Set, Union
 
 from astroid import ClassDef, FunctionDef, Module
 
-from lintel import CHECKED_NODE_TYPES, CONVENTION_ERRORS, Configuration, Convention, get_checks
+from lintel import (
+    CHECKED_NODE_TYPES,
+    CONVENTION_ERRORS,
+    Configuration,
+    Convention,
+    get_checks,
+    get_source_lines,
+)
 
 _logger = logging.getLogger(__name__)
 
+MODULE_IGNORE_ALL_RE = re.compile(r"^\s*#\s*lintel\s*:\s*noqa\s*$")
+MODULE_SPECIFIC_IGNORE_RE = re.compile(r"^\s*#\s*noqa\s*:[\sA-Z\d,]*D\d+")
+LINE_IGNORE_ALL_RE = re.compile(r".*#\s*noqa(\s*$|\s*#)")
+LINE_SPECIFIC_IGNORE_RE = re.compile(r".*#\s*noqa\s*:\s*([\sA-Z\d,]*D\d+)")
+ERROR_CODE_RE = re.compile(r"D\d{0,3}\b")
+
 
 def get_all_error_codes() -> Set[str]:
     return {check.error_code() for check in get_checks()}
@@ -58,38 +71,44 @@ def get_error_codes_to_skip(node: CHECKED_NODE_TYPES, ignore_inline_noqa: bool =
 
     # Check for noqa comments in module
     if isinstance(node, Module):
-        ignore_all_regex = re.compile(r"^\s*#\s*lintel\s*:\s*noqa\s*$")
-        specific_ignore_regex = re.compile(r"^\s*#\s*noqa\s*:[\sA-Z\d,]*D\d+")
-
-        for line in node.file_bytes.decode().splitlines():
-            if ignore_all_regex.search(line):
+        for line in get_source_lines(node):
+            if MODULE_IGNORE_ALL_RE.search(line):
                 return get_all_error_codes()
 
-            for match in specific_ignore_regex.findall(line):
-                for error_code in re.findall(r"D\d{0,3}\b", match):
-                    error_codes_to_skip.add(error_code)
+            error_codes_to_skip.update(get_module_noqa(line))
 
     return error_codes_to_skip
 
 
-def get_line_noqa(line: str) -> Set[str]:
-    ignore_all_regex = re.compile(r".*#\s*noqa(\s*$|\s*#)")
-    specific_ignore_regex = re.compile(r".*#\s*noqa\s*:\s*([\sA-Z\d,]*D\d+)")
+def get_module_noqa(line: str) -> Set[str]:
+    """Return the error codes that a line suppresses for the whole module."""
+    if MODULE_IGNORE_ALL_RE.search(line):
+        return get_all_error_codes()
+
+    error_codes_to_skip: Set[str] = set()
 
-    if ignore_all_regex.search(line):
+    for match in MODULE_SPECIFIC_IGNORE_RE.findall(line):
+        for error_code in ERROR_CODE_RE.findall(match):
+            error_codes_to_skip.add(error_code)
+
+    return error_codes_to_skip
+
+
+def get_line_noqa(line: str) -> Set[str]:
+    if LINE_IGNORE_ALL_RE.search(line):
         return get_all_error_codes()
 
     error_codes_to_skip: Set[str] = set()
 
-    for match in specific_ignore_regex.findall(line):
-        for error_code in re.findall(r"D\d{0,3}\b", match):
+    for match in LINE_SPECIFIC_IGNORE_RE.findall(line):
+        for error_code in ERROR_CODE_RE.findall(match):
             error_codes_to_skip.add(error_code)
 
     return error_codes_to_skip
 
 
 def _get_definition_line(node: Union[FunctionDef, ClassDef]) -> str:
-    lines = node.root().file_bytes.decode().splitlines()[node.lineno - 1 : node.end_lineno]
+    lines = get_source_lines(node.root())[node.lineno - 1 : node.end_lineno]
     for line in lines:
         if line.lstrip().startswith(("def", "async def", "class")):
             return line
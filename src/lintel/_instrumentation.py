@@ -0,0 +1,32 @@
+"""Counters for key operations.
+
+The counters are deterministic, so tests can use them as performance budgets
+that don't depend on the speed of the machine they run on.
+"""
+
+from collections import Counter
+from contextlib import contextmanager
+from typing import Iterator
+
+#: The number of times each operation was executed since the interpreter started
+OPERATION_COUNTS: "Counter[str]" = Counter()
+
+
+def count_operation(name: str, n: int = 1) -> None:
+    """Increase the counter of the operation `name` by `n`."""
+    OPERATION_COUNTS[name] += n
+
+
+@contextmanager
+def count_operations() -> Iterator["Counter[str]"]:
+    """Count the operations executed within the context.
+
+    The yielded counter is filled when the context exits.
+    """
+    counts: "Counter[str]" = Counter()
+    start = OPERATION_COUNTS.copy()
+
+    try:
+        yield counts
+    finally:
+        counts.update(OPERATION_COUNTS - start)
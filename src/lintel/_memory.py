@@ -0,0 +1,154 @@
+"""Memory usage of lintel runs."""
+
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterator, List, Tuple
+
+from lintel import Observer
+
+
+@dataclass
+class MemoryUsage:
+    """Memory allocated while checking a file or during a phase."""
+
+    peak: int = 0
+    """The peak of memory allocated in bytes."""
+    retained: int = 0
+    """The memory in bytes that was still allocated afterwards."""
+
+    def add(self, peak: int, retained: int) -> None:
+        """Add the memory usage of another occurrence."""
+        self.peak = max(self.peak, peak)
+        self.retained += retained
+
+
+@dataclass
+class AllocationSite:
+    """A source line that allocated memory which is still in use."""
+
+    file: str
+    line: int
+    size: int
+    count: int
+
+    def __str__(self) -> str:
+        """Return the location of the site."""
+        return f"{self.file}:{self.line}"
+
+
+class MemoryProfiler(Observer):
+    """Measure the memory allocated per file and per phase with :mod:`tracemalloc`.
+
+    Allocations are only traced between :meth:`start` and :meth:`stop` or within :meth:`run`.
+    """
+
+    def __init__(self, n_frames: int = 1) -> None:
+        """Initialize the profiler.
+
+        Args:
+            n_frames: The number of frames to store per allocation.
+        """
+        self.n_frames = n_frames
+
+        self.phases: Dict[str, MemoryUsage] = {}
+        self.files: Dict[Path, MemoryUsage] = {}
+        self.sites: List[AllocationSite] = []
+
+        # The memory allocated and the peak reached so far for every open context
+        self._stack: List[List[int]] = []
+
+    def start(self) -> None:
+        """Start tracing allocations."""
+        tracemalloc.start(self.n_frames)
+
+    def stop(self) -> None:
+        """Stop tracing allocations and record the sites that allocated the retained memory."""
+        snapshot = tracemalloc.take_snapshot().filter_traces(
+            [tracemalloc.Filter(False, tracemalloc.__file__)]
+        )
+        tracemalloc.stop()
+
+        self.sites = [
+            AllocationSite(
+                stat.traceback[0].filename, stat.traceback[0].lineno, stat.size, stat.count
+            )
+            for stat in snapshot.statistics("lineno")
+        ]
+
+    @contextmanager
+    def run(self) -> Iterator[None]:
+        """Trace allocations during the run."""
+        self.start()
+
+        try:
+            yield
+        finally:
+            self.stop()
+
+    @contextmanager
+    def file(self, file_path: Path) -> Iterator[None]:
+        """Measure the memory allocated while checking a file."""
+        with self._measure() as usage:
+            yield
+
+        self.files[file_path] = MemoryUsage(*usage)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Measure the memory allocated during a phase."""
+        with self._measure() as usage:
+            yield
+
+        self.phases.setdefault(name, MemoryUsage()).add(*usage)
+
+    def files_exceeding(self, threshold: int) -> List[Tuple[Path, MemoryUsage]]:
+        """Return the files whose peak memory exceeds `threshold` bytes."""
+        return [(file, usage) for file, usage in self.files.items() if usage.peak > threshold]
+
+    def largest_files(self, n: int) -> List[Tuple[Path, MemoryUsage]]:
+        """Return the `n` files with the highest peak memory."""
+        return sorted(self.files.items(), key=lambda item: item[1].peak, reverse=True)[:n]
+
+    def largest_sites(self, n: int) -> List[AllocationSite]:
+        """Return the `n` sites that allocated the most retained memory."""
+        return self.sites[:n]
+
+    @contextmanager
+    def _measure(self) -> Iterator[List[int]]:
+        """Measure the peak and retained memory within the context.
+
+        The yielded list contains the peak and retained memory in bytes when the context exits.
+        """
+        if not tracemalloc.is_tracing():
+            yield [0, 0]
+            return
+
+        self._update_peaks()
+        current = tracemalloc.get_traced_memory()[0]
+        frame = [current, current]
+        self._stack.append(frame)
+        usage = [0, 0]
+
+        try:
+            yield usage
+        finally:
+            self._update_peaks()
+            self._stack.pop()
+
+            usage[0] = frame[1] - frame[0]
+            usage[1] = tracemalloc.get_traced_memory()[0] - frame[0]
+
+    def _update_peaks(self) -> None:
+        """Propagate the peak since the last update to all open contexts."""
+        current, peak = tracemalloc.get_traced_memory()
+
+        if hasattr(tracemalloc, "reset_peak"):
+            tracemalloc.reset_peak()
+        else:  # pragma: no cover
+            # Python 3.8 can't reset the peak, so only the memory at context boundaries counts.
+            peak = current
+
+        for frame in self._stack:
+            frame[1] = max(frame[1], peak)
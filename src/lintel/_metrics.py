@@ -0,0 +1,121 @@
+"""Metrics of lintel runs in the OpenMetrics text format."""
+
+import time
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, List, Optional
+
+from lintel import DocstringError, Observer
+
+
+class MetricsExporter(Observer):
+    """Collect metrics of a lintel run and export them in the OpenMetrics text format.
+
+    The metrics can be picked up by monitoring systems, e.g., by the textfile collector of the
+    Prometheus node exporter.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the exporter."""
+        self.files_checked = 0
+        self.files_failed = 0
+        self.errors: "Counter[str]" = Counter()
+        self.run_seconds = 0.0
+        self.file_seconds = 0.0
+        self.timestamp: Optional[float] = None
+
+    @contextmanager
+    def run(self) -> Iterator[None]:
+        """Measure the duration of the run."""
+        start = time.perf_counter()
+
+        try:
+            yield
+        finally:
+            self.run_seconds += time.perf_counter() - start
+            self.timestamp = time.time()
+
+    @contextmanager
+    def file(self, file_path: Path) -> Iterator[None]:
+        """Count the file and measure the time to check it."""
+        start = time.perf_counter()
+
+        try:
+            yield
+        except BaseException:
+            self.files_failed += 1
+            raise
+        else:
+            self.files_checked += 1
+        finally:
+            self.file_seconds += time.perf_counter() - start
+
+    def error_found(self, error: DocstringError) -> None:
+        """Count the error by its code."""
+        self.errors[error.error_code()] += 1
+
+    def as_text(self) -> str:
+        """Return the metrics in the OpenMetrics text format."""
+        lines: List[str] = []
+
+        def add(name: str, type_: str, help_: str, samples: List[str]) -> None:
+            lines.extend([f"# TYPE {name} {type_}", f"# HELP {name} {help_}", *samples])
+
+        add(
+            "lintel_files_checked",
+            "counter",
+            "Files that were checked.",
+            [f"lintel_files_checked_total {self.files_checked}"],
+        )
+        add(
+            "lintel_files_failed",
+            "counter",
+            "Files that could not be checked, e.g., because of syntax errors.",
+            [f"lintel_files_failed_total {self.files_failed}"],
+        )
+        add(
+            "lintel_errors",
+            "counter",
+            "Docstring errors by error code.",
+            [
+                f'lintel_errors_total{{code="{code}"}} {count}'
+                for code, count in sorted(self.errors.items())
+            ],
+        )
+        add(
+            "lintel_run_duration_seconds",
+            "gauge",
+            "Duration of the run.",
+            [f"lintel_run_duration_seconds {self.run_seconds}"],
+        )
+        add(
+            "lintel_file_duration_seconds",
+            "summary",
+            "Time spent checking files.",
+            [
+                f"lintel_file_duration_seconds_sum {self.file_seconds}",
+                f"lintel_file_duration_seconds_count {self.files_checked + self.files_failed}",
+            ],
+        )
+
+        if self.timestamp is not None:
+            add(
+                "lintel_last_run_timestamp_seconds",
+                "gauge",
+                "Unix time when the run finished.",
+                [f"lintel_last_run_timestamp_seconds {self.timestamp}"],
+            )
+
+        return "\n".join([*lines, "# EOF"]) + "\n"
+
+    def save(self, path: Path) -> None:
+        """Write the metrics to a file.
+
+        The file is replaced atomically so that collectors never read a partial file.
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        temporary_path = path.with_name(f".{path.name}.tmp")
+        temporary_path.write_text(self.as_text())
+        temporary_path.replace(path)
@@ -0,0 +1,123 @@
+"""Hooks into the checking of source files."""
+
+from contextlib import ExitStack, contextmanager, nullcontext
+from pathlib import Path
+from typing import Callable, ContextManager, Iterator, List, Sequence, Type
+
+from lintel import CHECKED_NODE_TYPES, Configuration, DocstringError
+
+#: The phases of a lintel run in the order they occur
+PHASES = ("discovery", "read", "parse", "noqa", "traversal", "checks", "reporting")
+
+_NULL_CONTEXT: ContextManager[None] = nullcontext()
+
+
+class Observer:
+    """Observe lintel while it checks source files.
+
+    All hooks do nothing by default. Subclasses override the hooks they are interested in.
+    The hooks are called from :func:`lintel.check_source` and the CLI. When using the Python
+    API, wrap the calls of :func:`lintel.check_source` in :meth:`run`::
+
+        with observer.run():
+            for file in files:
+                check_source(file, config, observer)
+    """
+
+    def run(self) -> ContextManager[None]:
+        """Return a context that spans checking all files."""
+        return _NULL_CONTEXT
+
+    def files_discovered(self, n_files: int) -> None:
+        """Handle the number of files that will be checked in this run."""
+
+    def file(self, file_path: Path) -> ContextManager[None]:
+        """Return a context that spans checking a single file."""
+        return _NULL_CONTEXT
+
+    def phase(self, name: str) -> ContextManager[None]:
+        """Return a context that spans a phase, e.g., reading or parsing a file.
+
+        See :data:`lintel.PHASES` for the available phases.
+        """
+        return _NULL_CONTEXT
+
+    def definition(self, node: CHECKED_NODE_TYPES) -> ContextManager[None]:
+        """Return a context that spans checking a single module, class or function."""
+        return _NULL_CONTEXT
+
+    def run_check(
+        self, check: Type[DocstringError], node: CHECKED_NODE_TYPES, config: Configuration
+    ) -> List[DocstringError]:
+        """Run a check on a node and return the found errors."""
+        return check.check(node, config)
+
+    def error_found(self, error: DocstringError) -> None:
+        """Handle an error found by a check."""
+
+
+class CompositeObserver(Observer):
+    """Notify several observers.
+
+    Checks are run through the first observer, so only that observer's
+    :meth:`~Observer.run_check` hook is called.
+    """
+
+    def __init__(self, observers: Sequence[Observer]) -> None:
+        """Initialize the observer.
+
+        Args:
+            observers: The observers to notify. Must not be empty.
+        """
+        self.observers = observers
+
+    def run(self) -> ContextManager[None]:
+        """Enter the run contexts of all observers."""
+        return self._enter_all(lambda observer: observer.run())
+
+    def files_discovered(self, n_files: int) -> None:
+        """Notify all observers of the number of files to check."""
+        for observer in self.observers:
+            observer.files_discovered(n_files)
+
+    def file(self, file_path: Path) -> ContextManager[None]:
+        """Enter the file contexts of all observers."""
+        return self._enter_all(lambda observer: observer.file(file_path))
+
+    def phase(self, name: str) -> ContextManager[None]:
+        """Enter the phase contexts of all observers."""
+        return self._enter_all(lambda observer: observer.phase(name))
+
+    def definition(self, node: CHECKED_NODE_TYPES) -> ContextManager[None]:
+        """Enter the definition contexts of all observers."""
+        return self._enter_all(lambda observer: observer.definition(node))
+
+    def run_check(
+        self, check: Type[DocstringError], node: CHECKED_NODE_TYPES, config: Configuration
+    ) -> List[DocstringError]:
+        """Run a check through the first observer."""
+        return self.observers[0].run_check(check, node, config)
+
+    def error_found(self, error: DocstringError) -> None:
+        """Notify all observers of an error."""
+        for observer in self.observers:
+            observer.error_found(error)
+
+    @contextmanager
+    def _enter_all(self, get_context: Callable[[Observer], ContextManager[None]]) -> Iterator[None]:
+        with ExitStack() as stack:
+            for observer in self.observers:
+                stack.enter_context(get_context(observer))
+
+            yield
+
+
+def combine_observers(observers: Sequence[Observer]) -> Observer:
+    """Return an observer that notifies all `observers`."""
+    if not observers:
+        return Observer()
+
+    if len(observers) == 1:
+        return observers[0]
+
+    return CompositeObserver(observers)
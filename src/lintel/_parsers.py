@@ -0,0 +1,166 @@
+"""Parser backends that build the syntax tree of a module."""
+
+import ast
+import os
+from pathlib import Path
+from typing import Callable, Dict, List
+
+from astroid import AstroidSyntaxError, Module
+from astroid.builder import MISPLACED_TYPE_ANNOTATION_ERROR, AstroidBuilder
+from astroid.manager import AstroidManager
+from astroid.rebuilder import TreeRebuilder
+
+from lintel import Parser, count_operation, set_module_tree
+
+#: Statements that are kept in function bodies by the ``ast`` parser
+_KEPT_IN_FUNCTIONS = (
+    ast.ClassDef,
+    ast.FunctionDef,
+    ast.AsyncFunctionDef,
+    ast.Import,
+    ast.ImportFrom,
+)
+
+
+def parse_module(source: str, file_path: Path, parser: Parser = Parser.AST) -> Module:
+    """Build the syntax tree of a module.
+
+    Args:
+        source: The source code of the module.
+        file_path: The path of the module.
+        parser: The parser backend to use. Defaults to Parser.AST.
+
+    Raises:
+        AstroidSyntaxError: If the source code cannot be parsed.
+    """
+    return build_module(parse_tree(source, file_path, parser), source, file_path, parser)
+
+
+def parse_tree(source: str, file_path: Path, parser: Parser = Parser.AST) -> ast.Module:
+    """Parse the ``ast`` tree of a module that both parser backends build their tree from.
+
+    Type comments are only kept for the astroid backend, which infers types from them. Like
+    astroid, misplaced type comments are ignored instead of failing the whole module.
+
+    Raises:
+        AstroidSyntaxError: If the source code cannot be parsed.
+    """
+    count_operation("ast_parse")
+
+    type_comments = parser == Parser.ASTROID
+
+    try:
+        try:
+            return ast.parse(
+                source + "\n", filename=file_path.as_posix(), type_comments=type_comments
+            )
+        except SyntaxError as error:
+            if not type_comments or error.args[0] != MISPLACED_TYPE_ANNOTATION_ERROR:
+                raise
+
+            return ast.parse(source + "\n", filename=file_path.as_posix())
+    except (SyntaxError, ValueError) as error:
+        raise AstroidSyntaxError(
+            "Parsing Python code failed:\n{error}",
+            source=source,
+            modname=file_path.stem,
+            path=file_path.as_posix(),
+            error=error,
+        ) from error
+
+
+def build_module(
+    tree: ast.Module, source: str, file_path: Path, parser: Parser = Parser.AST
+) -> Module:
+    """Build the astroid tree of a module from its ``ast`` tree.
+
+    Args:
+        tree: The tree from :func:`parse_tree`. It may be modified.
+        source: The source code of the module.
+        file_path: The path of the module.
+        parser: The parser backend to use. Defaults to Parser.AST.
+    """
+    count_operation("astroid_parse")
+
+    module = PARSERS[parser](tree, source, file_path)
+
+    # Only modules that might define '__all__' keep their tree
+    if "__all__" in source:
+        set_module_tree(module, tree)
+
+    return module
+
+
+def parse_with_astroid(tree: ast.Module, source: str, file_path: Path) -> Module:
+    """Build the complete astroid tree of a module like :func:`astroid.parse` does."""
+    manager = AstroidManager()
+    builder = AstroidBuilder(manager)
+    rebuilder = TreeRebuilder(manager, data=source)
+    module = rebuilder.visit_module(
+        tree,
+        modname=file_path.stem,
+        modpath=os.path.abspath(file_path),
+        package=file_path.stem == "__init__",
+    )
+    module.file_bytes = source.encode("utf-8")
+
+    # Resolves delayed attribute assignments and '__future__' imports and applies transforms
+    return builder._post_build(module, rebuilder, "utf-8")
+
+
+def parse_with_ast(tree: ast.Module, source: str, file_path: Path) -> Module:
+    """Build a reduced astroid tree of a module from the tree of the ``ast`` module.
+
+    Function bodies only keep their docstrings, nested definitions and imports, because the
+    checks only look at definitions, decorators, arguments, docstrings and line spans. Only
+    the reduced tree is converted to astroid nodes, which is the most expensive part of parsing.
+    Definitions keep their line spans, so checks that read the source code are not affected.
+    """
+    _prune_function_bodies(tree)
+
+    module = TreeRebuilder(AstroidManager(), data=source).visit_module(
+        tree,
+        modname=file_path.stem,
+        modpath=os.path.abspath(file_path),
+        package=file_path.stem == "__init__",
+    )
+    module.file_bytes = source.encode("utf-8")
+    module.file_encoding = "utf-8"
+
+    return module
+
+
+PARSERS: Dict[Parser, Callable[[ast.Module, str, Path], Module]] = {
+    Parser.AST: parse_with_ast,
+    Parser.ASTROID: parse_with_astroid,
+}
+
+
+def is_docstring_statement(statement: ast.stmt) -> bool:
+    """Return whether a statement of the ``ast`` module is a string expression."""
+    return (
+        isinstance(statement, ast.Expr)
+        and isinstance(statement.value, ast.Constant)
+        and isinstance(statement.value.value, str)
+    )
+
+
+def _prune_function_bodies(tree: ast.Module) -> None:
+    statements: List[ast.AST] = [tree]
+
+    while len(statements) > 0:
+        statement = statements.pop()
+
+        if isinstance(statement, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            statement.body = [
+                child
+                for i_child, child in enumerate(statement.body)
+                if isinstance(child, _KEPT_IN_FUNCTIONS)
+                or (i_child == 0 and is_docstring_statement(child))
+            ]
+
+        statements.extend(
+            child
+            for child in ast.iter_child_nodes(statement)
+            if isinstance(child, (ast.stmt, ast.excepthandler))
+        )
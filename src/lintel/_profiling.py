@@ -0,0 +1,150 @@
+"""Timing of lintel runs."""
+
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Type
+
+from lintel import CHECKED_NODE_TYPES, PHASES, Configuration, DocstringError, Observer
+
+
+@dataclass
+class Timing:
+    """Aggregated durations of repeated calls."""
+
+    calls: int = 0
+    total: float = 0.0
+    max: float = 0.0
+
+    @property
+    def mean(self) -> float:
+        """The mean duration of a call."""
+        return self.total / self.calls if self.calls else 0.0
+
+    def add(self, seconds: float) -> None:
+        """Add the duration of a call."""
+        self.calls += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return a JSON serializable representation of the timing."""
+        return {"calls": self.calls, "total": self.total, "mean": self.mean, "max": self.max}
+
+
+@dataclass(frozen=True)
+class Definition:
+    """A checked module, class or function."""
+
+    file: Path
+    line: int
+    name: str
+
+    def __str__(self) -> str:
+        """Return the location and name of the definition."""
+        return f"{self.file}:{self.line} {self.name}"
+
+
+class Profiler(Observer):
+    """Measure where time is spent during a lintel run.
+
+    Time is recorded per phase, per check, per file and per definition.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the profiler."""
+        self.phases: Dict[str, float] = dict.fromkeys(PHASES, 0.0)
+        self.checks: Dict[str, Timing] = {}
+        self.files: Dict[Path, float] = {}
+        self.definitions: Dict[Definition, float] = {}
+
+        self._file: Optional[Path] = None
+
+    @contextmanager
+    def file(self, file_path: Path) -> Iterator[None]:
+        """Measure the time to check a file."""
+        self._file = file_path
+        start = time.perf_counter()
+
+        try:
+            yield
+        finally:
+            self.files[file_path] = time.perf_counter() - start
+            self._file = None
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Measure the time spent in a phase."""
+        start = time.perf_counter()
+
+        try:
+            yield
+        finally:
+            self.phases[name] += time.perf_counter() - start
+
+    @contextmanager
+    def definition(self, node: CHECKED_NODE_TYPES) -> Iterator[None]:
+        """Measure the time to check a module, class or function."""
+        start = time.perf_counter()
+
+        try:
+            yield
+        finally:
+            definition = Definition(
+                self._file or Path(node.root().file), node.lineno or 0, node.name
+            )
+            self.definitions[definition] = time.perf_counter() - start
+
+    def run_check(
+        self, check: Type[DocstringError], node: CHECKED_NODE_TYPES, config: Configuration
+    ) -> List[DocstringError]:
+        """Measure the time to run a check."""
+        start = time.perf_counter()
+
+        try:
+            return check.check(node, config)
+        finally:
+            elapsed = time.perf_counter() - start
+
+            try:
+                self.checks[check.error_code()].add(elapsed)
+            except KeyError:
+                self.checks[check.error_code()] = timing = Timing()
+                timing.add(elapsed)
+
+    def slowest_files(self, n: int) -> List[Tuple[Path, float]]:
+        """Return the `n` files that took longest to check."""
+        return sorted(self.files.items(), key=lambda item: item[1], reverse=True)[:n]
+
+    def slowest_definitions(self, n: int) -> List[Tuple[Definition, float]]:
+        """Return the `n` definitions that took longest to check."""
+        return sorted(self.definitions.items(), key=lambda item: item[1], reverse=True)[:n]
+
+    def as_dict(self, top: int = 10) -> Dict[str, Any]:
+        """Return a JSON serializable representation of the profile.
+
+        Args:
+            top: The number of slowest files and definitions to include.
+        """
+        return {
+            "phases": self.phases,
+            "checks": {
+                code: timing.as_dict()
+                for code, timing in sorted(
+                    self.checks.items(), key=lambda item: item[1].total, reverse=True
+                )
+            },
+            "slowest_files": [
+                {"file": str(file), "seconds": seconds} for file, seconds in self.slowest_files(top)
+            ],
+            "slowest_definitions": [
+                {
+                    "file": str(definition.file),
+                    "line": definition.line,
+                    "name": definition.name,
+                    "seconds": seconds,
+                }
+                for definition, seconds in self.slowest_definitions(top)
+            ],
+        }
@@ -0,0 +1,155 @@
+"""Progress of long lintel runs."""
+
+import math
+import sys
+import time
+from contextlib import contextmanager
+from datetime import timedelta
+from pathlib import Path
+from typing import Iterator, Optional, TextIO
+
+from lintel import DocstringError, Observer
+
+
+class ProgressMeter(Observer):
+    """Show the progress and throughput of a run.
+
+    On a terminal, a single status line is redrawn in place. Otherwise, a status line is
+    written periodically.
+    """
+
+    def __init__(
+        self,
+        stream: Optional[TextIO] = None,
+        interactive: Optional[bool] = None,
+        interval: Optional[float] = None,
+        report_start_and_end: bool = True,
+    ) -> None:
+        """Initialize the meter.
+
+        Args:
+            stream: The stream to write the progress to. Defaults to stderr.
+            interactive: Whether to redraw the status line in place. Defaults to whether
+                `stream` is a terminal.
+            interval: The minimum number of seconds between updates. Defaults to 0.1 seconds
+                if interactive and 10 seconds otherwise.
+            report_start_and_end: Whether to show the status when the run starts and ends. If
+                not, runs that are shorter than the interval don't show anything and the final
+                status is only shown after a periodic one. Defaults to True.
+        """
+        self.stream = stream or sys.stderr
+        self.interactive = self.stream.isatty() if interactive is None else interactive
+        self.interval = interval if interval is not None else 0.1 if self.interactive else 10.0
+        self.report_start_and_end = report_start_and_end
+
+        self.total: Optional[int] = None
+        self.done = 0
+        self.busy_seconds = 0.0
+
+        self._start = time.perf_counter()
+        self._last_update = -math.inf if report_start_and_end else self._start
+        self._is_shown = False
+        self._is_hidden_for_errors = False
+        self._is_written = False
+
+    @property
+    def elapsed(self) -> float:
+        """The number of seconds since the run started."""
+        return time.perf_counter() - self._start
+
+    @property
+    def files_per_second(self) -> float:
+        """The number of files checked per second."""
+        elapsed = self.elapsed
+        return self.done / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def eta(self) -> Optional[float]:
+        """The estimated number of seconds until all files are checked."""
+        rate = self.files_per_second
+
+        if self.total is None or rate == 0:
+            return None
+
+        return max(self.total - self.done, 0) / rate
+
+    @property
+    def utilization(self) -> float:
+        """The fraction of time spent checking files rather than waiting or reporting."""
+        elapsed = self.elapsed
+        return min(self.busy_seconds / elapsed, 1.0) if elapsed > 0 else 0.0
+
+    def status(self) -> str:
+        """Return a line describing the current progress."""
+        total = "?" if self.total is None else str(self.total)
+        eta = "?" if self.eta is None else str(timedelta(seconds=round(self.eta)))
+
+        return (
+            f"Checked {self.done}/{total} files | {self.files_per_second:.1f} files/s | "
+            f"ETA {eta} | utilization {self.utilization:.0%}"
+        )
+
+    @contextmanager
+    def run(self) -> Iterator[None]:
+        """Show the final status when the run ends."""
+        self._start = time.perf_counter()
+        self._last_update = -math.inf if self.report_start_and_end else self._start
+
+        try:
+            yield
+        finally:
+            if self.report_start_and_end or self._is_written:
+                self._update(force=True)
+
+            if self._is_shown:
+                self.stream.write("\n")
+                self.stream.flush()
+
+    def files_discovered(self, n_files: int) -> None:
+        """Set the total number of files."""
+        self.total = n_files
+        self._update()
+
+    @contextmanager
+    def file(self, file_path: Path) -> Iterator[None]:
+        """Count the checked file and update the status if due."""
+        start = time.perf_counter()
+
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            self.busy_seconds += end - start
+            self.done += 1
+
+            if self._is_hidden_for_errors:
+                # The errors of this file are reported after it was checked
+                self._is_hidden_for_errors = False
+            elif end - self._last_update >= self.interval:
+                self._update()
+
+    def error_found(self, error: DocstringError) -> None:
+        """Clear the status line so that the error can be reported on its own line."""
+        if self.interactive and self._is_shown:
+            self.stream.write("\r\x1b[K")
+            self.stream.flush()
+            self._is_shown = False
+            self._is_hidden_for_errors = True
+
+    def _update(self, force: bool = False) -> None:
+        now = time.perf_counter()
+
+        if not force and now - self._last_update < self.interval:
+            return
+
+        self._last_update = now
+
+        if self.interactive:
+            # Return to the start of the line and clear it before redrawing
+            self.stream.write(f"\r\x1b[K{self.status()}")
+            self._is_shown = True
+        else:
+            self.stream.write(f"{self.status()}\n")
+
+        self.stream.flush()
+        self._is_written = True
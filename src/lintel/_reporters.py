@@ -0,0 +1,234 @@
+"""Machine-readable output formats."""
+
+import json
+from enum import Enum
+from pathlib import Path
+from typing import Any, Dict, List, Sequence, TextIO, Type
+from xml.sax.saxutils import escape, quoteattr
+
+from lintel import ErrorRecord, __version__
+
+
+class OutputFormat(str, Enum):
+    """The formats errors can be reported in."""
+
+    TEXT = "text"
+    JSONL = "jsonl"
+    SARIF = "sarif"
+    JUNIT = "junit"
+    GITHUB = "github"
+
+
+class Reporter:
+    """Stream errors to an output in a machine-readable format.
+
+    Errors are written per file as soon as the file is checked.
+    """
+
+    def __init__(self, stream: TextIO) -> None:
+        """Initialize the reporter.
+
+        Args:
+            stream: The stream to write the report to.
+        """
+        self.stream = stream
+
+    def start(self) -> None:
+        """Write everything that precedes the first file."""
+
+    def report(self, file: Path, records: Sequence[ErrorRecord]) -> None:
+        """Write the errors of a checked file."""
+        raise NotImplementedError()
+
+    def skip(self, file: Path) -> None:
+        """Write that a file was not checked."""
+
+    def fail(self, file: Path, record: ErrorRecord) -> None:
+        """Write that a file could not be parsed.
+
+        The record's code is ``parse-error`` and its line is where parsing failed if known.
+        """
+        raise NotImplementedError()
+
+    def finish(self) -> None:
+        """Write everything that follows the last file."""
+
+
+class JsonLinesReporter(Reporter):
+    """Write one JSON object per error."""
+
+    def report(self, file: Path, records: Sequence[ErrorRecord]) -> None:
+        """Write a line per error."""
+        for record in records:
+            self.stream.write(json.dumps(record.as_dict()) + "\n")
+
+        self.stream.flush()
+
+    def fail(self, file: Path, record: ErrorRecord) -> None:
+        """Write a line for the parse error."""
+        self.report(file, [record])
+
+
+class SarifReporter(Reporter):
+    """Write a SARIF 2.1.0 log, e.g., for code scanning services."""
+
+    def __init__(self, stream: TextIO) -> None:
+        """Initialize the reporter."""
+        super().__init__(stream)
+
+        self._is_first_result = True
+        self._rules: Dict[str, int] = {}
+        self._notifications: List[Dict[str, Any]] = []
+
+    def start(self) -> None:
+        """Open the log and the list of results."""
+        self.stream.write(
+            '{"version": "2.1.0", '
+            '"$schema": "https://json.schemastore.org/sarif-2.1.0.json", '
+            '"runs": [{"results": ['
+        )
+
+    def report(self, file: Path, records: Sequence[ErrorRecord]) -> None:
+        """Write a result per error."""
+        for record in records:
+            rule_index = self._rules.setdefault(record.code, len(self._rules))
+
+            result = {
+                "ruleId": record.code,
+                "ruleIndex": rule_index,
+                "level": "error",
+                "message": {"text": record.description},
+                "locations": [_sarif_location(record)],
+            }
+
+            self.stream.write(("" if self._is_first_result else ", ") + json.dumps(result))
+            self._is_first_result = False
+
+        self.stream.flush()
+
+    def fail(self, file: Path, record: ErrorRecord) -> None:
+        """Keep a tool execution notification for the parse error, because it is not a result."""
+        self._notifications.append(
+            {
+                "descriptor": {"id": record.code},
+                "level": "error",
+                "message": {"text": record.description},
+                "locations": [_sarif_location(record)],
+            }
+        )
+
+    def finish(self) -> None:
+        """Close the list of results and write the tool, rule and invocation descriptions."""
+        tool = {
+            "driver": {
+                "name": "lintel",
+                "version": __version__,
+                "informationUri": "https://github.com/Mr-Pepe/lintel",
+                "rules": [{"id": code} for code in self._rules],
+            }
+        }
+
+        invocation = {
+            "executionSuccessful": not self._notifications,
+            "toolExecutionNotifications": self._notifications,
+        }
+
+        self.stream.write(
+            f'], "tool": {json.dumps(tool)}, "invocations": [{json.dumps(invocation)}]}}]}}\n'
+        )
+        self.stream.flush()
+
+
+class JUnitReporter(Reporter):
+    """Write a JUnit XML report with a test case per file."""
+
+    def start(self) -> None:
+        """Open the test suite."""
+        self.stream.write(
+            '<?xml version="1.0" encoding="utf-8"?>\n<testsuites>\n<testsuite name="lintel">\n'
+        )
+
+    def report(self, file: Path, records: Sequence[ErrorRecord]) -> None:
+        """Write a test case that fails if the file has errors."""
+        name = quoteattr(str(file))
+
+        if not records:
+            self.stream.write(f'<testcase classname="lintel" name={name}/>\n')
+        else:
+            message = quoteattr(f"{len(records)} docstring error{'s' if len(records) > 1 else ''}")
+            details = escape("\n".join(str(record) for record in records))
+
+            self.stream.write(
+                f'<testcase classname="lintel" name={name}>'
+                f'<failure message={message} type="lintel">{details}</failure>'
+                "</testcase>\n"
+            )
+
+        self.stream.flush()
+
+    def fail(self, file: Path, record: ErrorRecord) -> None:
+        """Write a test case with an error."""
+        self.stream.write(
+            f'<testcase classname="lintel" name={quoteattr(str(file))}>'
+            f"<error message={quoteattr(record.description)} type={quoteattr(record.code)}>"
+            f"{escape(str(record))}</error>"
+            "</testcase>\n"
+        )
+        self.stream.flush()
+
+    def skip(self, file: Path) -> None:
+        """Write a skipped test case."""
+        self.stream.write(
+            f'<testcase classname="lintel" name={quoteattr(str(file))}><skipped/></testcase>\n'
+        )
+        self.stream.flush()
+
+    def finish(self) -> None:
+        """Close the test suite."""
+        self.stream.write("</testsuite>\n</testsuites>\n")
+        self.stream.flush()
+
+
+class GitHubReporter(Reporter):
+    """Write GitHub Actions workflow commands that annotate the errors in pull requests."""
+
+    def report(self, file: Path, records: Sequence[ErrorRecord]) -> None:
+        """Write an error annotation per error."""
+        for record in records:
+            self.stream.write(
+                f"::error file={_escape_property(record.file)},line={max(record.line, 1)},"
+                f"title={_escape_property(f'lintel {record.code}')}::"
+                f"{_escape_data(record.message)}\n"
+            )
+
+        self.stream.flush()
+
+    def fail(self, file: Path, record: ErrorRecord) -> None:
+        """Write an error annotation for the parse error."""
+        self.report(file, [record])
+
+
+REPORTERS: Dict[OutputFormat, Type[Reporter]] = {
+    OutputFormat.JSONL: JsonLinesReporter,
+    OutputFormat.SARIF: SarifReporter,
+    OutputFormat.JUNIT: JUnitReporter,
+    OutputFormat.GITHUB: GitHubReporter,
+}
+
+
+def _sarif_location(record: ErrorRecord) -> Dict[str, Any]:
+    return {
+        "physicalLocation": {
+            "artifactLocation": {"uri": Path(record.file).as_posix()},
+            # Modules start at line 0 but SARIF lines are 1-based
+            "region": {"startLine": max(record.line, 1)},
+        }
+    }
+
+
+def _escape_data(data: str) -> str:
+    return data.replace("%", "%25").replace("\r", "%0D").replace("\n", "%0A")
+
+
+def _escape_property(value: str) -> str:
+    return _escape_data(value).replace(":", "%3A").replace(",", "%2C")
@@ -0,0 +1,106 @@
+"""A walk over the ``ast`` tree that finds out whether a module needs to be checked at all."""
+
+import ast
+from typing import FrozenSet, List, NamedTuple, Set, Tuple, Type, Union, cast
+
+from astroid import ClassDef, FunctionDef, Module
+
+from lintel import (
+    LINE_BREAK_RE,
+    DocstringError,
+    get_checks,
+    get_module_noqa,
+    is_docstring_statement,
+)
+
+_DEFINITIONS = (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)
+
+
+class Skeleton(NamedTuple):
+    """The parts of a module that the checks look at, found without building its astroid tree."""
+
+    n_definitions: int
+    """The number of classes and functions that are checked."""
+    docstring_lines: Tuple[int, ...]
+    """The sorted first lines of the docstrings of the module, its classes and functions."""
+    has_module_docstring: bool
+    """Whether the module has a docstring."""
+    dunder_definitions: Tuple[int, ...]
+    """The sorted lines of classes and functions with '__dunder__' names."""
+    skipped_error_codes: FrozenSet[str]
+    """The error codes that are suppressed for the whole module."""
+
+    def needs_checking(self, error_codes: Set[str]) -> bool:
+        """Return whether any check for the error codes can find an error in the module."""
+        error_codes = error_codes - self.skipped_error_codes
+
+        return any(
+            self._can_find_errors(check)
+            for check in get_checks()
+            if check.error_code() in error_codes
+        )
+
+    def _can_find_errors(self, check: Type[DocstringError]) -> bool:
+        applies_to_module = check.is_applicable_to(Module)
+        applies_to_definitions = check.is_applicable_to(ClassDef) or check.is_applicable_to(
+            FunctionDef
+        )
+
+        n_definition_docstrings = len(self.docstring_lines) - self.has_module_docstring
+
+        return (
+            applies_to_module
+            and (self.has_module_docstring or check.applicable_if_doc_string_is_missing)
+        ) or (
+            applies_to_definitions
+            and self.n_definitions > 0
+            and (n_definition_docstrings > 0 or check.applicable_if_doc_string_is_missing)
+        )
+
+
+def scan_skeleton(tree: ast.Module, source: str) -> Skeleton:
+    """Find the definitions and docstrings that are checked and the module-wide suppressions.
+
+    Only the bodies of the module, its classes and functions are visited, because definitions
+    in other statements, e.g., in an ``if`` block, are not checked.
+
+    Args:
+        tree: The ``ast`` tree of the module.
+        source: The source code of the module.
+    """
+    n_definitions = 0
+    docstring_lines: List[int] = []
+    dunder_definitions: List[int] = []
+
+    definitions: List[Union[ast.Module, ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef]] = [
+        tree
+    ]
+
+    while len(definitions) > 0:
+        definition = definitions.pop()
+
+        if len(definition.body) > 0 and is_docstring_statement(definition.body[0]):
+            docstring_lines.append(cast(ast.Expr, definition.body[0]).value.lineno)
+
+        for child in definition.body:
+            if isinstance(child, _DEFINITIONS):
+                n_definitions += 1
+                definitions.append(child)
+
+                if child.name.startswith("__") and child.name.endswith("__"):
+                    dunder_definitions.append(child.lineno)
+
+    skipped_error_codes: Set[str] = set()
+
+    if "noqa" in source:
+        for line in LINE_BREAK_RE.split(source):
+            if "noqa" in line:
+                skipped_error_codes.update(get_module_noqa(line))
+
+    return Skeleton(
+        n_definitions=n_definitions,
+        docstring_lines=tuple(sorted(docstring_lines)),
+        has_module_docstring=len(tree.body) > 0 and is_docstring_statement(tree.body[0]),
+        dunder_definitions=tuple(sorted(dunder_definitions)),
+        skipped_error_codes=frozenset(skipped_error_codes),
+    )
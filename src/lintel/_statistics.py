@@ -0,0 +1,62 @@
+"""Aggregated error counts."""
+
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from lintel import DocstringError, Observer
+
+
+class Statistics(Observer):
+    """Count errors per error code and per directory.
+
+    Errors are only counted, so their messages are never formatted.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the statistics."""
+        self.codes: "Counter[str]" = Counter()
+        self.directories: "Counter[str]" = Counter()
+
+        self._directory: Optional[str] = None
+
+    @property
+    def total(self) -> int:
+        """The total number of errors."""
+        return sum(self.codes.values())
+
+    @contextmanager
+    def file(self, file_path: Path) -> Iterator[None]:
+        """Attribute the errors found in the file to its directory."""
+        self._directory = str(file_path.parent)
+
+        try:
+            yield
+        finally:
+            self._directory = None
+
+    def error_found(self, error: DocstringError) -> None:
+        """Count the error."""
+        self.codes[error.error_code()] += 1
+        self.directories[self._directory or str(Path(error.file_name).parent)] += 1
+
+    def sorted_codes(self) -> List[Tuple[str, int]]:
+        """Return the error codes and their counts, most frequent first."""
+        return _sorted(self.codes)
+
+    def sorted_directories(self) -> List[Tuple[str, int]]:
+        """Return the directories and their error counts, most errors first."""
+        return _sorted(self.directories)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return a JSON serializable representation of the statistics."""
+        return {
+            "total": self.total,
+            "codes": dict(self.sorted_codes()),
+            "directories": dict(self.sorted_directories()),
+        }
+
+
+def _sorted(counter: "Counter[str]") -> List[Tuple[str, int]]:
+    return sorted(counter.items(), key=lambda item: (-item[1], item[0]))
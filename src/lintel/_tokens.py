@@ -0,0 +1,146 @@
+"""The string tokens of docstrings with their prefix, quotes and position."""
+
+import io
+import re
+import tokenize
+from typing import Dict, NamedTuple, Optional, Tuple
+from weakref import WeakKeyDictionary
+
+from astroid import Const, Module
+
+from lintel import count_operation, get_source_lines
+
+#: Regular expression for the prefix and the opening quotes of a string
+STRING_START_RE = re.compile(r"[bBfFrRuU]*(\"\"\"|'''|\"|')")
+
+_BRACKETS = {"(": 1, "[": 1, "{": 1, ")": -1, "]": -1, "}": -1}
+
+_IGNORED_TOKENS = {
+    tokenize.ENCODING,
+    tokenize.NL,
+    tokenize.INDENT,
+    tokenize.DEDENT,
+    tokenize.ENDMARKER,
+    tokenize.COMMENT,
+}
+
+_MODULE_TOKENS: "WeakKeyDictionary[Module, Optional[Dict[Tuple[int, int], DocstringToken]]]" = (
+    WeakKeyDictionary()
+)
+
+
+class DocstringToken(NamedTuple):
+    """A string token that starts a statement and therefore might be a docstring."""
+
+    start: Tuple[int, int]
+    """The line and column of the opening quotes' prefix."""
+    end: Tuple[int, int]
+    """The line and column after the closing quotes."""
+    prefix: str
+    """The string prefix, e.g., ``r``."""
+    quotes: str
+    """The quotes that delimit the string."""
+
+    @property
+    def indent(self) -> str:
+        """The indentation of the opening quotes with a space per character."""
+        return " " * self.start[1]
+
+
+def get_docstring_token(module: Module, doc_node: Const) -> DocstringToken:
+    """Return the string token of a docstring.
+
+    The prefix and quotes are read from the source line at the docstring's position. The
+    module is only tokenized if the tree does not know where the string starts.
+
+    Raises:
+        ValueError: If the string token of the docstring cannot be found.
+    """
+    lines = get_source_lines(module)
+
+    if None not in (doc_node.col_offset, doc_node.end_lineno, doc_node.end_col_offset):
+        line = lines[doc_node.lineno - 1]
+        column = _get_column(line, doc_node.col_offset)
+        match = STRING_START_RE.match(line, column)
+
+        if match is not None:
+            quotes = match.group(1)
+            end_line = lines[doc_node.end_lineno - 1]
+
+            return DocstringToken(
+                start=(doc_node.lineno, column),
+                end=(doc_node.end_lineno, _get_column(end_line, doc_node.end_col_offset)),
+                prefix=match.group()[: -len(quotes)],
+                quotes=quotes,
+            )
+
+    try:
+        tokens = _MODULE_TOKENS[module]
+    except KeyError:
+        tokens = _MODULE_TOKENS[module] = scan_docstring_tokens("\n".join(lines))
+
+    for start, token in (tokens or {}).items():
+        if start[0] == doc_node.lineno:
+            return token
+
+    raise ValueError(f"No string token found in line {doc_node.lineno} of '{module.name}'.")
+
+
+def scan_docstring_tokens(source: str) -> Optional[Dict[Tuple[int, int], DocstringToken]]:
+    """Find the strings that start a statement and therefore might be docstrings.
+
+    Returns the tokens by their start position or None if the source cannot be tokenized.
+    """
+    count_operation("tokenize")
+
+    docstrings: Dict[Tuple[int, int], DocstringToken] = {}
+
+    is_statement_start = True
+    depth = 0
+
+    try:
+        for token in tokenize.generate_tokens(io.StringIO(source).readline):
+            if token.type in _IGNORED_TOKENS:
+                continue
+
+            if token.type == tokenize.NEWLINE:
+                is_statement_start = True
+                continue
+
+            if token.type == tokenize.STRING and is_statement_start:
+                docstrings[token.start] = DocstringToken(
+                    token.start, token.end, *_split(token.string)
+                )
+            elif token.type == tokenize.OP:
+                depth += _BRACKETS.get(token.string, 0)
+
+            # Parenthesized strings are docstrings, too, e.g., '("""Docstring.""")'
+            opens_statement = (
+                is_statement_start and token.type == tokenize.OP and token.string == "("
+            )
+
+            # Statements can also follow a colon or semicolon on the same line
+            is_statement_start = opens_statement or (
+                token.type == tokenize.OP and token.string in (":", ";") and depth == 0
+            )
+    except (tokenize.TokenError, SyntaxError):
+        return None
+
+    return docstrings
+
+
+def _get_column(line: str, col_offset: int) -> int:
+    """Convert a column offset of the ``ast`` module in UTF-8 bytes to characters."""
+    if line.isascii():
+        return col_offset
+
+    return len(line.encode("utf-8")[:col_offset].decode("utf-8", errors="ignore"))
+
+
+def _split(string: str) -> Tuple[str, str]:
+    """Split a string token into its prefix and its quotes."""
+    match = STRING_START_RE.match(string)
+    assert match is not None
+    quotes = match.group(1)
+
+    return match.group()[: -len(quotes)], quotes
@@ -0,0 +1,95 @@
+"""Timelines of lintel runs."""
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from lintel import Observer
+
+
+class Tracer(Observer):
+    """Record the timeline of a lintel run as Chrome trace events.
+
+    Every thread that checks files gets its own track with spans for each file and
+    the phases within it. The trace can be opened offline in Perfetto or
+    ``chrome://tracing``.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the tracer."""
+        self.events: List[Dict[str, Any]] = []
+
+        self._pid = os.getpid()
+        self._start = time.perf_counter_ns()
+        self._threads: Dict[int, str] = {}
+
+    @contextmanager
+    def file(self, file_path: Path) -> Iterator[None]:
+        """Record a span for checking a file."""
+        with self._span(file_path.name, "file", {"path": str(file_path)}):
+            yield
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Record a span for a phase."""
+        with self._span(name, "phase"):
+            yield
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the trace in the JSON object format of the trace event format."""
+        metadata: List[Dict[str, Any]] = [
+            {
+                "name": "process_name",
+                "ph": "M",
+                "pid": self._pid,
+                "tid": 0,
+                "args": {"name": "lintel"},
+            }
+        ]
+        metadata.extend(
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": self._pid,
+                "tid": tid,
+                "args": {"name": name},
+            }
+            for tid, name in self._threads.items()
+        )
+
+        return {"traceEvents": metadata + self.events, "displayTimeUnit": "ms"}
+
+    def save(self, path: Path) -> None:
+        """Write the trace to a JSON file."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.as_dict()))
+
+    @contextmanager
+    def _span(
+        self, name: str, category: str, args: Optional[Dict[str, Any]] = None
+    ) -> Iterator[None]:
+        start = time.perf_counter_ns()
+
+        try:
+            yield
+        finally:
+            end = time.perf_counter_ns()
+            thread = threading.current_thread()
+
+            self._threads.setdefault(thread.ident or 0, thread.name)
+            self.events.append(
+                {
+                    "name": name,
+                    "cat": category,
+                    "ph": "X",
+                    "ts": (start - self._start) / 1000,
+                    "dur": (end - start) / 1000,
+                    "pid": self._pid,
+                    "tid": thread.ident or 0,
+                    "args": args or {},
+                }
+            )
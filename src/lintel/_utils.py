@@ -1,22 +1,36 @@
 """General shared utilities."""
 
+import io
 import re
+import tokenize
+from functools import lru_cache
 from itertools import tee, zip_longest
-from typing import Iterable, List, Set, Tuple, TypeVar
+from pathlib import Path
+from typing import Iterable, List, NamedTuple, Pattern, Set, Tuple, TypeVar
+from weakref import WeakKeyDictionary
 
 import astroid
-from astroid import ClassDef, FunctionDef, Module
+from astroid import AstroidSyntaxError, ClassDef, FunctionDef, Module
 
-from lintel import CHECKED_NODE_TYPES
+from lintel import CHECKED_NODE_TYPES, count_operation, get_dunder_all
 
 #: Regular expression for stripping non-alphanumeric characters
 NON_ALPHANUMERIC_STRIP_RE = re.compile(r'[\W_]+')
 
+#: Regular expression for matching leading whitespace
+LEADING_SPACE_RE = re.compile(r'\s*')
+
+#: Regular expression for the line breaks that Python counts lines by
+LINE_BREAK_RE = re.compile(r'\r\n|\r|\n')
+
 VARIADIC_MAGIC_METHODS = ("__new__", "__init__", "__call__")
 
 T = TypeVar("T")
 
+_SOURCE_LINES: "WeakKeyDictionary[Module, List[str]]" = WeakKeyDictionary()
+
 __all__ = (
+    "LINE_BREAK_RE",
     "VARIADIC_MAGIC_METHODS",
     "is_blank",
     "has_content",
@@ -30,6 +44,11 @@ __all__ = (
     "is_dunder",
     "is_overloaded",
     "is_nested_class",
+    "compile_regex",
+    "Source",
+    "read_source",
+    "set_source",
+    "get_source_lines",
 )
 
 
@@ -76,7 +95,7 @@ def strip_non_alphanumeric(string: str) -> str:
 
 def leading_space(string: str) -> str:
     """Return any leading space from `string`."""
-    match = re.compile(r'\s*').match(string)
+    match = LEADING_SPACE_RE.match(string)
 
     assert match
 
@@ -108,28 +127,34 @@ def get_decorator_names(node: CHECKED_NODE_TYPES) -> List[str]:
 
 def is_public(node: CHECKED_NODE_TYPES) -> bool:
     """Return whether a node is public."""
+    count_operation("is_public")
+
     if is_dunder(node):
         return True
 
+    while node is not None:
+        if not is_dunder(node) and not _is_public_in_parent(node):
+            return False
+
+        node = node.parent
+
+    return True
+
+
+def _is_public_in_parent(node: CHECKED_NODE_TYPES) -> bool:
     if node.name.startswith("_"):
         return False
 
-    if (
-        isinstance(node.parent, astroid.Module)
-        and not node.name in node.parent.wildcard_import_names()
-    ):
-        return False
+    if isinstance(node.parent, astroid.Module):
+        dunder_all = get_dunder_all(node.parent)
+
+        if dunder_all is not None and node.name not in dunder_all:
+            return False
 
     if isinstance(node, astroid.ClassDef) and isinstance(node.parent, astroid.FunctionDef):
         # Classes are not considered public if nested in a function
         return False
 
-    while node.parent is not None:
-        if not is_public(node.parent):
-            return False
-
-        node = node.parent
-
     return True
 
 
@@ -151,3 +176,87 @@ def is_overloaded(function_: FunctionDef) -> bool:
 def is_nested_class(class_: ClassDef) -> bool:
     """Return whether the class is nested in a function or class."""
     return isinstance(class_.parent, (FunctionDef, ClassDef))
+
+
+@lru_cache(maxsize=None)
+def compile_regex(pattern: str) -> Pattern[str]:
+    """Compile a regular expression that is only known at runtime, e.g., from the config."""
+    count_operation("regex_compile")
+
+    return re.compile(pattern)
+
+
+class Source(NamedTuple):
+    """The source code of a file, which is read and decoded once."""
+
+    data: bytes
+    """The bytes of the file."""
+    text: str
+    """The decoded source code."""
+    encoding: str
+    """The encoding that the file declares."""
+
+
+def read_source(file_path: Path) -> Source:
+    """Read a Python file and decode it with the encoding that it declares.
+
+    Like the interpreter, the encoding is detected from a byte order mark or a coding comment,
+    see :pep:`263`, and defaults to UTF-8.
+
+    Raises:
+        AstroidSyntaxError: If the file cannot be decoded.
+    """
+    data = file_path.read_bytes()
+
+    count_operation("source_decode")
+
+    try:
+        encoding, _ = tokenize.detect_encoding(io.BytesIO(data).readline)
+        text = data.decode(encoding)
+    except (SyntaxError, UnicodeDecodeError) as error:
+        raise AstroidSyntaxError(
+            "Decoding Python code failed:\n{error}",
+            modname=file_path.stem,
+            path=file_path.as_posix(),
+            error=error,
+        ) from error
+
+    return Source(data, text, encoding)
+
+
+def set_source(module: Module, source: Source) -> None:
+    """Share the source that a module was parsed from with everything that reads the module."""
+    module.file_bytes = source.data
+    module.file_encoding = source.encoding
+    _SOURCE_LINES[module] = _split_lines(source.text)
+
+
+def get_source_lines(module: Module) -> List[str]:
+    """Return the lines of a module's source code.
+
+    The source is only decoded once per module and not at all if it was shared with
+    :func:`set_source`.
+    """
+    try:
+        return _SOURCE_LINES[module]
+    except KeyError:
+        count_operation("source_decode")
+
+        lines = _SOURCE_LINES[module] = _split_lines(
+            module.file_bytes.decode(module.file_encoding or "utf-8")
+        )
+
+        return lines
+
+
+def _split_lines(text: str) -> List[str]:
+    """Split source code into lines at the same line breaks as the interpreter.
+
+    Unlike :meth:`str.splitlines`, form feeds and other separators do not break lines.
+    """
+    lines = LINE_BREAK_RE.split(text)
+
+    if lines[-1] == "":
+        lines.pop()
+
+    return lines
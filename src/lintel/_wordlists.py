@@ -1,20 +1,49 @@
 """Wordlists loaded from package data.
 
-We can treat them as part of the code for the imperative mood check, and
-therefore we load them at import time, rather than on-demand.
+The imperative verbs are shipped pre-stemmed in ``data/imperative_stems.txt``,
+so neither the wordlists nor the stemmer have to be processed at import time.
+The tables are only loaded when the imperative mood check first needs them.
+
+Call :func:`write_imperative_stems` to regenerate the stemmed table after
+changing ``data/imperatives.txt``.
 
 """
+
 import pkgutil
 import re
-from typing import Dict, Iterator, Set
-
-import snowballstemmer
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Dict, FrozenSet, Iterable, Iterator, Set
 
 #: Regular expression for stripping comments from the wordlists
 COMMENT_RE = re.compile(r'\s*#.*')
 
-#: Stemmer function for stemming words in English
-stem = snowballstemmer.stemmer('english').stemWord
+#: The package data file containing the stemmed imperative verbs
+IMPERATIVE_STEMS_FILE = 'imperative_stems.txt'
+
+_IMPERATIVE_STEMS_HEADER = (
+    "# Stemmed imperative verbs\n"
+    "#\n"
+    "# Generated from imperatives.txt by `lintel._wordlists.write_imperative_stems()`.\n"
+    "# Each line contains a stem followed by the imperative forms mapping to it.\n"
+    "# Do not edit this file manually.\n"
+)
+
+
+@lru_cache(maxsize=4096)
+def stem(word: str) -> str:
+    """Return the stem of an English word.
+
+    Docstrings tend to start with the same few words, so results are memoized.
+    """
+    return _get_stemmer()(word)
+
+
+@lru_cache(maxsize=None)
+def _get_stemmer() -> Callable[[str], str]:
+    import snowballstemmer
+
+    return snowballstemmer.stemmer('english').stemWord
 
 
 def load_wordlist(name: str) -> Iterator[str]:
@@ -35,7 +64,7 @@ def load_wordlist(name: str) -> Iterator[str]:
                 yield line
 
 
-def make_imperative_verbs_dict(wordlist: Iterator[str]) -> Dict[str, Set[str]]:
+def make_imperative_verbs_dict(wordlist: Iterable[str]) -> Dict[str, Set[str]]:
     """Create a dictionary mapping stemmed verbs to the imperative form."""
     imperative_verbs = {}  # type: Dict[str, Set[str]]
     for word in wordlist:
@@ -43,7 +72,37 @@ def make_imperative_verbs_dict(wordlist: Iterator[str]) -> Dict[str, Set[str]]:
     return imperative_verbs
 
 
-IMPERATIVE_VERBS = make_imperative_verbs_dict(load_wordlist('imperatives.txt'))
+@lru_cache(maxsize=None)
+def get_imperative_verbs() -> Dict[str, FrozenSet[str]]:
+    """Return a dictionary mapping stemmed verbs to their imperative forms."""
+    imperative_verbs: Dict[str, FrozenSet[str]] = {}
+
+    for line in load_wordlist(IMPERATIVE_STEMS_FILE):
+        stemmed, *forms = line.split()
+        imperative_verbs[stemmed] = frozenset(forms)
+
+    return imperative_verbs
+
+
+@lru_cache(maxsize=None)
+def get_imperative_blacklist() -> FrozenSet[str]:
+    """Return the words that are forbidden as the first word in a docstring."""
+    return frozenset(load_wordlist('imperatives_blacklist.txt'))
+
+
+def dump_imperative_verbs(imperative_verbs: Dict[str, Set[str]]) -> str:
+    """Serialize stemmed imperative verbs to the format of the package data file."""
+    lines = [
+        " ".join([stemmed, *sorted(forms)]) for stemmed, forms in sorted(imperative_verbs.items())
+    ]
+
+    return _IMPERATIVE_STEMS_HEADER + "\n".join(lines) + "\n"
+
 
-#: Words that are forbidden to appear as the first word in a docstring
-IMPERATIVE_BLACKLIST = set(load_wordlist('imperatives_blacklist.txt'))
+def write_imperative_stems() -> None:
+    """Regenerate the stemmed imperative verbs package data file."""
+    stems_path = Path(__file__).parent / 'data' / IMPERATIVE_STEMS_FILE
+    stems_path.write_text(
+        dump_imperative_verbs(make_imperative_verbs_dict(load_wordlist('imperatives.txt'))),
+        encoding='utf8',
+    )
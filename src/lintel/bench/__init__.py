@@ -0,0 +1,20 @@
+"""Benchmarks for lintel."""
+
+from ._checks import (
+    CheckResult,
+    ColumnarResult,
+    collect_nodes,
+    measure_check,
+    measure_checks,
+    measure_columnar,
+)
+from ._corpus import Corpus, CorpusSpec, Style, generate_corpus
+from ._pathological import (
+    MAX_SCALING_EXPONENT,
+    PATHOLOGICAL_CASES,
+    PathologicalResult,
+    measure_pathological,
+)
+from ._results import Measurement, check_budgets, load_baseline, save_results
+from ._startup import measure_startup, parse_import_time
+from ._throughput import ThroughputResult, measure_scaling, measure_throughput
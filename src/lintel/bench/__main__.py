@@ -0,0 +1,7 @@
+"""Run the lintel benchmarks."""
+
+
+if __name__ == '__main__':
+    from lintel.bench import cli
+
+    cli.app()
@@ -0,0 +1,237 @@
+"""Microbenchmarks for individual docstring checks.
+
+Every check returned by :func:`lintel.get_checks` is run in isolation over
+the same nodes, so newly added checks are covered automatically.
+"""
+
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple, Type
+
+from lintel import (
+    CHECKED_NODE_TYPES,
+    Configuration,
+    DocstringColumns,
+    DocstringError,
+    get_checks,
+    get_columnar_checks,
+    get_docstring_from_doc_node,
+)
+from lintel._check_source import _get_child_nodes_to_check, _parse_file
+
+from ._corpus import CorpusSpec, Style, generate_corpus
+
+NodeAndConfig = Tuple[CHECKED_NODE_TYPES, Configuration]
+
+
+@dataclass
+class CheckResult:
+    """The cost of a single check class."""
+
+    check: Type[DocstringError]
+    calls: int
+    ns_per_call: float
+    alloc_bytes_per_call: float
+    """The mean peak of memory allocated during a call."""
+    retained_blocks_per_call: float
+    """The mean number of memory blocks that are still allocated after a call."""
+    hits: int
+    """The number of calls that found at least one error."""
+
+    @property
+    def hit_rate(self) -> float:
+        """The fraction of calls that found at least one error."""
+        return self.hits / self.calls if self.calls else 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return a JSON serializable representation of the result."""
+        return {
+            "check": self.check.error_code(),
+            "calls": self.calls,
+            "ns_per_call": self.ns_per_call,
+            "alloc_bytes_per_call": self.alloc_bytes_per_call,
+            "retained_blocks_per_call": self.retained_blocks_per_call,
+            "hit_rate": self.hit_rate,
+        }
+
+
+@dataclass
+class ColumnarResult:
+    """The cost of the columnar checks compared to running them per node."""
+
+    n_docstrings: int
+    per_node_ns: float
+    """The mean time of running the columnar checks per node over all nodes."""
+    columnar_ns: float
+    """The mean time of extracting the columns of all docstrings and evaluating the checks."""
+    per_node_errors: int
+    columnar_errors: int
+
+    @property
+    def speedup(self) -> float:
+        """How many times faster the columnar evaluation is."""
+        return self.per_node_ns / self.columnar_ns if self.columnar_ns else 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return a JSON serializable representation of the result."""
+        return {
+            "n_docstrings": self.n_docstrings,
+            "per_node_ns": self.per_node_ns,
+            "columnar_ns": self.columnar_ns,
+            "speedup": self.speedup,
+            "per_node_errors": self.per_node_errors,
+            "columnar_errors": self.columnar_errors,
+        }
+
+
+def measure_checks(spec: CorpusSpec, repeat: int = 3) -> List[CheckResult]:
+    """Run every check over the nodes of a synthetic project in each style.
+
+    Args:
+        spec: The shape of the project. Its style is ignored since projects are generated for all
+            styles.
+        repeat: The number of timed passes over all nodes per check.
+    """
+    with tempfile.TemporaryDirectory() as tempdir:
+        nodes: List[NodeAndConfig] = []
+
+        for style in Style:
+            corpus = generate_corpus(Path(tempdir) / style.value, replace(spec, style=style))
+            config = Configuration(convention=style.convention)
+
+            for file in corpus.files:
+                nodes.extend((node, config) for node in collect_nodes(_parse_file(file, config)))
+
+        return [measure_check(check, nodes, repeat) for check in get_checks()]
+
+
+def measure_columnar(spec: CorpusSpec, repeat: int = 3) -> ColumnarResult:
+    """Compare the columnar checks with running them per node on a synthetic project.
+
+    The docstrings of all files in all styles are evaluated as one batch. Both paths build the
+    docstrings of the nodes, so the columnar time includes extracting the columns.
+
+    Args:
+        spec: The shape of the project. Its style is ignored since projects are generated for all
+            styles.
+        repeat: The number of timed passes over all nodes per path.
+    """
+    checks = get_columnar_checks()
+
+    with tempfile.TemporaryDirectory() as tempdir:
+        nodes: List[NodeAndConfig] = []
+
+        for style in Style:
+            corpus = generate_corpus(Path(tempdir) / style.value, replace(spec, style=style))
+            config = Configuration(convention=style.convention)
+
+            for file in corpus.files:
+                nodes.extend(
+                    (node, config)
+                    for node in collect_nodes(_parse_file(file, config))
+                    if node.doc_node is not None and node.doc_node.value
+                )
+
+        error_codes = {check.error_code() for check in checks}
+
+        def run_per_node() -> int:
+            return sum(len(check.check(node, config)) for node, config in nodes for check in checks)
+
+        def run_columnar() -> int:
+            columns = DocstringColumns()
+
+            for node, config in nodes:
+                columns.append(get_docstring_from_doc_node(node, config), error_codes)
+
+            return len(columns.evaluate(checks))
+
+        # Warm up caches and count the errors
+        per_node_errors = run_per_node()
+        columnar_errors = run_columnar()
+
+        per_node_ns = _time_ns(run_per_node, repeat)
+        columnar_ns = _time_ns(run_columnar, repeat)
+
+    return ColumnarResult(
+        n_docstrings=len(nodes),
+        per_node_ns=per_node_ns,
+        columnar_ns=columnar_ns,
+        per_node_errors=per_node_errors,
+        columnar_errors=columnar_errors,
+    )
+
+
+def collect_nodes(module: CHECKED_NODE_TYPES) -> List[CHECKED_NODE_TYPES]:
+    """Return all nodes that lintel checks in a module."""
+    collected: List[CHECKED_NODE_TYPES] = []
+    nodes = [module]
+
+    while nodes:
+        node = nodes.pop()
+        nodes.extend(_get_child_nodes_to_check(node))
+        collected.append(node)
+
+    return collected
+
+
+def measure_check(
+    check: Type[DocstringError], nodes: List[NodeAndConfig], repeat: int = 3
+) -> CheckResult:
+    """Measure the cost and hit rate of `check` over `nodes`."""
+    # Warm up caches, e.g., the imperative mood wordlists.
+    hits = sum(1 for node, config in nodes if check.check(node, config))
+
+    start = time.perf_counter_ns()
+
+    for _ in range(repeat):
+        for node, config in nodes:
+            check.check(node, config)
+
+    elapsed = time.perf_counter_ns() - start
+
+    alloc_bytes, retained_blocks = _measure_allocations(check, nodes)
+    calls = len(nodes)
+
+    return CheckResult(
+        check=check,
+        calls=calls,
+        ns_per_call=elapsed / (repeat * calls) if calls else 0.0,
+        alloc_bytes_per_call=alloc_bytes / calls if calls else 0.0,
+        retained_blocks_per_call=retained_blocks / calls if calls else 0.0,
+        hits=hits,
+    )
+
+
+def _measure_allocations(
+    check: Type[DocstringError], nodes: List[NodeAndConfig]
+) -> Tuple[int, int]:
+    results = []
+    alloc_bytes = 0
+
+    blocks_before = sys.getallocatedblocks()
+    tracemalloc.start()
+
+    try:
+        for node, config in nodes:
+            tracemalloc.clear_traces()
+            results.append(check.check(node, config))
+            alloc_bytes += tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    retained_blocks = max(sys.getallocatedblocks() - blocks_before, 0)
+
+    return alloc_bytes, retained_blocks
+
+
+def _time_ns(function: Callable[[], Any], repeat: int) -> float:
+    start = time.perf_counter_ns()
+
+    for _ in range(repeat):
+        function()
+
+    return (time.perf_counter_ns() - start) / repeat
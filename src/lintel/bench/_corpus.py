@@ -0,0 +1,221 @@
+"""Reproducible synthetic projects for benchmarking.
+
+The docstring styles follow the canonical Google, NumPy and PEP 257 examples in
+``tests/resources/canonical_*_examples.py``. Generated docstrings are valid for
+their convention, so a benchmark run measures the regular checking path
+rather than error reporting.
+"""
+
+import random
+from dataclasses import dataclass, field
+from enum import Enum
+from pathlib import Path
+from typing import List
+
+from lintel import Convention
+
+
+class Style(Enum):
+    """The docstring styles a corpus can be generated in."""
+
+    GOOGLE = "google"
+    NUMPY = "numpy"
+    PEP257 = "pep257"
+
+    @property
+    def convention(self) -> Convention:
+        """The convention to check a corpus of this style with."""
+        return {
+            Style.GOOGLE: Convention.GOOGLE,
+            Style.NUMPY: Convention.NUMPY,
+            Style.PEP257: Convention.DEFAULT,
+        }[self]
+
+
+@dataclass(frozen=True)
+class CorpusSpec:
+    """The shape of a synthetic project.
+
+    Args:
+        style: The docstring style to generate.
+        n_files: The number of modules in the project.
+        definitions_per_file: The number of classes, functions and methods per module.
+        docstring_length: The number of description lines in multi-line docstrings.
+        section_density: The fraction of functions whose docstrings document arguments and
+            return values in sections.
+        seed: The seed for the random number generator.
+    """
+
+    style: Style = Style.GOOGLE
+    n_files: int = 10
+    definitions_per_file: int = 20
+    docstring_length: int = 3
+    section_density: float = 0.5
+    seed: int = 0
+
+
+@dataclass
+class Corpus:
+    """A generated project."""
+
+    spec: CorpusSpec
+    files: List[Path] = field(default_factory=list)
+    n_definitions: int = 0
+
+
+VERBS = ("Return", "Compute", "Build", "Create", "Update", "Load", "Parse", "Convert", "Fetch")
+NOUNS = ("value", "table", "row", "index", "record", "buffer", "request", "node", "config")
+WORDS = (
+    "the",
+    "a",
+    "of",
+    "given",
+    "rows",
+    "keys",
+    "instance",
+    "represented",
+    "sequence",
+    "strings",
+    "optional",
+    "pertaining",
+    "mapping",
+    "corresponding",
+    "data",
+    "fetched",
+)
+
+#: The number of definitions in a class, including the class itself
+_CLASS_SIZE = 4
+
+
+def generate_corpus(directory: Path, spec: CorpusSpec) -> Corpus:
+    """Write a synthetic project to `directory`.
+
+    The same spec always produces the same project.
+    """
+    rng = random.Random(spec.seed)
+    corpus = Corpus(spec)
+
+    directory.mkdir(parents=True, exist_ok=True)
+
+    for i_file in range(spec.n_files):
+        path = directory / f"module_{i_file}.py"
+        path.write_text(_generate_module(rng, spec))
+
+        corpus.files.append(path)
+        corpus.n_definitions += spec.definitions_per_file
+
+    return corpus
+
+
+def _generate_module(rng: random.Random, spec: CorpusSpec) -> str:
+    parts = [_docstring(rng, spec, "", _summary(rng, "Provide helpers for"), [])]
+
+    i_definition = 0
+
+    while i_definition < spec.definitions_per_file:
+        if i_definition % _CLASS_SIZE == 0 and spec.definitions_per_file - i_definition > 1:
+            n_methods = min(_CLASS_SIZE - 1, spec.definitions_per_file - i_definition - 1)
+            parts.append(_generate_class(rng, spec, i_definition, n_methods))
+            i_definition += 1 + n_methods
+        else:
+            parts.append(_generate_function(rng, spec, f"function_{i_definition}", ""))
+            i_definition += 1
+
+    return "\n\n\n".join(parts) + "\n"
+
+
+def _generate_class(rng: random.Random, spec: CorpusSpec, i_definition: int, n_methods: int) -> str:
+    lines = [
+        f"class Class{i_definition}:",
+        _docstring(rng, spec, "    ", f"Hold the {rng.choice(NOUNS)} state.", []),
+    ]
+
+    for i_method in range(n_methods):
+        lines.append("")
+        lines.append(
+            _generate_function(rng, spec, f"method_{i_definition + 1 + i_method}", "    ", "self")
+        )
+
+    return "\n".join(lines)
+
+
+def _generate_function(
+    rng: random.Random, spec: CorpusSpec, name: str, indent: str, *bound: str
+) -> str:
+    has_sections = rng.random() < spec.section_density
+    arguments = [f"arg_{i}" for i in range(rng.randint(1, 3))] if has_sections else []
+
+    docstring = _docstring(
+        rng,
+        spec,
+        indent + "    ",
+        _summary(rng, rng.choice(VERBS)),
+        arguments,
+    )
+
+    return (
+        f"{indent}def {name}({', '.join([*bound, *arguments])}):\n"
+        f"{docstring}\n"
+        f"{indent}    return {arguments[0] if arguments else 'None'}"
+    )
+
+
+def _summary(rng: random.Random, verb: str) -> str:
+    return f"{verb} the {rng.choice(NOUNS)}."
+
+
+def _sentence(rng: random.Random) -> str:
+    words = [rng.choice(WORDS) for _ in range(rng.randint(6, 10))]
+    return " ".join(words).capitalize() + "."
+
+
+def _docstring(
+    rng: random.Random, spec: CorpusSpec, indent: str, summary: str, arguments: List[str]
+) -> str:
+    description = [_sentence(rng) for _ in range(spec.docstring_length)]
+    sections = _sections(rng, spec.style, arguments) if arguments else []
+
+    if not description and not sections:
+        return f'{indent}"""{summary}"""'
+
+    body = [summary, ""]
+
+    if description:
+        body.extend([*description, ""])
+
+    if sections:
+        body.extend(sections)
+
+    if spec.style != Style.GOOGLE and body[-1] != "":
+        body.append("")
+
+    lines = [f'{indent}"""{body[0]}']
+    lines.extend(f"{indent}{line}" if line else "" for line in body[1:])
+    lines.append(f'{indent}"""')
+
+    return "\n".join(lines)
+
+
+def _sections(rng: random.Random, style: Style, arguments: List[str]) -> List[str]:
+    if style == Style.GOOGLE:
+        return [
+            "Args:",
+            *(f"    {argument}: {_sentence(rng)}" for argument in arguments),
+            "",
+            "Returns:",
+            f"    {_sentence(rng)}",
+        ]
+
+    if style == Style.NUMPY:
+        lines = ["Parameters", "----------"]
+
+        for argument in arguments:
+            lines.extend([f"{argument} : int", f"    {_sentence(rng)}"])
+
+        return [*lines, "", "Returns", "-------", "int", f"    {_sentence(rng)}"]
+
+    return [
+        "Keyword arguments:",
+        *(f"{argument} -- {_sentence(rng).lower()}" for argument in arguments),
+    ]
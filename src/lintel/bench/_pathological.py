@@ -0,0 +1,134 @@
+"""Pathological docstrings that make naive parsing take superlinear time.
+
+Each case grows one feature of a docstring, e.g., the length of a line or the number of lines
+that look like section names. Checking a case must take time that is linear in its size.
+"""
+
+import math
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+from lintel import Configuration, Convention, check_source
+
+#: The largest acceptable exponent of the growth in time over the growth in size
+MAX_SCALING_EXPONENT = 1.5
+
+
+def _function(docstring_body: str) -> str:
+    return f'def function(x):\n    """Do something.\n\n{docstring_body}\n    """\n'
+
+
+#: The convention to check each case with and a function that generates a module of a size
+PATHOLOGICAL_CASES: Dict[str, Tuple[Convention, Callable[[int], str]]] = {
+    "long_line": (
+        Convention.ALL,
+        lambda size: _function("    " + "word " * size),
+    ),
+    "minified_table": (
+        Convention.ALL,
+        lambda size: _function("    " + "| (a) | b: c |" * size),
+    ),
+    "argument_whitespace": (
+        Convention.GOOGLE,
+        lambda size: _function("    Args:\n        x" + " " * size + "y"),
+    ),
+    "argument_brackets": (
+        Convention.GOOGLE,
+        lambda size: _function("    Args:\n        x (" + ") " * size),
+    ),
+    "argument_continuation": (
+        Convention.GOOGLE,
+        lambda size: _function(
+            "    Args:\n        x: Description.\n" + "            more\n" * size
+        ),
+    ),
+    "google_section_names": (
+        Convention.GOOGLE,
+        lambda size: _function("    Returns\n" * size),
+    ),
+    "numpy_section_names": (
+        Convention.NUMPY,
+        lambda size: _function("    Parameters\n" * size),
+    ),
+    "numpy_parameters": (
+        Convention.NUMPY,
+        lambda size: _function(
+            "    Parameters\n    ----------\n" + "    x : int\n        Description.\n" * size
+        ),
+    ),
+}
+
+
+@dataclass
+class PathologicalResult:
+    """The time to check a pathological case in different sizes."""
+
+    case: str
+    sizes: List[int]
+    seconds: List[float]
+    """The fastest time to check the case per size."""
+
+    @property
+    def scaling_exponent(self) -> float:
+        """The exponent of the growth in time over the growth in size.
+
+        It is measured from the smallest to the largest size and is about 1 for linear and about 2
+        for quadratic time. Constant overhead makes it smaller for small sizes.
+        """
+        if len(self.sizes) < 2 or self.seconds[0] <= 0 or self.seconds[-1] <= 0:
+            return 0.0
+
+        return math.log(self.seconds[-1] / self.seconds[0]) / math.log(
+            self.sizes[-1] / self.sizes[0]
+        )
+
+    @property
+    def is_linear(self) -> bool:
+        """Whether the time grows at most about linearly with the size."""
+        return self.scaling_exponent <= MAX_SCALING_EXPONENT
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return a JSON serializable representation of the result."""
+        return {
+            "case": self.case,
+            "sizes": self.sizes,
+            "seconds": self.seconds,
+            "scaling_exponent": self.scaling_exponent,
+        }
+
+
+def measure_pathological(
+    sizes: Sequence[int] = (1000, 8000), repeat: int = 3
+) -> List[PathologicalResult]:
+    """Measure how the time to check each pathological case grows with its size.
+
+    Args:
+        sizes: The sizes to generate every case in, in increasing order.
+        repeat: The number of times to check every file. The fastest time is kept.
+    """
+    results = []
+
+    with tempfile.TemporaryDirectory() as tempdir:
+        for case, (convention, generate) in PATHOLOGICAL_CASES.items():
+            config = Configuration(convention=convention)
+            seconds = []
+
+            for size in sizes:
+                file = Path(tempdir) / f"{case}_{size}.py"
+                file.write_text(generate(size))
+
+                seconds.append(min(_time_check(file, config) for _ in range(repeat)))
+
+            results.append(PathologicalResult(case, list(sizes), seconds))
+
+    return results
+
+
+def _time_check(file: Path, config: Configuration) -> float:
+    start = time.perf_counter()
+    check_source(file, config)
+
+    return time.perf_counter() - start
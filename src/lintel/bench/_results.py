@@ -0,0 +1,76 @@
+"""Benchmark measurements and budget comparison."""
+
+import json
+import statistics
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Mapping
+
+
+@dataclass
+class Measurement:
+    """The timing samples of a single benchmark phase in seconds."""
+
+    name: str
+    samples: List[float] = field(default_factory=list)
+
+    @property
+    def min(self) -> float:
+        """The fastest sample."""
+        return min(self.samples)
+
+    @property
+    def median(self) -> float:
+        """The median sample."""
+        return statistics.median(self.samples)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return a JSON serializable representation of the measurement."""
+        return {
+            "min": self.min,
+            "median": self.median,
+            "samples": self.samples,
+        }
+
+
+def save_results(measurements: Mapping[str, Measurement], path: Path) -> None:
+    """Write measurements to a JSON file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        json.dumps(
+            {name: measurement.as_dict() for name, measurement in measurements.items()},
+            indent=2,
+        )
+        + "\n"
+    )
+
+
+def load_baseline(path: Path) -> Dict[str, Dict[str, float]]:
+    """Load a baseline file.
+
+    A baseline maps phase names to the reference timing (``baseline``) and the maximum allowed
+    median timing (``budget``) in seconds.
+    """
+    return json.loads(path.read_text())
+
+
+def check_budgets(
+    measurements: Mapping[str, Measurement],
+    baseline: Mapping[str, Mapping[str, float]],
+) -> List[str]:
+    """Return a message for every measured phase whose median exceeds its budget."""
+    violations: List[str] = []
+
+    for name, measurement in measurements.items():
+        if name not in baseline:
+            continue
+
+        budget = baseline[name]["budget"]
+
+        if measurement.median > budget:
+            violations.append(
+                f"Phase '{name}' took {measurement.median:.4f}s which exceeds its budget of "
+                f"{budget:.4f}s (baseline {baseline[name]['baseline']:.4f}s)."
+            )
+
+    return violations
@@ -0,0 +1,138 @@
+"""Startup and import time benchmarks.
+
+Every phase is measured in a fresh interpreter, so caches like the one of
+:func:`lintel.get_checks` never carry over from one sample to the next.
+"""
+
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, Mapping, Optional, Tuple
+
+from ._results import Measurement
+
+#: Matches a line of ``python -X importtime`` output
+IMPORT_TIME_RE = re.compile(r"^import time:\s*(\d+)\s*\|\s*(\d+)\s*\|(\s*)(\S+)\s*$")
+
+SMALL_FILE = '''"""A small module."""
+
+
+def add(a, b):
+    """Add two numbers."""
+    return a + b
+
+
+class Calculator:
+    """A calculator."""
+
+    def multiply(self, a, b):
+        """Multiply two numbers."""
+        return a * b
+'''
+
+_GET_CHECKS_SNIPPET = """
+import time
+import lintel
+
+start = time.perf_counter()
+lintel.get_checks()
+print(time.perf_counter() - start)
+"""
+
+_WORDLISTS_SNIPPET = """
+import time
+import lintel
+
+start = time.perf_counter()
+lintel.get_imperative_verbs()
+lintel.get_imperative_blacklist()
+lintel.stem("returns")
+print(time.perf_counter() - start)
+"""
+
+
+def measure_startup(repeat: int = 5) -> Dict[str, Measurement]:
+    """Measure the startup phases of lintel.
+
+    Args:
+        repeat: The number of samples to take per phase.
+    """
+    phases = ("import", "help_cold", "help_warm", "small_file", "get_checks", "wordlists")
+    measurements = {name: Measurement(name) for name in phases}
+
+    with tempfile.TemporaryDirectory() as tempdir:
+        small_file = Path(tempdir) / "small.py"
+        small_file.write_text(SMALL_FILE)
+
+        # Populate the bytecode cache for the warm runs
+        _time_python("-m", "lintel", "--help")
+
+        for _ in range(repeat):
+            measurements["import"].samples.append(_measure_import_time())
+
+            with tempfile.TemporaryDirectory() as pycache_prefix:
+                measurements["help_cold"].samples.append(
+                    _time_python(
+                        "-m", "lintel", "--help", env={"PYTHONPYCACHEPREFIX": pycache_prefix}
+                    )
+                )
+
+            measurements["help_warm"].samples.append(_time_python("-m", "lintel", "--help"))
+            measurements["small_file"].samples.append(
+                _time_python("-m", "lintel", str(small_file), cwd=tempdir)
+            )
+            measurements["get_checks"].samples.append(
+                float(_run_python("-c", _GET_CHECKS_SNIPPET).stdout)
+            )
+            measurements["wordlists"].samples.append(
+                float(_run_python("-c", _WORDLISTS_SNIPPET).stdout)
+            )
+
+    return measurements
+
+
+def parse_import_time(output: str, module: str = "lintel") -> float:
+    """Return the cumulative import time of `module` in seconds from ``-X importtime`` output."""
+    for line in output.splitlines():
+        match = IMPORT_TIME_RE.match(line)
+
+        if match and match.group(4) == module:
+            return int(match.group(2)) / 1e6
+
+    raise ValueError(f"No import time found for module '{module}'.")
+
+
+def _measure_import_time() -> float:
+    return parse_import_time(_run_python("-X", "importtime", "-m", "lintel", "--help").stderr)
+
+
+def _time_python(
+    *args: str, env: Optional[Mapping[str, str]] = None, cwd: Optional[str] = None
+) -> float:
+    start = time.perf_counter()
+    _run_python(*args, env=env, cwd=cwd, allowed_return_codes=(0, 1))
+    return time.perf_counter() - start
+
+
+def _run_python(
+    *args: str,
+    env: Optional[Mapping[str, str]] = None,
+    cwd: Optional[str] = None,
+    allowed_return_codes: Tuple[int, ...] = (0,),
+) -> "subprocess.CompletedProcess[str]":
+    result = subprocess.run(
+        [sys.executable, *args],
+        capture_output=True,
+        text=True,
+        env={**os.environ, **(env or {})},
+        cwd=cwd,
+    )
+
+    if result.returncode not in allowed_return_codes:
+        raise RuntimeError(f"Running {args} failed:\n{result.stderr}")
+
+    return result
@@ -0,0 +1,110 @@
+"""End-to-end throughput benchmarks on synthetic projects."""
+
+import multiprocessing
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from lintel import Configuration, check_source
+
+from ._corpus import CorpusSpec, Style, generate_corpus
+
+
+@dataclass
+class ThroughputResult:
+    """The result of checking a synthetic project."""
+
+    spec: CorpusSpec
+    n_files: int
+    n_definitions: int
+    seconds: float
+    peak_rss: Optional[int]
+    """The peak resident set size of the checking process in bytes if available."""
+
+    @property
+    def files_per_second(self) -> float:
+        """The number of checked files per second."""
+        return self.n_files / self.seconds
+
+    @property
+    def definitions_per_second(self) -> float:
+        """The number of checked definitions per second."""
+        return self.n_definitions / self.seconds
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return a JSON serializable representation of the result."""
+        return {
+            "style": self.spec.style.value,
+            "n_files": self.n_files,
+            "definitions_per_file": self.spec.definitions_per_file,
+            "docstring_length": self.spec.docstring_length,
+            "section_density": self.spec.section_density,
+            "seed": self.spec.seed,
+            "n_definitions": self.n_definitions,
+            "seconds": self.seconds,
+            "files_per_second": self.files_per_second,
+            "definitions_per_second": self.definitions_per_second,
+            "peak_rss": self.peak_rss,
+        }
+
+
+def measure_throughput(spec: CorpusSpec) -> ThroughputResult:
+    """Generate a project for `spec` and check it in a fresh process.
+
+    Using a fresh process per measurement keeps the peak memory usage of
+    different measurements independent.
+    """
+    with ProcessPoolExecutor(
+        max_workers=1, mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        return executor.submit(_check_corpus, spec).result()
+
+
+def measure_scaling(
+    base_spec: CorpusSpec, styles: Iterable[Style], file_counts: Iterable[int]
+) -> List[ThroughputResult]:
+    """Measure the throughput for every combination of style and number of files."""
+    return [
+        measure_throughput(replace(base_spec, style=style, n_files=n_files))
+        for style in styles
+        for n_files in file_counts
+    ]
+
+
+def _check_corpus(spec: CorpusSpec) -> ThroughputResult:
+    config = Configuration(convention=spec.style.convention)
+
+    with tempfile.TemporaryDirectory() as tempdir:
+        corpus = generate_corpus(Path(tempdir), spec)
+
+        start = time.perf_counter()
+
+        for file in corpus.files:
+            check_source(file, config)
+
+        seconds = time.perf_counter() - start
+
+    return ThroughputResult(
+        spec=spec,
+        n_files=len(corpus.files),
+        n_definitions=corpus.n_definitions,
+        seconds=seconds,
+        peak_rss=_get_peak_rss(),
+    )
+
+
+def _get_peak_rss() -> Optional[int]:
+    try:
+        import resource
+    except ImportError:  # pragma: no cover
+        # Not available on Windows
+        return None
+
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    # Linux reports kilobytes while macOS reports bytes
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
@@ -0,0 +1,396 @@
+"""Command line interface for the lintel benchmarks."""
+import json
+from pathlib import Path
+from typing import List, Mapping, Optional
+
+from rich import print
+from rich.table import Table
+from typer import Argument, Exit, Option, Typer
+from typing_extensions import Annotated
+
+from lintel.bench import (
+    MAX_SCALING_EXPONENT,
+    CheckResult,
+    ColumnarResult,
+    CorpusSpec,
+    Measurement,
+    PathologicalResult,
+    Style,
+    ThroughputResult,
+    check_budgets,
+    generate_corpus,
+    load_baseline,
+    measure_checks,
+    measure_columnar,
+    measure_pathological,
+    measure_scaling,
+    measure_startup,
+    save_results,
+)
+
+app = Typer(help="Benchmarks for lintel.")
+
+
+@app.callback()
+def main() -> None:
+    """Benchmark lintel."""
+
+
+@app.command()
+def startup(
+    repeat: Annotated[
+        int,
+        Option(help="The number of samples to take per phase."),
+    ] = 5,
+    output: Annotated[
+        Optional[Path],
+        Option(help="A JSON file to write the results to.", show_default=False),
+    ] = None,
+    baseline: Annotated[
+        Optional[Path],
+        Option(
+            help="A JSON file with baseline timings and budgets per phase. "
+            "Exits with a non-zero code if a phase exceeds its budget.",
+            show_default=False,
+        ),
+    ] = None,
+) -> None:
+    """Measure import time, CLI startup and initialization of checks and wordlists."""
+    measurements = measure_startup(repeat)
+
+    if output:
+        save_results(measurements, output)
+
+    _report(measurements, baseline)
+
+
+@app.command()
+def corpus(
+    directory: Annotated[
+        Path,
+        Argument(help="The directory to write the project to."),
+    ],
+    style: Annotated[
+        Style,
+        Option(help="The docstring style to generate."),
+    ] = Style.GOOGLE,
+    files: Annotated[
+        int,
+        Option(help="The number of modules to generate."),
+    ] = CorpusSpec.n_files,
+    definitions: Annotated[
+        int,
+        Option(help="The number of classes, functions and methods per module."),
+    ] = CorpusSpec.definitions_per_file,
+    docstring_length: Annotated[
+        int,
+        Option(help="The number of description lines in multi-line docstrings."),
+    ] = CorpusSpec.docstring_length,
+    section_density: Annotated[
+        float,
+        Option(help="The fraction of functions that document their arguments in sections."),
+    ] = CorpusSpec.section_density,
+    seed: Annotated[
+        int,
+        Option(help="The seed for the random number generator."),
+    ] = CorpusSpec.seed,
+) -> None:
+    """Generate a reproducible synthetic project."""
+    generated = generate_corpus(
+        directory,
+        CorpusSpec(style, files, definitions, docstring_length, section_density, seed),
+    )
+
+    print(
+        f"Generated {len(generated.files)} files with {generated.n_definitions} definitions "
+        f"in '{directory}'."
+    )
+
+
+@app.command()
+def throughput(
+    style: Annotated[
+        Optional[List[Style]],
+        Option(help="The docstring styles to benchmark. Defaults to all styles."),
+    ] = None,
+    files: Annotated[
+        Optional[List[int]],
+        Option(help="The project sizes in number of files. Defaults to 10, 20 and 40 files."),
+    ] = None,
+    definitions: Annotated[
+        int,
+        Option(help="The number of classes, functions and methods per module."),
+    ] = CorpusSpec.definitions_per_file,
+    docstring_length: Annotated[
+        int,
+        Option(help="The number of description lines in multi-line docstrings."),
+    ] = CorpusSpec.docstring_length,
+    section_density: Annotated[
+        float,
+        Option(help="The fraction of functions that document their arguments in sections."),
+    ] = CorpusSpec.section_density,
+    seed: Annotated[
+        int,
+        Option(help="The seed for the random number generator."),
+    ] = CorpusSpec.seed,
+    output: Annotated[
+        Optional[Path],
+        Option(help="A JSON file to write the results to.", show_default=False),
+    ] = None,
+) -> None:
+    """Measure end-to-end throughput and its scaling on synthetic projects."""
+    results = measure_scaling(
+        CorpusSpec(
+            definitions_per_file=definitions,
+            docstring_length=docstring_length,
+            section_density=section_density,
+            seed=seed,
+        ),
+        style or list(Style),
+        files or [10, 20, 40],
+    )
+
+    if output:
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(json.dumps([result.as_dict() for result in results], indent=2) + "\n")
+
+    _report_throughput(results)
+
+
+@app.command()
+def checks(
+    files: Annotated[
+        int,
+        Option(help="The number of modules to generate per style."),
+    ] = 3,
+    definitions: Annotated[
+        int,
+        Option(help="The number of classes, functions and methods per module."),
+    ] = CorpusSpec.definitions_per_file,
+    docstring_length: Annotated[
+        int,
+        Option(help="The number of description lines in multi-line docstrings."),
+    ] = CorpusSpec.docstring_length,
+    section_density: Annotated[
+        float,
+        Option(help="The fraction of functions that document their arguments in sections."),
+    ] = CorpusSpec.section_density,
+    seed: Annotated[
+        int,
+        Option(help="The seed for the random number generator."),
+    ] = CorpusSpec.seed,
+    repeat: Annotated[
+        int,
+        Option(help="The number of timed passes over all nodes per check."),
+    ] = 3,
+    output: Annotated[
+        Optional[Path],
+        Option(help="A JSON file to write the results to.", show_default=False),
+    ] = None,
+) -> None:
+    """Measure the cost and hit rate of every check in isolation."""
+    results = measure_checks(
+        CorpusSpec(
+            n_files=files,
+            definitions_per_file=definitions,
+            docstring_length=docstring_length,
+            section_density=section_density,
+            seed=seed,
+        ),
+        repeat,
+    )
+    results.sort(key=lambda result: result.ns_per_call, reverse=True)
+
+    if output:
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(json.dumps([result.as_dict() for result in results], indent=2) + "\n")
+
+    _report_checks(results)
+
+
+@app.command()
+def columnar(
+    files: Annotated[
+        int,
+        Option(help="The number of modules to generate per style."),
+    ] = 3,
+    definitions: Annotated[
+        int,
+        Option(help="The number of classes, functions and methods per module."),
+    ] = CorpusSpec.definitions_per_file,
+    docstring_length: Annotated[
+        int,
+        Option(help="The number of description lines in multi-line docstrings."),
+    ] = CorpusSpec.docstring_length,
+    section_density: Annotated[
+        float,
+        Option(help="The fraction of functions that document their arguments in sections."),
+    ] = CorpusSpec.section_density,
+    seed: Annotated[
+        int,
+        Option(help="The seed for the random number generator."),
+    ] = CorpusSpec.seed,
+    repeat: Annotated[
+        int,
+        Option(help="The number of timed passes over all docstrings per path."),
+    ] = 3,
+    output: Annotated[
+        Optional[Path],
+        Option(help="A JSON file to write the results to.", show_default=False),
+    ] = None,
+) -> None:
+    """Compare the columnar checks with running them per definition."""
+    result = measure_columnar(
+        CorpusSpec(
+            n_files=files,
+            definitions_per_file=definitions,
+            docstring_length=docstring_length,
+            section_density=section_density,
+            seed=seed,
+        ),
+        repeat,
+    )
+
+    if output:
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(json.dumps(result.as_dict(), indent=2) + "\n")
+
+    _report_columnar(result)
+
+
+@app.command()
+def pathological(
+    sizes: Annotated[
+        Optional[List[int]],
+        Option(help="The sizes to generate every case in. Defaults to 1000 and 8000."),
+    ] = None,
+    repeat: Annotated[
+        int,
+        Option(help="The number of times to check every file. The fastest time is kept."),
+    ] = 3,
+    output: Annotated[
+        Optional[Path],
+        Option(help="A JSON file to write the results to.", show_default=False),
+    ] = None,
+) -> None:
+    """Check that pathological docstrings take time that is linear in their size.
+
+    Exits with a non-zero code if the time of a case grows faster than linearly.
+    """
+    results = measure_pathological(sorted(sizes) if sizes else (1000, 8000), repeat)
+
+    if output:
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(json.dumps([result.as_dict() for result in results], indent=2) + "\n")
+
+    _report_pathological(results)
+
+
+def _report(measurements: Mapping[str, Measurement], baseline_path: Optional[Path]) -> None:
+    baseline = load_baseline(baseline_path) if baseline_path else {}
+
+    table = Table("Phase", "Min (s)", "Median (s)", "Baseline (s)", "Budget (s)")
+
+    for name, measurement in measurements.items():
+        table.add_row(
+            name,
+            f"{measurement.min:.4f}",
+            f"{measurement.median:.4f}",
+            f"{baseline[name]['baseline']:.4f}" if name in baseline else "-",
+            f"{baseline[name]['budget']:.4f}" if name in baseline else "-",
+        )
+
+    print(table)
+
+    violations = check_budgets(measurements, baseline)
+
+    for violation in violations:
+        print(f"💥 {violation}")
+
+    if violations:
+        raise Exit(1)
+
+
+def _report_throughput(results: List[ThroughputResult]) -> None:
+    table = Table(
+        "Style",
+        "Files",
+        "Definitions",
+        "Time (s)",
+        "Files/s",
+        "Definitions/s",
+        "Time/file (ms)",
+        "Peak RSS (MB)",
+    )
+
+    for result in results:
+        table.add_row(
+            result.spec.style.value,
+            str(result.n_files),
+            str(result.n_definitions),
+            f"{result.seconds:.3f}",
+            f"{result.files_per_second:.1f}",
+            f"{result.definitions_per_second:.1f}",
+            f"{1000 * result.seconds / result.n_files:.2f}",
+            f"{result.peak_rss / 2**20:.1f}" if result.peak_rss is not None else "-",
+        )
+
+    print(table)
+
+
+def _report_checks(results: List[CheckResult]) -> None:
+    table = Table(
+        "Check", "Calls", "ns/call", "Alloc bytes/call", "Retained blocks/call", "Hit rate"
+    )
+
+    for result in results:
+        table.add_row(
+            result.check.error_code(),
+            str(result.calls),
+            f"{result.ns_per_call:.0f}",
+            f"{result.alloc_bytes_per_call:.0f}",
+            f"{result.retained_blocks_per_call:.2f}",
+            f"{result.hit_rate:.1%}",
+        )
+
+    print(table)
+
+
+def _report_columnar(result: ColumnarResult) -> None:
+    table = Table("Path", "Docstrings", "Time (ms)", "ns/docstring", "Errors")
+
+    for path, ns, n_errors in (
+        ("per node", result.per_node_ns, result.per_node_errors),
+        ("columnar", result.columnar_ns, result.columnar_errors),
+    ):
+        table.add_row(
+            path,
+            str(result.n_docstrings),
+            f"{ns / 1e6:.2f}",
+            f"{ns / result.n_docstrings:.0f}" if result.n_docstrings else "-",
+            str(n_errors),
+        )
+
+    print(table)
+    print(f"Speedup: {result.speedup:.2f}x")
+
+
+def _report_pathological(results: List[PathologicalResult]) -> None:
+    table = Table("Case", *(f"Size {size} (s)" for size in results[0].sizes), "Exponent")
+
+    for result in results:
+        table.add_row(
+            result.case,
+            *(f"{seconds:.4f}" for seconds in result.seconds),
+            f"{result.scaling_exponent:.2f}",
+        )
+
+    print(table)
+
+    superlinear = [result.case for result in results if not result.is_linear]
+
+    for case in superlinear:
+        print(f"💥 {case} scales with an exponent above {MAX_SCALING_EXPONENT}")
+
+    if superlinear:
+        raise Exit(1)
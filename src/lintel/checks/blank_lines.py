@@ -1,8 +1,7 @@
 """Contains a blank line checks."""
 
-import linecache
 from itertools import takewhile
-from typing import List, Optional, Tuple, Union
+from typing import Optional, Tuple, Union
 
 import astroid
 
@@ -11,7 +10,8 @@ from lintel import (
     Configuration,
     Docstring,
     DocstringError,
-    has_content,
+    get_blank_lines,
+    get_source_lines,
     is_blank,
 )
 
@@ -43,12 +43,14 @@ class D202(DocstringError):
     def check_implementation(
         cls, function_: astroid.FunctionDef, docstring: Docstring, config: Configuration
     ) -> Optional["D202"]:
-        lines_after, _, n_blanks_after = _get_stuff_after_docstring(function_)
+        n_lines_after, n_blanks_after = _get_stuff_after_docstring(function_)
 
         if (
             n_blanks_after != 0
-            and not _is_empty_definition(lines_after, n_blanks_after)
-            and not _blank_line_followed_by_inner_function_or_class(lines_after, n_blanks_after)
+            and not _is_empty_definition(n_lines_after, n_blanks_after)
+            and not _blank_line_followed_by_inner_function_or_class(
+                function_, n_lines_after, n_blanks_after
+            )
         ):
             error = cls(function_)
             error.parameters = [n_blanks_after]
@@ -85,9 +87,9 @@ class D204(DocstringError):
     def check_implementation(
         cls, class_: astroid.ClassDef, docstring: Docstring, config: Configuration
     ) -> Optional["D204"]:
-        lines_after, _, n_blanks_after = _get_stuff_after_docstring(class_)
+        n_lines_after, n_blanks_after = _get_stuff_after_docstring(class_)
 
-        if n_blanks_after != 1 and not _is_empty_definition(lines_after, n_blanks_after):
+        if n_blanks_after != 1 and not _is_empty_definition(n_lines_after, n_blanks_after):
             error = cls(class_)
             error.parameters = [n_blanks_after]
 
@@ -143,41 +145,38 @@ class D211(DocstringError):
 
 
 def _get_n_blanks_before_docstring(node: Union[astroid.FunctionDef, astroid.ClassDef]) -> int:
-    n_blanks = 0
-    line = node.doc_node.fromlineno - 1
-
-    while line > 0:
-        if has_content(linecache.getline(node.root().file, line)):
-            break
-
-        n_blanks += 1
-        line -= 1
-
-    return n_blanks
+    return get_blank_lines(node.root()).n_blanks_before(node.doc_node.fromlineno)
 
 
 def _get_stuff_after_docstring(
     node: Union[astroid.ClassDef, astroid.FunctionDef]
-) -> Tuple[List[str], List[str], int]:
-    lines_after = [
-        linecache.getline(node.root().file, l)
-        for l in range(node.doc_node.end_lineno + 1, node.end_lineno + 2)
-    ]
-    blanks_after = list(takewhile(is_blank, lines_after))
-    n_blanks_after = len(blanks_after)
+) -> Tuple[int, int]:
+    """Return the number of lines and blank lines after the docstring.
+
+    The line after the node is included, so empty definitions are followed by a blank line.
+    """
+    n_lines_after = node.end_lineno + 1 - node.doc_node.end_lineno
+    n_blanks_after = get_blank_lines(node.root()).n_blanks_after(
+        node.doc_node.end_lineno, node.end_lineno + 1
+    )
 
-    return lines_after, blanks_after, n_blanks_after
+    return n_lines_after, n_blanks_after
 
 
-def _is_empty_definition(lines_after: List[str], n_blanks_after: int) -> bool:
-    return n_blanks_after == 1 and len(lines_after) == 1
+def _is_empty_definition(n_lines_after: int, n_blanks_after: int) -> bool:
+    return n_blanks_after == 1 and n_lines_after == 1
 
 
 def _blank_line_followed_by_inner_function_or_class(
-    lines_after: List[str], n_blanks_after: int
+    node: Union[astroid.ClassDef, astroid.FunctionDef], n_lines_after: int, n_blanks_after: int
 ) -> bool:
-    return (
-        n_blanks_after == 1
-        and len(lines_after) > 1
-        and lines_after[1].lstrip().startswith(("class", "def", "async def", "@"))
+    if n_blanks_after != 1 or n_lines_after <= 1:
+        return False
+
+    lines = get_source_lines(node.root())
+    # The line after the blank line, as an index into the 0-based lines
+    i_line = node.doc_node.end_lineno + 1
+
+    return i_line < len(lines) and lines[i_line].lstrip().startswith(
+        ("class", "def", "async def", "@")
     )
@@ -13,7 +13,7 @@ class D403(DocstringError):
     def check_implementation(
         cls, node: CHECKED_NODE_TYPES, docstring: Docstring, config: Configuration
     ) -> Optional["D403"]:
-        first_word: str = docstring.content.split()[0]
+        first_word = docstring.summary.first_word
 
         if first_word in (first_word.upper(), first_word.capitalize()):
             return None
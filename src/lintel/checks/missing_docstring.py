@@ -22,6 +22,7 @@ class D100(DocstringError):
     explanation = "Public modules should have docstrings."
     applicable_nodes = astroid.Module
     applicable_if_doc_string_is_missing = True
+    only_public = True
     terminal = True
 
     @classmethod
@@ -42,6 +43,7 @@ class D101(DocstringError):
     explanation = "Public classes should have docstrings."
     applicable_nodes = astroid.ClassDef
     applicable_if_doc_string_is_missing = True
+    only_public = True
     terminal = True
 
     @classmethod
@@ -62,6 +64,7 @@ class D102(DocstringError):
     explanation = "Public methods should have docstrings."
     applicable_nodes = astroid.FunctionDef
     applicable_if_doc_string_is_missing = True
+    only_public = True
     terminal = True
 
     @classmethod
@@ -88,6 +91,7 @@ class D103(DocstringError):
     explanation = "Public functions should have docstrings."
     applicable_nodes = astroid.FunctionDef
     applicable_if_doc_string_is_missing = True
+    only_public = True
     terminal = True
 
     @classmethod
@@ -114,6 +118,7 @@ class D104(DocstringError):
     explanation = "Public packages should have docstrings."
     applicable_nodes = astroid.Module
     applicable_if_doc_string_is_missing = True
+    only_public = True
     terminal = True
 
     @classmethod
@@ -134,6 +139,7 @@ class D105(DocstringError):
     explanation = "Magic methods should have docstrings."
     applicable_nodes = astroid.FunctionDef
     applicable_if_doc_string_is_missing = True
+    only_public = True
     terminal = True
 
     @classmethod
@@ -161,6 +167,7 @@ class D106(DocstringError):
     explanation = "Public nested classes should have docstrings."
     applicable_nodes = astroid.ClassDef
     applicable_if_doc_string_is_missing = True
+    only_public = True
     terminal = True
 
     @classmethod
@@ -181,6 +188,7 @@ class D107(DocstringError):
     explanation = "__init__ methods should have docstrings."
     applicable_nodes = astroid.FunctionDef
     applicable_if_doc_string_is_missing = True
+    only_public = True
     terminal = True
 
     @classmethod
@@ -1,21 +1,19 @@
 """Contains a check for the mood of a docstring."""
 
 
-from typing import Optional
+from typing import FrozenSet, Optional
 
 import astroid
 from astroid import FunctionDef
 
 from lintel import (
-    IMPERATIVE_BLACKLIST,
-    IMPERATIVE_VERBS,
     Configuration,
     Docstring,
     DocstringError,
     common_prefix_length,
     get_decorator_names,
-    stem,
-    strip_non_alphanumeric,
+    get_imperative_blacklist,
+    get_imperative_verbs,
 )
 
 
@@ -26,6 +24,27 @@ class D401(DocstringError):
                      e.g. don't write "Returns the pathname ..."."""
     applicable_nodes = astroid.FunctionDef
 
+    first_word = ""
+    """The first word of the docstring."""
+    correct_forms: FrozenSet[str] = frozenset()
+    """The imperative forms of the first word."""
+
+    @property
+    def formatted_description(self) -> str:
+        """Return the description with a suggestion for the imperative form.
+
+        The suggestion is only computed when the description is needed.
+        """
+        if self.parameters is None and self.correct_forms:
+            check_word = self.first_word.lower()
+            best = max(
+                sorted(self.correct_forms),
+                key=lambda f: common_prefix_length(check_word, f),
+            )
+            self.parameters = [f" (perhaps '{best.capitalize()}', not '{self.first_word}')"]
+
+        return super().formatted_description
+
     @classmethod
     def check_implementation(
         cls, function_: astroid.FunctionDef, docstring: Docstring, config: Configuration
@@ -33,32 +52,28 @@ class D401(DocstringError):
         if _is_test(function_) or _is_property(function_, config):
             return None
 
-        stripped = docstring.content.strip()
+        summary = docstring.summary
 
-        if not stripped:
+        if not summary.line:
             return None
 
-        first_word = strip_non_alphanumeric(stripped.split()[0])
+        first_word = summary.stripped_first_word
         check_word = first_word.lower()
 
-        if check_word in IMPERATIVE_BLACKLIST:
+        if check_word in get_imperative_blacklist():
             error = cls(function_)
             error.parameters = [f" (found '{first_word}')"]
 
             return error
 
-        correct_forms = IMPERATIVE_VERBS.get(stem(check_word))
+        correct_forms = get_imperative_verbs().get(summary.stemmed_first_word)
 
         if not correct_forms or check_word in correct_forms:
             return None
 
-        best = max(
-            correct_forms,
-            key=lambda f: common_prefix_length(check_word, f),
-        )
-
         error = cls(function_)
-        error.parameters = [f" (perhaps '{best.capitalize()}', not '{first_word}')"]
+        error.first_word = first_word
+        error.correct_forms = correct_forms
 
         return error
 
@@ -14,10 +14,8 @@ class D209(DocstringError):
     def check_implementation(
         cls, node: CHECKED_NODE_TYPES, docstring: Docstring, config: Configuration
     ) -> Optional["D209"]:
-        if len(docstring.lines) > 1 and docstring.raw.splitlines()[-1].strip() not in (
-            '"""',
-            "'''",
-        ):
+        # The closing quotes are on a separate line if only indentation precedes them
+        if len(docstring.lines) > 1 and has_content(docstring.content.split("\n")[-1]):
             return cls(node)
 
         return None
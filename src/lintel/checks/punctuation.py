@@ -39,11 +39,11 @@ def _check_ends_with(
     error_class: Type[T],
 ) -> Optional[T]:
     """Raise error of type `error_class` if first line of docstring does not end with `chars`."""
-    summary_line: str = docstring.content.strip().split('\n')[0]
+    summary = docstring.summary
 
-    if not summary_line.endswith(chars):
+    if summary.line and not summary.line.endswith(chars):
         error = error_class(node)
-        error.parameters = [summary_line[-1]]
+        error.parameters = [summary.last_char]
 
         return error
 
@@ -5,6 +5,8 @@ from typing import Optional
 
 from lintel import CHECKED_NODE_TYPES, Configuration, Docstring, DocstringError
 
+BACKSLASH_RE = re.compile(r'\\[^\nuN]')
+
 
 class D300(DocstringError):
     description = 'Use """triple double quotes""" (found {}-quotes).'
@@ -20,27 +22,21 @@ class D300(DocstringError):
     def check_implementation(
         cls, node: CHECKED_NODE_TYPES, docstring: Docstring, config: Configuration
     ) -> Optional["D300"]:
-        if '"""' in docstring.content:
-            # Allow ''' quotes if docstring contains """, because
-            # otherwise """ quotes could not be expressed inside
-            # docstring. Not in PEP 257.
-            regex = re.compile(r".*?[uU]?[rR]?[^']'''[^'].*")
-        else:
-            regex = re.compile(r'.*?[uU]?[rR]?([^"]|^)"""[^"\n].*')
-
-        if regex.match(docstring.raw):
-            return None
-
-        illegal_match = re.compile(r""".*?[uU]?[rR]?("+|'+).*""").match(docstring.raw)
-        assert illegal_match is not None
+        quotes = docstring.token.quotes
 
-        illegal_quotes = illegal_match.group(1)
+        if len(quotes) == 3:
+            # Superfluous quotes at the start are part of the docstring's content
+            content = docstring.content
+            quotes += content[: len(content) - len(content.lstrip(quotes[0]))]
 
-        if illegal_quotes == '"""':
+        # Allow ''' quotes if docstring contains """, because
+        # otherwise """ quotes could not be expressed inside
+        # docstring. Not in PEP 257.
+        if quotes == '"""' or (quotes == "'''" and '"""' in docstring.content):
             return None
 
         error = cls(node)
-        error.parameters = [illegal_quotes]
+        error.parameters = [quotes]
 
         return error
 
@@ -60,11 +56,11 @@ class D301(DocstringError):
         cls, node: CHECKED_NODE_TYPES, docstring: Docstring, config: Configuration
     ) -> Optional["D301"]:
         # Just check that docstring is raw. D300 ensures the correct quotes.
-        if not re.compile(r'\\[^\nuN]').search(docstring.content):
+        if not BACKSLASH_RE.search(docstring.content):
             # No backslash in docstring
             return None
 
-        if docstring.raw.strip().startswith(('r', 'ur')):
+        if docstring.token.prefix.startswith(('r', 'ur')):
             return None
 
         return cls(node)
@@ -19,9 +19,7 @@ class D402(DocstringError):
     def check_implementation(
         cls, function_: astroid.FunctionDef, docstring: Docstring, config: Configuration
     ) -> Optional["D402"]:
-        first_line = docstring.content.strip().split('\n')[0]
-
-        if f"{function_.name}(" in first_line.replace(' ', ''):
+        if f"{function_.name}(" in docstring.summary.line.replace(' ', ''):
             return cls(function_)
 
         return None
@@ -2,13 +2,7 @@
 
 from typing import Optional
 
-from lintel import (
-    CHECKED_NODE_TYPES,
-    Configuration,
-    Docstring,
-    DocstringError,
-    strip_non_alphanumeric,
-)
+from lintel import CHECKED_NODE_TYPES, Configuration, Docstring, DocstringError
 
 
 class D404(DocstringError):
@@ -21,14 +15,7 @@ class D404(DocstringError):
     def check_implementation(
         cls, node: CHECKED_NODE_TYPES, docstring: Docstring, config: Configuration
     ) -> Optional["D404"]:
-        stripped = docstring.content.strip()
-
-        if not stripped:
-            return None
-
-        first_word = strip_non_alphanumeric(stripped.split()[0])
-
-        if first_word.lower() == 'this':
+        if docstring.summary.stripped_first_word.lower() == 'this':
             return cls(node)
 
         return None
@@ -3,9 +3,7 @@
 
 from typing import Optional
 
-from lintel import CHECKED_NODE_TYPES, Configuration, Docstring, DocstringError
-
-EMPTY_FIRST_LINES = ('"""', "'''", "r'''", 'r"""', "R'''", 'R"""')
+from lintel import CHECKED_NODE_TYPES, Configuration, Docstring, DocstringError, is_blank
 
 
 class D212(DocstringError):
@@ -15,7 +13,7 @@ class D212(DocstringError):
     def check_implementation(
         cls, node: CHECKED_NODE_TYPES, docstring: Docstring, config: Configuration
     ) -> Optional["D212"]:
-        if len(docstring.lines) > 1 and docstring.raw.splitlines()[0].strip() in EMPTY_FIRST_LINES:
+        if len(docstring.lines) > 1 and is_blank(docstring.lines[0]):
             return cls(node)
 
         return None
@@ -28,10 +26,7 @@ class D213(DocstringError):
     def check_implementation(
         cls, node: CHECKED_NODE_TYPES, docstring: Docstring, config: Configuration
     ) -> Optional["D213"]:
-        if (
-            len(docstring.lines) > 1
-            and docstring.raw.splitlines()[0].strip() not in EMPTY_FIRST_LINES
-        ):
+        if len(docstring.lines) > 1 and not is_blank(docstring.lines[0]):
             return cls(node)
 
         return None
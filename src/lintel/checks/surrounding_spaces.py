@@ -13,11 +13,7 @@ class D210(DocstringError):
     def check_implementation(
         cls, node: CHECKED_NODE_TYPES, docstring: Docstring, config: Configuration
     ) -> Optional["D210"]:
-        if (
-            docstring.lines[0].startswith(' ')
-            or len(docstring.lines) == 1
-            and docstring.lines[0].endswith(' ')
-        ):
+        if docstring.summary.leading_space or docstring.summary.trailing_space:
             return cls(node)
 
         return None
@@ -1,13 +1,16 @@
 """Command line interface for lintel."""
+import json
 import logging
 import os
+import sys
+import time
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterable, Iterator, List, Optional
 
 from astroid.exceptions import AstroidSyntaxError
-from rich import print
 from rich.console import Console
 from rich.logging import RichHandler
+from rich.table import Table
 from typer import Abort, Argument, Exit, Option, Typer
 from typing_extensions import Annotated
 
@@ -15,11 +18,26 @@ from lintel import (
     DEFAULT_MATCH,
     DEFAULT_MATCH_DIR,
     DEFAULT_PROPERTY_DECORATORS,
+    REPORTERS,
+    Configuration,
     Convention,
+    ErrorRecord,
     IllegalConfiguration,
+    MemoryProfiler,
+    MetricsExporter,
+    Observer,
+    OutputFormat,
+    Parser,
+    Profiler,
+    ProgressMeter,
+    Statistics,
+    Tracer,
     check_source,
+    combine_observers,
     discover_files,
+    iter_files,
     load_config,
+    sort_by_recency,
 )
 
 __all__ = ('main',)
@@ -150,12 +168,143 @@ def run(
             show_default=False,
         ),
     ] = None,
+    parser: Annotated[
+        Optional[Parser],
+        Option(
+            help="The parser that builds the syntax trees. "
+            f"Must be one of {[p.value for p in Parser]}. Defaults to '{Parser.AST.value}'. "
+            "'ast' only builds the parts of the tree that the checks need and is faster, while "
+            "'astroid' builds the complete tree.",
+            show_default=False,
+        ),
+    ] = None,
+    columnar: Annotated[
+        Optional[bool],
+        Option(
+            help="Whether to evaluate simple checks, e.g., D200 and D400, once over all "
+            "docstrings of a file instead of once per definition.",
+            show_default=False,
+        ),
+    ] = None,
+    profile: Annotated[
+        bool,
+        Option(
+            help="Report the time spent per phase and per check and the slowest files and "
+            "definitions.",
+        ),
+    ] = False,
+    profile_output: Annotated[
+        Optional[Path],
+        Option(
+            help="A JSON file to write the profile to. Implies --profile.",
+            show_default=False,
+        ),
+    ] = None,
+    profile_top: Annotated[
+        int,
+        Option(
+            help="The number of entries to list per table in the profile and memory reports.",
+        ),
+    ] = 10,
+    trace: Annotated[
+        Optional[Path],
+        Option(
+            help="A JSON file to write a timeline of the run to. "
+            "The timeline can be opened in Perfetto or chrome://tracing.",
+            show_default=False,
+        ),
+    ] = None,
+    memory_report: Annotated[
+        bool,
+        Option(
+            help="Report the peak and retained memory per phase and per file "
+            "and the sites that allocated the most retained memory.",
+        ),
+    ] = False,
+    memory_threshold: Annotated[
+        Optional[float],
+        Option(
+            help="Warn about files whose peak memory while checking exceeds this many MB. "
+            "Implies --memory-report.",
+            show_default=False,
+        ),
+    ] = None,
+    metrics: Annotated[
+        Optional[Path],
+        Option(
+            help="A file to write metrics of the run to in the OpenMetrics text format.",
+            show_default=False,
+        ),
+    ] = None,
+    output_format: Annotated[
+        OutputFormat,
+        Option(
+            "--format",
+            help="The format to report errors in. "
+            "Machine-readable formats are streamed to stdout while all other output goes to "
+            "stderr.",
+        ),
+    ] = OutputFormat.TEXT,
+    statistics: Annotated[
+        bool,
+        Option(
+            help="Report the number of errors per error code and per directory "
+            "instead of the individual errors.",
+        ),
+    ] = False,
+    statistics_output: Annotated[
+        Optional[Path],
+        Option(
+            help="A JSON file to write the statistics to. "
+            "Suppresses the individual errors like --statistics.",
+            show_default=False,
+        ),
+    ] = None,
+    count: Annotated[
+        bool,
+        Option(
+            help="Only print the total number of errors instead of the individual errors.",
+        ),
+    ] = False,
+    fail_fast: Annotated[
+        bool,
+        Option(
+            help="Stop at the first error without discovering or checking further files.",
+        ),
+    ] = False,
+    max_errors: Annotated[
+        Optional[int],
+        Option(
+            help="Stop once this many errors were found "
+            "without discovering or checking further files.",
+            min=1,
+            show_default=False,
+        ),
+    ] = None,
+    time_budget: Annotated[
+        Optional[float],
+        Option(
+            help="Check files for at most this many seconds, starting with the most recently "
+            "modified files, and report the files that were skipped.",
+            min=0,
+            show_default=False,
+        ),
+    ] = None,
+    progress: Annotated[
+        Optional[bool],
+        Option(
+            help="Whether to show the progress on stderr. "
+            "Defaults to redrawing a status line if stderr is a terminal and to writing one "
+            "every 10 seconds otherwise.",
+            show_default=False,
+        ),
+    ] = None,
 ) -> None:
     """Check docstring style.
 
     Options passed via the CLI take precedence over values set in a configuration file.
     """
-    configure_logging(verbose or False)
+    configure_logging(verbose or False, output_format != OutputFormat.TEXT)
 
     paths = paths or [Path().cwd()]
 
@@ -167,61 +316,311 @@ def run(
         _logger.error(config_error)
         raise Exit(1)
 
-    config.convention = convention or config.convention
-    config.select = set(select.split(",")) if select else config.select
-    config.ignore = set(ignore.split(",")) if ignore else config.ignore
-    config.add_select = set(add_select.split(",")) if add_select else config.add_select
-    config.add_ignore = set(add_ignore.split(",")) if add_ignore else config.add_ignore
-    config.match = match or config.match
-    config.match_dir = match_dir or config.match_dir
-    config.ignore_decorators = ignore_decorators or config.ignore_decorators
-    config.property_decorators = (
-        set(property_decorators.split(",")) if property_decorators else config.property_decorators
+    config = config.replace(
+        convention=convention or config.convention,
+        select=set(select.split(",")) if select else config.select,
+        ignore=set(ignore.split(",")) if ignore else config.ignore,
+        add_select=set(add_select.split(",")) if add_select else config.add_select,
+        add_ignore=set(add_ignore.split(",")) if add_ignore else config.add_ignore,
+        match=match or config.match,
+        match_dir=match_dir or config.match_dir,
+        ignore_decorators=ignore_decorators or config.ignore_decorators,
+        property_decorators=(
+            set(property_decorators.split(","))
+            if property_decorators
+            else config.property_decorators
+        ),
+        ignore_inline_noqa=ignore_inline_noqa or config.ignore_inline_noqa,
+        verbose=verbose or config.verbose,
+        parser=parser or config.parser,
+        columnar=columnar or config.columnar,
     )
-    config.ignore_inline_noqa = ignore_inline_noqa or config.ignore_inline_noqa
-    config.verbose = verbose or config.verbose
 
     # Reconfigure logging with the configured verbosity level
-    configure_logging(config.verbose)
+    configure_logging(config.verbose, output_format != OutputFormat.TEXT)
 
     _logger.info(f"Using configuration: {config}")
 
     exit_code = 0
     error_count = 0
 
-    files_to_check = discover_files(paths, config)
+    profiler = Profiler() if profile or profile_output else None
+    tracer = Tracer() if trace else None
+    memory_profiler = MemoryProfiler() if memory_report or memory_threshold is not None else None
+    metrics_exporter = MetricsExporter() if metrics else None
+    statistics_collector = (
+        Statistics() if statistics or count or statistics_output is not None else None
+    )
+    progress_meter = (
+        ProgressMeter(report_start_and_end=progress or sys.stderr.isatty())
+        if progress is not False
+        else None
+    )
 
-    for filename in files_to_check:
-        _logger.info("Checking file: %s" % filename)
+    observer = combine_observers(
+        [
+            o
+            for o in (
+                profiler,
+                tracer,
+                memory_profiler,
+                metrics_exporter,
+                statistics_collector,
+                progress_meter,
+            )
+            if o is not None
+        ]
+    )
 
-        try:
-            for error in check_source(Path(filename), config):
-                _logger.error(error)
+    # Machine-readable output goes to stdout and everything else to stderr
+    console = Console(stderr=output_format != OutputFormat.TEXT)
+    reporter = (
+        REPORTERS[output_format](sys.stdout)
+        if output_format != OutputFormat.TEXT and not statistics_collector
+        else None
+    )
+
+    if reporter:
+        reporter.start()
+
+    # Stop after this many errors and only discover as many files as needed
+    stop_after = 1 if fail_fast else max_errors
+    n_checked_files = 0
+    n_failed_files = 0
+
+    deadline = time.perf_counter() + time_budget if time_budget is not None else None
+    skipped_files: List[Path] = []
+
+    with observer.run():
+        if stop_after is None or deadline is not None:
+            with observer.phase("discovery"):
+                discovered_files = discover_files(paths, config)
+
+                # Check the files that most likely changed first
+                files_to_check: Iterable[Path] = (
+                    sort_by_recency(discovered_files) if deadline is not None else discovered_files
+                )
+
+            observer.files_discovered(len(discovered_files))
+        else:
+            files_to_check = _discover_lazily(paths, config, observer)
+
+        for filename in files_to_check:
+            if deadline is not None and time.perf_counter() >= deadline:
+                skipped_files.append(filename)
+                continue
+
+            _logger.info("Checking file: %s" % filename)
+            n_checked_files += 1
+
+            try:
+                errors = check_source(
+                    Path(filename),
+                    config,
+                    observer,
+                    None if stop_after is None else stop_after - error_count - n_failed_files,
+                )
+            except AstroidSyntaxError as error:
+                _logger.error(f"{filename}: Cannot parse file")
                 exit_code = 1
-                error_count += 1
+                n_failed_files += 1
 
-        except AstroidSyntaxError:
-            _logger.error(f"{filename}: Cannot parse file")
-            exit_code = 1
+                if reporter:
+                    reporter.fail(Path(filename), _get_parse_error_record(Path(filename), error))
+            else:
+                with observer.phase("reporting"):
+                    if errors:
+                        exit_code = 1
+                        error_count += len(errors)
 
-    n_checked_files = len(files_to_check)
+                    if not statistics_collector:
+                        records = [error.to_record() for error in errors]
 
-    if error_count > 0:
-        print()
+                        if reporter:
+                            reporter.report(Path(filename), records)
+                        else:
+                            for record in records:
+                                _logger.error(record)
 
-    print(
-        f"{'💥' if error_count> 0 else '🚀'} "
-        f"Found {error_count} error{'s' if error_count > 1  or error_count == 0 else ''} "
-        f"in {n_checked_files} file{'s' if n_checked_files > 1 or n_checked_files == 0 else ''}."
-    )
+            if stop_after is not None and error_count + n_failed_files >= stop_after:
+                _logger.warning(
+                    f"Stopped after {error_count + n_failed_files} "
+                    f"error{'s' if error_count + n_failed_files > 1 else ''}. "
+                    "Remaining files were not checked."
+                )
+                break
+
+    if skipped_files:
+        _logger.warning(
+            f"Skipped {len(skipped_files)} file{'s' if len(skipped_files) > 1 else ''} "
+            f"because the time budget of {time_budget} seconds was exhausted:"
+        )
+
+        for file in skipped_files:
+            _logger.warning(f"Skipped {file}")
+
+            if reporter:
+                reporter.skip(file)
+
+    if reporter:
+        reporter.finish()
+
+    if statistics_collector:
+        _report_statistics(console, statistics_collector, statistics, statistics_output)
+
+    if count:
+        console.print(error_count)
+    else:
+        if error_count > 0 and not statistics_collector:
+            console.print()
+
+        console.print(
+            f"{'💥' if error_count> 0 else '🚀'} "
+            f"Found {error_count} error{'s' if error_count > 1  or error_count == 0 else ''} "
+            f"in {n_checked_files} file{'s' if n_checked_files > 1 or n_checked_files == 0 else ''}."
+        )
+
+    if tracer and trace:
+        tracer.save(trace)
+
+    if profiler:
+        _report_profile(console, profiler, profile_top)
+
+        if profile_output:
+            profile_output.parent.mkdir(parents=True, exist_ok=True)
+            profile_output.write_text(json.dumps(profiler.as_dict(profile_top), indent=2) + "\n")
+
+    if memory_profiler:
+        _report_memory(console, memory_profiler, profile_top, memory_threshold)
+
+    if metrics_exporter and metrics:
+        metrics_exporter.save(metrics)
 
     raise Exit(exit_code)
 
 
-def configure_logging(verbose: bool) -> None:
-    """Set up logging."""
+def _discover_lazily(
+    paths: List[Path], config: Configuration, observer: Observer
+) -> Iterator[Path]:
+    files = iter_files(paths, config)
+
+    while True:
+        with observer.phase("discovery"):
+            file = next(files, None)
+
+        if file is None:
+            return
+
+        yield file
+
+
+def _get_parse_error_record(file: Path, error: AstroidSyntaxError) -> ErrorRecord:
+    """Describe why a file cannot be parsed like a docstring error in the module."""
+    cause = getattr(error, "error", None) or error
+
+    return ErrorRecord(
+        code="parse-error",
+        file=str(file),
+        line=getattr(cause, "lineno", None) or 0,
+        node_type="module",
+        node_name=file.stem,
+        description=f"Cannot parse file: {cause}",
+    )
+
+
+def _report_profile(console: Console, profiler: Profiler, top: int) -> None:
+    total = sum(profiler.phases.values())
+
+    phases = Table("Phase", "Time (s)", "Share", title="Phases")
+
+    for name, seconds in profiler.phases.items():
+        phases.add_row(name, f"{seconds:.4f}", f"{seconds / total:.1%}" if total else "-")
+
+    checks = Table("Check", "Calls", "Total (s)", "Mean (µs)", "Max (µs)", title="Checks")
+
+    for code, timing in sorted(profiler.checks.items(), key=lambda i: i[1].total, reverse=True):
+        checks.add_row(
+            code,
+            str(timing.calls),
+            f"{timing.total:.4f}",
+            f"{1e6 * timing.mean:.1f}",
+            f"{1e6 * timing.max:.1f}",
+        )
+
+    files = Table("File", "Time (s)", title="Slowest files")
+
+    for file, seconds in profiler.slowest_files(top):
+        files.add_row(str(file), f"{seconds:.4f}")
+
+    definitions = Table("Definition", "Time (s)", title="Slowest definitions")
+
+    for definition, seconds in profiler.slowest_definitions(top):
+        definitions.add_row(str(definition), f"{seconds:.4f}")
+
+    for table in (phases, checks, files, definitions):
+        console.print(table)
+
+
+def _report_statistics(
+    console: Console, statistics: Statistics, show: bool, output: Optional[Path]
+) -> None:
+    if show:
+        codes = Table("Code", "Errors", title="Errors per code")
+
+        for code, n_errors in statistics.sorted_codes():
+            codes.add_row(code, str(n_errors))
+
+        directories = Table("Directory", "Errors", title="Errors per directory")
+
+        for directory, n_errors in statistics.sorted_directories():
+            directories.add_row(directory, str(n_errors))
+
+        for table in (codes, directories):
+            console.print(table)
+
+    if output:
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(json.dumps(statistics.as_dict(), indent=2) + "\n")
+
+
+def _report_memory(
+    console: Console, profiler: MemoryProfiler, top: int, threshold: Optional[float]
+) -> None:
+    phases = Table("Phase", "Peak (MB)", "Retained (MB)", title="Memory per phase")
+
+    for name, usage in profiler.phases.items():
+        phases.add_row(name, f"{usage.peak / 2**20:.2f}", f"{usage.retained / 2**20:.2f}")
+
+    files = Table("File", "Peak (MB)", "Retained (MB)", title="Largest files")
+
+    for file, usage in profiler.largest_files(top):
+        files.add_row(str(file), f"{usage.peak / 2**20:.2f}", f"{usage.retained / 2**20:.2f}")
+
+    sites = Table("Site", "Retained (MB)", "Blocks", title="Largest allocation sites")
+
+    for site in profiler.largest_sites(top):
+        sites.add_row(str(site), f"{site.size / 2**20:.2f}", str(site.count))
+
+    for table in (phases, files, sites):
+        console.print(table)
+
+    if threshold is not None:
+        for file, usage in profiler.files_exceeding(int(threshold * 2**20)):
+            _logger.warning(
+                f"{file}: Peak memory of {usage.peak / 2**20:.2f} MB exceeds {threshold} MB"
+            )
+
+
+def configure_logging(verbose: bool, stderr_only: bool = False) -> None:
+    """Set up logging.
+
+    Args:
+        verbose: Whether to log informational messages.
+        stderr_only: Whether to keep stdout free for machine-readable output.
+    """
     stdout_handler = RichHandler(
         console=Console(
+            stderr=stderr_only,
             width=500 if "LINTEL_TESTING" in os.environ else None,
         ),
         rich_tracebacks=True,
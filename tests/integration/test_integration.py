@@ -1,9 +1,11 @@
 """Use tox or pytest to run the test-suite."""
 
+import json
 import os
 import subprocess
 import sys
 import textwrap
+import xml.etree.ElementTree as ElementTree
 from pathlib import Path
 
 import pytest
@@ -966,3 +968,95 @@ def test_run_summary(content: str, exit_code: int, output: str, env: SandboxEnv)
     result = env.invoke(target='test.py')
     assert result.exit_code == exit_code
     assert result.stdout.endswith(output)
+
+
+@pytest.mark.parametrize(
+    ("args", "n_errors"),
+    [
+        ("--fail-fast", 1),
+        ("--max-errors 3", 3),
+        ("--max-errors 100", 10),
+    ],
+)
+def test_stop_early(args: str, n_errors: int, env: SandboxEnv) -> None:
+    env.write_config(convention="none", select="D100,D103")
+
+    for i_file in range(5):
+        with env.open(f'module_{i_file}.py', 'wt') as module:
+            module.write('def function():\n    pass\n')
+
+    result = env.invoke(args)
+
+    assert result.exit_code == 1
+    assert f"Found {n_errors} error" in result.stdout
+    assert ("Remaining files were not checked" in result.stdout) == (n_errors < 10)
+
+
+@pytest.mark.parametrize(
+    ("time_budget", "n_checked_files"),
+    [
+        (0, 0),
+        (3600, 3),
+    ],
+)
+def test_time_budget(time_budget: int, n_checked_files: int, env: SandboxEnv) -> None:
+    env.write_config(convention="none", select="D103")
+
+    for i_file in range(3):
+        with env.open(f'module_{i_file}.py', 'wt') as module:
+            module.write('def function():\n    pass\n')
+
+    result = env.invoke(f"--time-budget {time_budget}")
+
+    assert result.exit_code == int(n_checked_files > 0)
+    assert f"Found {n_checked_files} error" in result.stdout
+    assert f"in {n_checked_files} file" in result.stdout
+    assert ("Skipped 3 files" in result.stdout) == (n_checked_files == 0)
+    assert result.stdout.count("Skipped ") == (4 if n_checked_files == 0 else 0)
+
+
+def _invoke_on_invalid_file(env: SandboxEnv, output_format: str) -> str:
+    with env.open('invalid.py', 'wt') as file:
+        file.write("def function(:\n")
+
+    result = env.invoke(f"--format {output_format}", target='invalid.py')
+
+    assert result.exit_code == 1
+    assert 'invalid.py: Cannot parse file' in result.stderr
+
+    return result.stdout
+
+
+def test_parse_errors_in_jsonl(env: SandboxEnv) -> None:
+    (record,) = [json.loads(line) for line in _invoke_on_invalid_file(env, "jsonl").splitlines()]
+
+    assert record["code"] == "parse-error"
+    assert record["file"].endswith("invalid.py")
+    assert record["line"] == 1
+
+
+def test_parse_errors_in_sarif(env: SandboxEnv) -> None:
+    (run,) = json.loads(_invoke_on_invalid_file(env, "sarif"))["runs"]
+    (invocation,) = run["invocations"]
+    (notification,) = invocation["toolExecutionNotifications"]
+
+    assert run["results"] == []
+    assert not invocation["executionSuccessful"]
+    assert notification["descriptor"]["id"] == "parse-error"
+    assert notification["level"] == "error"
+    assert notification["locations"][0]["physicalLocation"]["region"]["startLine"] == 1
+
+
+def test_parse_errors_in_junit(env: SandboxEnv) -> None:
+    output = _invoke_on_invalid_file(env, "junit")
+    (testcase,) = ElementTree.fromstring(output).findall("./testsuite/testcase")
+
+    assert testcase.attrib["name"].endswith("invalid.py")
+    assert testcase.find("error").attrib["type"] == "parse-error"  # type: ignore
+
+
+def test_parse_errors_in_github(env: SandboxEnv) -> None:
+    output = _invoke_on_invalid_file(env, "github")
+
+    assert output.startswith("::error file=")
+    assert "invalid.py,line=1,title=lintel parse-error::parse-error: Cannot parse file" in output
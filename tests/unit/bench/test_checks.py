@@ -0,0 +1,43 @@
+import astroid
+
+from lintel import Configuration, get_all_error_codes
+from lintel.bench import (
+    CorpusSpec,
+    collect_nodes,
+    measure_check,
+    measure_checks,
+    measure_columnar,
+)
+from lintel.checks.missing_docstring import D103
+
+
+def test_every_check_is_measured() -> None:
+    results = measure_checks(CorpusSpec(n_files=1, definitions_per_file=5), repeat=1)
+
+    assert {result.check.error_code() for result in results} == get_all_error_codes()
+
+    for result in results:
+        assert result.calls == 3 * 6  # Three styles, five definitions plus the module
+        assert result.ns_per_call > 0
+
+
+def test_hit_rate() -> None:
+    module = astroid.parse(
+        'def documented():\n    """Docstring."""\n\ndef undocumented():\n    pass\n'
+    )
+    nodes = [(node, Configuration()) for node in collect_nodes(module)]
+
+    result = measure_check(D103, nodes, repeat=1)
+
+    assert result.calls == 3
+    assert result.hits == 1
+    assert result.hit_rate == 1 / 3
+
+
+def test_columnar_checks_are_compared_with_per_node_checks() -> None:
+    result = measure_columnar(CorpusSpec(n_files=1, definitions_per_file=5), repeat=1)
+
+    assert result.n_docstrings > 0
+    assert result.per_node_ns > 0
+    assert result.columnar_ns > 0
+    assert result.columnar_errors == result.per_node_errors
@@ -0,0 +1,44 @@
+from pathlib import Path
+
+import pytest
+
+from lintel import Configuration, check_source
+from lintel.bench import CorpusSpec, Style, generate_corpus, measure_throughput
+
+
+def test_corpus_is_reproducible(tmp_path: Path) -> None:
+    spec = CorpusSpec(n_files=2, seed=42)
+
+    first = generate_corpus(tmp_path / "first", spec)
+    second = generate_corpus(tmp_path / "second", spec)
+
+    assert [f.read_text() for f in first.files] == [f.read_text() for f in second.files]
+    assert first.n_definitions == 2 * spec.definitions_per_file
+
+
+@pytest.mark.parametrize("style", list(Style))
+@pytest.mark.parametrize("section_density", [0.0, 1.0])
+@pytest.mark.parametrize("docstring_length", [0, 2])
+def test_corpus_has_no_errors_for_its_convention(
+    style: Style, section_density: float, docstring_length: int, tmp_path: Path
+) -> None:
+    spec = CorpusSpec(
+        style=style,
+        n_files=2,
+        definitions_per_file=9,
+        docstring_length=docstring_length,
+        section_density=section_density,
+    )
+    corpus = generate_corpus(tmp_path, spec)
+    config = Configuration(convention=style.convention)
+
+    assert [error for file in corpus.files for error in check_source(file, config)] == []
+
+
+def test_measure_throughput() -> None:
+    result = measure_throughput(CorpusSpec(n_files=2, definitions_per_file=5))
+
+    assert result.n_files == 2
+    assert result.n_definitions == 10
+    assert result.files_per_second > 0
+    assert result.as_dict()["style"] == "google"
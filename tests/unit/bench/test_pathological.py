@@ -0,0 +1,54 @@
+from collections import Counter
+from pathlib import Path
+
+import pytest
+
+from lintel import Configuration, check_source, count_operations
+from lintel.bench import PATHOLOGICAL_CASES, PathologicalResult, measure_pathological
+
+SMALL_SIZE = 1000
+LARGE_SIZE = 8000
+
+
+def _count_operations(directory: Path, case: str, size: int) -> "Counter[str]":
+    convention, generate = PATHOLOGICAL_CASES[case]
+    file = directory / f"{case}_{size}.py"
+    file.write_text(generate(size))
+
+    with count_operations() as counts:
+        check_source(file, Configuration(convention=convention))
+
+    return counts
+
+
+@pytest.mark.parametrize("case", list(PATHOLOGICAL_CASES))
+def test_pathological_cases_take_linear_operations(tmp_path: Path, case: str) -> None:
+    # Operation counts are exact, while timings are only compared with a generous threshold below
+    small = _count_operations(tmp_path, case, SMALL_SIZE)
+    large = _count_operations(tmp_path, case, LARGE_SIZE)
+
+    assert set(large) == set(small)
+
+    for operation, count in large.items():
+        assert count <= LARGE_SIZE / SMALL_SIZE * small[operation] + 1, operation
+
+
+def test_pathological_cases_take_about_linear_time() -> None:
+    # Catastrophic backtracking of a regular expression takes at least quadratic time but is
+    # not visible in the operation counts. Small sizes keep the test fast.
+    for result in measure_pathological(sizes=(SMALL_SIZE // 4, LARGE_SIZE // 4), repeat=3):
+        assert result.scaling_exponent < 1.75, result.case
+
+
+@pytest.mark.parametrize(
+    ("seconds", "exponent"),
+    [
+        ([1.0, 2.0], 1.0),
+        ([1.0, 4.0], 2.0),
+        ([1.0, 1.0], 0.0),
+    ],
+)
+def test_scaling_exponent(seconds: list, exponent: float) -> None:
+    result = PathologicalResult("case", [1000, 2000], seconds)
+
+    assert result.scaling_exponent == pytest.approx(exponent)
@@ -0,0 +1,61 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from lintel.bench import Measurement, check_budgets, load_baseline, parse_import_time, save_results
+
+IMPORT_TIME_OUTPUT = """\
+import time: self [us] | cumulative | imported package
+import time:       512 |        512 |     astroid.nodes
+import time:      4950 |     348392 | lintel
+import time:        10 |         20 |   lintel.cli
+"""
+
+
+def test_parse_import_time() -> None:
+    assert parse_import_time(IMPORT_TIME_OUTPUT) == pytest.approx(0.348392)
+    assert parse_import_time(IMPORT_TIME_OUTPUT, "lintel.cli") == pytest.approx(0.00002)
+
+    with pytest.raises(ValueError, match="No import time found for module 'typer'."):
+        parse_import_time(IMPORT_TIME_OUTPUT, "typer")
+
+
+def test_measurement_statistics() -> None:
+    measurement = Measurement("import", [0.3, 0.1, 0.2])
+
+    assert measurement.min == 0.1
+    assert measurement.median == 0.2
+
+
+def test_phases_over_budget_are_reported() -> None:
+    measurements = {
+        "import": Measurement("import", [0.1, 0.2, 0.3]),
+        "help_warm": Measurement("help_warm", [0.5, 0.6, 0.7]),
+        "unknown": Measurement("unknown", [10.0]),
+    }
+    baseline = {
+        "import": {"baseline": 0.1, "budget": 0.25},
+        "help_warm": {"baseline": 0.4, "budget": 0.55},
+    }
+
+    violations = check_budgets(measurements, baseline)
+
+    assert len(violations) == 1
+    assert violations[0].startswith("Phase 'help_warm' took 0.6000s")
+
+
+def test_checked_in_baseline_is_valid() -> None:
+    baseline_path = Path(__file__).parents[3] / "benchmarks" / "startup.json"
+    baseline = load_baseline(baseline_path)
+
+    for phase in baseline.values():
+        assert phase["baseline"] <= phase["budget"]
+
+
+def test_save_results(tmp_path: Path) -> None:
+    save_results({"import": Measurement("import", [0.1])}, tmp_path / "results.json")
+
+    assert json.loads((tmp_path / "results.json").read_text()) == {
+        "import": {"min": 0.1, "median": 0.1, "samples": [0.1]}
+    }
@@ -0,0 +1,61 @@
+import random
+from itertools import takewhile
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from lintel import (
+    BlankLines,
+    Configuration,
+    Convention,
+    check_source,
+    count_operations,
+    is_blank,
+)
+
+
+def _line(lines: List[str], lineno: int) -> str:
+    # Lines after the end of the module are blank, like in the line cache
+    return lines[lineno - 1] if 0 < lineno <= len(lines) else ""
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_blank_lines_match_line_by_line_counts(seed: int) -> None:
+    rng = random.Random(seed)
+    lines = [rng.choice(["", "  ", "x = 1", "    pass"]) for _ in range(rng.randint(0, 30))]
+    blank_lines = BlankLines(lines)
+
+    for lineno in range(1, len(lines) + 3):
+        before = takewhile(is_blank, (_line(lines, l) for l in range(lineno - 1, 0, -1)))
+
+        assert blank_lines.n_blanks_before(lineno) == len(list(before))
+
+        for last_lineno in range(lineno, len(lines) + 4):
+            after = takewhile(
+                is_blank, (_line(lines, l) for l in range(lineno + 1, last_lineno + 1))
+            )
+
+            assert blank_lines.n_blanks_after(lineno, last_lineno) == len(list(after))
+
+
+def test_blank_lines_are_indexed_once_per_module(tmp_path: Path) -> None:
+    file = tmp_path / "module.py"
+    body = "\n".join(f"    x_{i} = {i}\n" for i in range(1000))
+    file.write_text(
+        '"""Module."""\n\n\n'
+        f'def function():\n\n    """Docstring."""\n\n{body}\n\n'
+        f'class Class:\n    """Docstring."""\n\n{body}\n'
+    )
+    config = Configuration(convention=Convention.NONE, select="D201,D202,D203,D204,D211")
+
+    with count_operations() as counts:
+        errors = check_source(file, config)
+
+    assert sorted(error.message for error in errors) == [
+        "D201: No blank lines allowed before function/method docstring (found 1).",
+        "D202: No blank lines allowed after function/method docstring (found 1).",
+        "D203: Class docstrings should have 1 blank line before them (found 0).",
+    ]
+    assert counts["blank_line_index"] == 1
+    assert counts["source_decode"] == 1
@@ -0,0 +1,90 @@
+from pathlib import Path
+from typing import List
+
+import pytest
+
+import lintel._check_source
+from lintel import CheckPlan, Configuration, Convention, check_source, count_operations
+
+RESOURCE_DIR = Path(__file__).parents[1] / "resources"
+
+SELECTIONS = [
+    "D100,D101,D102,D103,D104,D105,D106,D107",
+    "D200,D201,D202,D300,D400,D401,D417,D419",
+    "D101,D103,D107,D205,D212,D418,D419",
+]
+
+
+def _check(file: Path, select: str) -> List[str]:
+    config = Configuration(convention=Convention.NONE, select=select)
+
+    return sorted(str(error) for error in check_source(file, config))
+
+
+@pytest.mark.parametrize("select", SELECTIONS)
+@pytest.mark.parametrize("file", sorted(RESOURCE_DIR.glob("*.py")), ids=lambda file: file.name)
+def test_pruning_does_not_change_errors(
+    file: Path, select: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    pruned = _check(file, select)
+
+    # Nothing is pruned without the skeleton of the module
+    monkeypatch.setattr(
+        lintel._check_source, "CheckPlan", lambda checks, skeleton: CheckPlan(checks, None)
+    )
+
+    assert pruned == _check(file, select)
+
+
+@pytest.mark.parametrize(
+    ("select", "n_errors"),
+    [
+        # The private class only contains private definitions and nested functions
+        ("D101,D102,D103", 1),
+        # No docstrings in the private class
+        ("D200,D400", 0),
+    ],
+)
+def test_subtrees_without_reportable_errors_are_pruned(
+    tmp_path: Path, select: str, n_errors: int
+) -> None:
+    file = tmp_path / "module.py"
+    file.write_text(
+        '"""Module."""\n'
+        "\n"
+        "\n"
+        "class _Private:\n"
+        "    def method(self):\n"
+        "        def nested():\n"
+        "            pass\n"
+        "\n"
+        "    def other(self):\n"
+        "        pass\n"
+        "\n"
+        "\n"
+        "def function():\n"
+        "    pass\n"
+    )
+
+    with count_operations() as counts:
+        errors = check_source(file, Configuration(convention=Convention.NONE, select=select))
+
+    assert len(errors) == n_errors
+    assert counts["pruned_subtree"] == 1 + (n_errors == 0)
+    assert counts["check_iteration"] <= len(select.split(",")) * 2
+
+
+def test_dunder_methods_of_private_classes_are_checked(tmp_path: Path) -> None:
+    file = tmp_path / "module.py"
+    file.write_text(
+        "def factory():\n"
+        '    """Create a class."""\n'
+        "\n"
+        "    class _Private:\n"
+        "        def __init__(self):\n"
+        "            pass\n"
+    )
+
+    errors = check_source(file, Configuration(convention=Convention.NONE, select="D107"))
+
+    assert [error.error_code() for error in errors] == ["D107"]
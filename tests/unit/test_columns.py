@@ -0,0 +1,114 @@
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from lintel import (
+    COLUMNAR_CHECKS,
+    Configuration,
+    Convention,
+    DocstringColumns,
+    check_source,
+    get_checks,
+    get_columnar_checks,
+    get_docstring_from_doc_node,
+    parse_module,
+)
+from lintel.bench import CorpusSpec, Style, generate_corpus
+
+RESOURCE_DIR = Path(__file__).parents[1] / "resources"
+
+CONFIGS = {
+    "all": Configuration(convention=Convention.ALL),
+    "google": Configuration(convention=Convention.GOOGLE),
+    "numpy": Configuration(convention=Convention.NUMPY),
+    # No other check shadows the columnar checks, e.g., terminal ones
+    "columnar": Configuration(convention=Convention.NONE, select=set(COLUMNAR_CHECKS)),
+}
+
+#: Docstrings at the edges of what the columnar checks look at
+EDGE_CASE_DOCSTRINGS = [
+    "",
+    " ",
+    "\n\n",
+    "Summary.\n    ",
+    "  Spaces around.  ",
+    "Summary\n\n\nTwo blank lines.\n",
+    "Summary.\nNo blank line.",
+    "'quoted' first word.",
+    "don't capitalize?",
+    "ümlaut first word!",
+    "UPPER CASE",
+    "Backslash \\\n    continued.\n    ",
+    "\tTab before summary.",
+]
+
+
+def _check(file: Path, config: Configuration) -> List[str]:
+    return [str(error) for error in check_source(file, config)]
+
+
+@pytest.mark.parametrize("config", list(CONFIGS.values()), ids=list(CONFIGS))
+@pytest.mark.parametrize(
+    "file",
+    sorted(RESOURCE_DIR.rglob("*.py")),
+    ids=lambda file: file.relative_to(RESOURCE_DIR).as_posix(),
+)
+def test_columnar_checks_find_the_same_errors_in_the_same_order(
+    file: Path, config: Configuration
+) -> None:
+    config = config.replace(ignore_decorators="wraps|ignored_decorator")
+
+    assert _check(file, config.replace(columnar=True)) == _check(file, config)
+
+
+@pytest.mark.parametrize("config", list(CONFIGS.values()), ids=list(CONFIGS))
+@pytest.mark.parametrize("docstring", EDGE_CASE_DOCSTRINGS)
+def test_columnar_checks_match_per_node_checks_on_edge_cases(
+    tmp_path: Path, docstring: str, config: Configuration
+) -> None:
+    file = tmp_path / "module.py"
+    file.write_text(
+        f'"""{docstring}"""\n'
+        "\n"
+        "\n"
+        "class Class:\n"
+        f'    """{docstring}"""\n'
+        "\n"
+        "    def method(self):\n"
+        f'        """{docstring}"""\n'
+    )
+
+    assert _check(file, config.replace(columnar=True)) == _check(file, config)
+
+
+@pytest.mark.parametrize("style", list(Style))
+def test_columnar_checks_match_per_node_checks_on_the_corpus(tmp_path: Path, style: Style) -> None:
+    corpus = generate_corpus(tmp_path, CorpusSpec(style=style, n_files=3))
+    config = Configuration(convention=Convention.ALL)
+
+    for file in corpus.files:
+        assert _check(file, config.replace(columnar=True)) == _check(file, config)
+
+
+def test_columns_are_evaluated_over_docstrings_of_many_files(tmp_path: Path) -> None:
+    sources = ['"""One-liner.\n\n"""\n', '"""lower case summary."""\n', '"""Fine."""\n']
+    columns = DocstringColumns()
+
+    for i_file, source in enumerate(sources):
+        module = parse_module(source, tmp_path / f"module_{i_file}.py")
+        columns.append(get_docstring_from_doc_node(module, Configuration()), {"D200", "D403"})
+
+    errors = columns.evaluate(get_columnar_checks())
+
+    assert [(i_row, error.error_code(), error.parameters) for i_row, error in errors] == [
+        (0, "D200", [2]),
+        (1, "D403", ["Lower", "lower"]),
+    ]
+
+
+def test_every_columnar_check_exists() -> None:
+    assert {check.error_code() for check in get_columnar_checks()} == set(COLUMNAR_CHECKS)
+    assert not any(
+        check.terminal for check in get_checks() if check.error_code() in COLUMNAR_CHECKS
+    )
@@ -1,9 +1,14 @@
+import copy
+import pickle
 import re
+import subprocess
+import sys
 from pathlib import Path
+from typing import Any, Dict
 
 import pytest
 
-from lintel import Configuration, Convention, IllegalConfiguration, load_config
+from lintel import Configuration, Convention, IllegalConfiguration, Parser, load_config
 
 
 def test_default_config() -> None:
@@ -22,6 +27,8 @@ def test_default_config() -> None:
     }
     assert config.ignore_inline_noqa is False
     assert config.verbose is False
+    assert config.parser == Parser.AST
+    assert config.columnar is False
 
 
 def test_load_config_returns_default_config_if_no_config_found(tmp_path: Path) -> None:
@@ -86,3 +93,59 @@ def test_discovery_in_same_folder(tmp_path: Path) -> None:
     (tmp_path / "tox.ini").unlink()
 
     assert load_config(tmp_path).select == {"D3"}
+
+
+def test_config_is_immutable() -> None:
+    config = Configuration()
+
+    with pytest.raises(AttributeError, match="immutable"):
+        config.verbose = True  # type: ignore[misc]
+
+    assert not hasattr(config, "__dict__")
+
+
+def test_replace_returns_a_new_validated_config() -> None:
+    config = Configuration()
+    replaced = config.replace(convention="google", select="D100,D200", verbose="yes")
+
+    assert config.convention == Convention.DEFAULT
+    assert replaced.convention == Convention.GOOGLE
+    assert replaced.select == {"D100", "D200"}
+    assert replaced.verbose is True
+
+
+def test_config_is_hashable_and_picklable() -> None:
+    config = Configuration(convention=Convention.NUMPY, select={"D100"})
+
+    assert hash(config) == hash(Configuration(convention="numpy", select="D100"))
+    assert config != Configuration()
+    assert pickle.loads(pickle.dumps(config)) == config
+    assert copy.deepcopy(config) is config
+
+
+def test_digest_is_stable() -> None:
+    config = Configuration(select={"D100", "D200", "D300"})
+
+    assert config.digest == Configuration(select="D300, D200, D100").digest
+    assert config.digest != Configuration().digest
+
+    code = "from lintel import Configuration; print(Configuration(select='D300,D200,D100').digest)"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+
+    assert result.stdout.strip() == config.digest
+
+
+@pytest.mark.parametrize(
+    ("settings", "message"),
+    [
+        ({"convention": "bla"}, "convention: value is not a valid enumeration member"),
+        ({"parser": "bla"}, "parser: value is not a valid enumeration member"),
+        ({"select": 1}, "select: value is not a valid set"),
+        ({"match": 1}, "match: str type expected"),
+        ({"verbose": "maybe"}, "verbose: value could not be parsed to a boolean"),
+        ({"unknown_option": "abc"}, "unknown_option: extra fields not permitted"),
+    ],
+)
+def test_invalid_settings_raise_error(settings: Dict[str, Any], message: str) -> None:
+    with pytest.raises(IllegalConfiguration, match=message):
+        Configuration.from_dict(settings)
@@ -1,9 +1,96 @@
+import gc
+from pathlib import Path
+
 import pytest
 from astroid import Module
 
-from lintel import Convention, Docstring
+from lintel import (
+    Configuration,
+    Convention,
+    Docstring,
+    DocstringToken,
+    Summary,
+    check_source,
+    count_operations,
+    parse_module,
+)
 
 
 def test_raises_error_if_node_has_no_doc_node() -> None:
     with pytest.raises(ValueError, match="Node 'abc' does not have a doc node."):
         Docstring(Module(name="abc"), Convention.NONE)
+
+
+def test_token_describes_the_docstring(tmp_path: Path) -> None:
+    source = '"""Module."""\n\n\nclass Class:\n\tdef method(self): r\'\'\'Method.\n\n\t\t\'\'\'\n'
+    module = parse_module(source, tmp_path / "module.py")
+    method = module.body[0].body[0]
+
+    with count_operations() as counts:
+        module_docstring = Docstring(module, Convention.NONE)
+        method_docstring = Docstring(method, Convention.NONE)
+
+        assert module_docstring.token == DocstringToken((1, 0), (1, 13), "", '"""')
+        assert method_docstring.token == DocstringToken((5, 19), (7, 5), "r", "'''")
+        assert module_docstring.indent == ""
+        assert method_docstring.indent == " " * 19
+
+    # The source lines at the docstrings' positions suffice
+    assert counts["tokenize"] == 0
+
+
+def test_token_columns_count_characters(tmp_path: Path) -> None:
+    module = parse_module("def f(a='äö'): u'''Doc.'''\n", tmp_path / "module.py")
+
+    assert Docstring(module.body[0], Convention.NONE).token == DocstringToken(
+        (1, 15), (1, 26), "u", "'''"
+    )
+
+
+def test_token_is_found_by_tokenizer_without_column(tmp_path: Path) -> None:
+    module = parse_module("class A:\n    (\n        r'Doc.'\n    )\n", tmp_path / "module.py")
+    module.body[0].doc_node.col_offset = None
+
+    with count_operations() as counts:
+        token = Docstring(module.body[0], Convention.NONE).token
+
+    assert token == DocstringToken((3, 8), (3, 15), "r", "'")
+    assert counts["tokenize"] == 1
+
+
+@pytest.mark.parametrize(
+    ("docstring", "expected"),
+    [
+        ("Summary.", Summary("Summary.", "Summary.", "Summary", ".", "", "")),
+        ("  This is it!  ", Summary("This is it!", "This", "This", "!", "  ", "  ")),
+        ("\n    Summary\n\n    More.\n    ", Summary("Summary", "Summary", "Summary", "y", "", "")),
+        (" Returns `x` \n", Summary("Returns `x`", "Returns", "Returns", "`", " ", " ")),
+        ("   ", Summary("", "", "", "", "   ", "")),
+    ],
+)
+def test_summary_describes_the_first_line(docstring: str, expected: Summary) -> None:
+    module = parse_module(f'"""{docstring}"""\n', Path("module.py"))
+
+    assert Docstring(module, Convention.NONE).summary == expected
+
+
+def test_docstring_is_built_once_for_all_checks_of_a_node(tmp_path: Path) -> None:
+    file = tmp_path / "module.py"
+    file.write_text('"""this Returns the Summary"""\n')
+
+    with count_operations() as counts:
+        errors = check_source(file, Configuration(convention=Convention.ALL))
+
+    assert {error.error_code() for error in errors} >= {"D400", "D403", "D404"}
+    assert counts["docstring"] == 1
+
+
+def test_no_syntax_tree_is_kept_after_checking(tmp_path: Path) -> None:
+    file = tmp_path / "module.py"
+    file.write_text('"""Module."""\n\n\ndef function():\n    """Function."""\n')
+
+    assert check_source(file, Configuration(convention=Convention.NONE, select="D400")) == []
+
+    gc.collect()
+
+    assert not any(isinstance(obj, Module) and obj.file == str(file) for obj in gc.get_objects())
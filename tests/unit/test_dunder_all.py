@@ -0,0 +1,167 @@
+from pathlib import Path
+from typing import Dict, FrozenSet, List, Optional, Set
+
+import astroid
+import pytest
+
+from lintel import (
+    Configuration,
+    Convention,
+    check_source,
+    count_operations,
+    get_dunder_all,
+    parse_module,
+)
+
+
+def _write_package(directory: Path, files: Dict[str, str]) -> None:
+    for name, source in files.items():
+        file = directory / name
+        file.parent.mkdir(parents=True, exist_ok=True)
+        file.write_text(source)
+
+
+@pytest.mark.parametrize(
+    ("source", "expected"),
+    [
+        ("x = 1\n", None),
+        ("__all__ = ['a', 'b']\n", {"a", "b"}),
+        ("__all__ = ('a',)\n", {"a"}),
+        ("__all__: list = ['a']\n", {"a"}),
+        ("__all__ = ['a'] + ['b']\n", {"a", "b"}),
+        ("__all__ = ['a']\n__all__ += ['b']\n", {"a", "b"}),
+        ("__all__ = ['a']\n__all__.extend(['b'])\n", {"a", "b"}),
+        ("__all__ = ['a']\n__all__.append('b')\n", {"a", "b"}),
+        ("_names = ['a']\n__all__ = [*_names, 'b']\n", {"a", "b"}),
+        ("__all__ = get_names()\n", None),
+        ("__all__ = ['a']\n__all__ += get_names()\n", {"a"}),
+        ("__all__ = ['a']\n__all__.extend(get_names())\n", {"a"}),
+        ("__all__ = ['a']\nif x:\n    __all__ = ['b']\n", {"a", "b"}),
+        ("if x:\n    __all__ = ['a']\nelse:\n    __all__ = ('b',)\n", {"a", "b"}),
+        ("__all__ = ['a']\nif hasattr(os, 'fork'):\n    __all__ += ['b']\n", {"a", "b"}),
+        ("__all__ = ['a']\nif x:\n    __all__ = get_names()\n", {"a"}),
+        (
+            "__all__ = ['a']\n"
+            "try:\n"
+            "    from _c import b\n"
+            "    __all__.append('b')\n"
+            "except ImportError:\n"
+            "    pass\n"
+            "else:\n"
+            "    __all__.append('c')\n"
+            "finally:\n"
+            "    __all__.extend(['d'])\n",
+            {"a", "b", "c", "d"},
+        ),
+        ("__all__ = ['a']\nfor name in names:\n    __all__.append(name)\n", {"a"}),
+        ("__all__ = ['a']\ndef f():\n    __all__ = ['b']\n", {"a"}),
+        ("if x:\n    __all__ = get_names()\n", None),
+        ("from os import __all__\n", None),
+    ],
+)
+def test_dunder_all_is_evaluated_statically(source: str, expected: Optional[Set[str]]) -> None:
+    assert get_dunder_all(astroid.parse(source)) == expected
+
+
+def test_imported_dunder_all_is_resolved_across_modules(tmp_path: Path) -> None:
+    _write_package(
+        tmp_path,
+        {
+            "package/__init__.py": "from .relative import __all__ as relative_all\n"
+            "from package.sub import absolute\n"
+            "__all__ = ['a'] + relative_all + absolute.__all__\n",
+            "package/relative.py": "__all__ = ['b']\n",
+            "package/sub/__init__.py": "",
+            "package/sub/absolute.py": "__all__ = ('c',)\n",
+        },
+    )
+    file = tmp_path / "package" / "__init__.py"
+
+    assert get_dunder_all(parse_module(file.read_text(), file)) == {"a", "b", "c"}
+
+
+def test_circular_dunder_all_imports_are_not_known(tmp_path: Path) -> None:
+    _write_package(
+        tmp_path,
+        {
+            "first.py": "from second import __all__ as other\n__all__ = ['a'] + other\n",
+            "second.py": "from first import __all__ as other\n__all__ = ['b'] + other\n",
+        },
+    )
+    file = tmp_path / "first.py"
+
+    assert get_dunder_all(parse_module(file.read_text(), file)) is None
+
+
+def test_dunder_all_of_every_module_is_evaluated_once(tmp_path: Path) -> None:
+    shared = "__all__ = ['shared']\n"
+    importer = "from .shared import __all__ as shared\n__all__ = ['func'] + shared\n\ndef func():\n    pass\n"
+    _write_package(
+        tmp_path,
+        {
+            "package/__init__.py": "",
+            "package/shared.py": shared,
+            **{f"package/module_{i}.py": importer for i in range(3)},
+        },
+    )
+    config = Configuration(convention=Convention.ALL)
+
+    with count_operations() as counts:
+        errors = [
+            error
+            for file in sorted((tmp_path / "package").glob("module_*.py"))
+            for error in check_source(file, config)
+        ]
+
+    assert counts["dunder_all_scan"] == 4
+    # Checked modules are evaluated from their tree and only the shared module is parsed again
+    assert counts["ast_parse"] == 4
+    assert {error.node_name for error in errors if error.error_code() == "D103"} == {"func"}
+
+
+def test_changed_dunder_all_is_evaluated_again(tmp_path: Path) -> None:
+    _write_package(
+        tmp_path,
+        {
+            "package/__init__.py": "",
+            "package/module.py": "__all__ = ['a']\n\ndef a():\n    pass\n\ndef b():\n    pass\n",
+            "package/importer.py": "from .module import __all__ as names\n__all__ = names\n",
+        },
+    )
+    module_file = tmp_path / "package" / "module.py"
+    importer_file = tmp_path / "package" / "importer.py"
+    config = Configuration(convention=Convention.NONE, select="D103")
+
+    def _get_names() -> List[Optional[FrozenSet[str]]]:
+        return [
+            get_dunder_all(parse_module(file.read_text(), file))
+            for file in (module_file, importer_file)
+        ]
+
+    assert [error.node_name for error in check_source(module_file, config)] == ["a"]
+    assert _get_names() == [{"a"}, {"a"}]
+
+    module_file.write_text(module_file.read_text().replace("['a']", "['a', 'b']"))
+
+    assert sorted(error.node_name for error in check_source(module_file, config)) == ["a", "b"]
+    assert _get_names() == [{"a", "b"}, {"a", "b"}]
+
+    with count_operations() as counts:
+        assert _get_names() == [{"a", "b"}, {"a", "b"}]
+
+    assert counts["dunder_all_scan"] == 0
+
+
+@pytest.mark.parametrize(
+    "file_name",
+    [file.name for file in sorted((Path(__file__).parents[1] / "resources").glob("*.py"))],
+)
+def test_dunder_all_matches_astroid(file_name: str, resource_dir: Path) -> None:
+    file = resource_dir / file_name
+    module = astroid.parse(file.read_text(), path=file.as_posix())
+    public_names = set(module.public_names())
+
+    expected = set(module.wildcard_import_names())
+    dunder_all = get_dunder_all(module)
+
+    assert (public_names if dunder_all is None else dunder_all) == expected
@@ -1,6 +1,7 @@
+import os
 from pathlib import Path
 
-from lintel import Configuration, discover_files
+from lintel import Configuration, discover_files, iter_files, sort_by_recency
 
 
 def test_file_discovery(discovery_dir: Path) -> None:
@@ -39,3 +40,22 @@ def test_file_discovery(discovery_dir: Path) -> None:
     assert top_level_file in files
     assert first_file in files
     assert second_file in files
+
+
+def test_files_are_discovered_lazily(discovery_dir: Path) -> None:
+    files = iter_files([discovery_dir, discovery_dir / "top_level.py"], Configuration())
+
+    first_file = next(files)
+
+    assert first_file.parent == discovery_dir or first_file.parent.parent == discovery_dir
+    assert {first_file, *files} == discover_files([discovery_dir], Configuration())
+
+
+def test_files_are_sorted_by_recency(discovery_dir: Path) -> None:
+    files = sorted(discover_files([discovery_dir], Configuration()))
+
+    for mtime, file in enumerate(files):
+        os.utime(file, (mtime, mtime))
+
+    assert sort_by_recency(files) == files[::-1]
+    assert sort_by_recency([*files, discovery_dir / "missing.py"])[-1].name == "missing.py"
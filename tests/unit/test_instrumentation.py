@@ -0,0 +1,125 @@
+from collections import Counter
+from pathlib import Path
+
+import pytest
+
+from lintel import (
+    Configuration,
+    check_source,
+    count_operation,
+    count_operations,
+    discover_files,
+    get_checks,
+)
+from lintel.bench import CorpusSpec, Style, generate_corpus
+
+# Allow for a bit of noise since corpora of different sizes are not exactly proportional
+MAX_SCALING_FACTOR = 2.2
+
+# Operations per line of a docstring, which depend on the random content of the docstrings and
+# not only on their number, see the per-line budgets instead
+PER_LINE_OPERATIONS = {"section_line", "argument_line"}
+
+
+def _count_corpus(directory: Path, spec: CorpusSpec) -> "Counter[str]":
+    corpus = generate_corpus(directory, spec)
+    config = Configuration(convention=spec.style.convention)
+
+    with count_operations() as counts:
+        for file in corpus.files:
+            check_source(file, config)
+
+    return counts
+
+
+def test_count_operations_only_counts_within_context() -> None:
+    count_operation("test_operation")
+
+    with count_operations() as counts:
+        count_operation("test_operation")
+        count_operation("test_operation")
+
+    count_operation("test_operation")
+
+    assert counts == {"test_operation": 2}
+
+
+@pytest.mark.parametrize("style", list(Style))
+def test_every_file_is_parsed_and_decoded_once(tmp_path: Path, style: Style) -> None:
+    counts = _count_corpus(tmp_path, CorpusSpec(style=style, n_files=3))
+
+    assert counts["astroid_parse"] == 3
+    assert counts["ast_parse"] == 3
+    assert counts["tokenize"] == 0
+    assert counts["source_decode"] == 3
+    assert counts["regex_compile"] == 0
+
+
+@pytest.mark.parametrize("style", list(Style))
+def test_operations_scale_linearly_with_files(tmp_path: Path, style: Style) -> None:
+    base = _count_corpus(tmp_path / "base", CorpusSpec(style=style, n_files=2))
+    double = _count_corpus(tmp_path / "double", CorpusSpec(style=style, n_files=4))
+
+    for operation, count in double.items():
+        if operation not in PER_LINE_OPERATIONS:
+            assert count <= MAX_SCALING_FACTOR * base[operation], operation
+
+
+@pytest.mark.parametrize("style", list(Style))
+def test_operations_scale_linearly_with_definitions(tmp_path: Path, style: Style) -> None:
+    base = _count_corpus(tmp_path / "base", CorpusSpec(style=style, definitions_per_file=10))
+    double = _count_corpus(tmp_path / "double", CorpusSpec(style=style, definitions_per_file=20))
+
+    for operation, count in double.items():
+        if operation not in PER_LINE_OPERATIONS:
+            assert count <= MAX_SCALING_FACTOR * base[operation], operation
+
+
+@pytest.mark.parametrize("style", list(Style))
+def test_per_definition_budgets(tmp_path: Path, style: Style) -> None:
+    spec = CorpusSpec(style=style, n_files=2, definitions_per_file=10)
+    n_nodes = spec.n_files * (spec.definitions_per_file + 1)
+    n_checks = len(get_checks())
+
+    counts = _count_corpus(tmp_path, spec)
+
+    assert counts["check_iteration"] <= n_checks * n_nodes
+    assert counts["docstring"] <= n_nodes
+    assert counts["parse_sections"] <= counts["docstring"]
+    assert counts["source_decode"] == spec.n_files
+
+    n_lines = sum(len(file.read_text().splitlines()) for file in tmp_path.rglob("*.py"))
+
+    for operation in PER_LINE_OPERATIONS:
+        assert counts[operation] <= n_lines, operation
+
+
+def test_is_public_scales_linearly_with_nesting(tmp_path: Path) -> None:
+    def count_is_public(depth: int) -> int:
+        source = "".join(
+            f"{'    ' * level}class Class{level}:\n    {'    ' * level}def method(self): pass\n"
+            for level in range(depth)
+        )
+        file = tmp_path / f"nested_{depth}.py"
+        file.write_text(source)
+
+        with count_operations() as counts:
+            check_source(file)
+
+        return counts["is_public"]
+
+    assert count_is_public(20) <= MAX_SCALING_FACTOR * count_is_public(10)
+
+
+def test_regexes_from_the_config_are_compiled_once(tmp_path: Path) -> None:
+    generate_corpus(tmp_path / "package", CorpusSpec(n_files=5))
+    config = Configuration(match=r"module_\d+\.py", match_dir=r"[^\.].*")
+
+    with count_operations() as first:
+        discover_files([tmp_path], config)
+
+    with count_operations() as second:
+        discover_files([tmp_path], config)
+
+    assert first["regex_compile"] <= 2
+    assert second["regex_compile"] == 0
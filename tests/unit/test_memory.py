@@ -0,0 +1,76 @@
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+from lintel import Configuration, MemoryProfiler, check_source
+from lintel.bench import CorpusSpec, generate_corpus
+from lintel.cli import app
+
+_runner = CliRunner(mix_stderr=False, env={"LINTEL_TESTING": "True"})
+
+
+def test_memory_profiler_records_files_phases_and_sites(tmp_path: Path) -> None:
+    corpus = generate_corpus(tmp_path, CorpusSpec(n_files=2, definitions_per_file=5))
+    profiler = MemoryProfiler()
+
+    profiler.start()
+
+    try:
+        for file in corpus.files:
+            check_source(file, Configuration(convention=corpus.spec.style.convention), profiler)
+    finally:
+        profiler.stop()
+
+    assert set(profiler.files) == set(corpus.files)
+    assert set(profiler.phases) == {"read", "parse", "noqa", "traversal", "checks"}
+
+    for usage in profiler.files.values():
+        assert usage.peak > 0
+        # Parsing allocates most of the memory
+        assert usage.peak >= profiler.phases["read"].peak
+
+    assert profiler.phases["parse"].peak > profiler.phases["read"].peak
+
+    sites = profiler.largest_sites(3)
+
+    assert len(sites) == 3
+    assert sites[0].size >= sites[1].size >= sites[2].size
+
+
+def test_nested_contexts_share_the_peak() -> None:
+    profiler = MemoryProfiler()
+
+    profiler.start()
+
+    try:
+        with profiler.file(Path("file.py")):
+            with profiler.phase("parse"):
+                data = bytearray(2 * 2**20)
+                del data
+    finally:
+        profiler.stop()
+
+    assert profiler.phases["parse"].peak >= 2**20
+    assert profiler.files[Path("file.py")].peak >= 2**20
+    assert profiler.files[Path("file.py")].retained < 2**20
+
+
+def test_nothing_is_recorded_without_tracing() -> None:
+    profiler = MemoryProfiler()
+
+    with profiler.phase("parse"):
+        pass
+
+    assert profiler.phases["parse"].peak == 0
+
+
+def test_memory_report_cli(tmp_path: Path) -> None:
+    generate_corpus(tmp_path / "project", CorpusSpec(n_files=2, definitions_per_file=5))
+
+    result = _runner.invoke(app, [str(tmp_path / "project"), "--memory-threshold", "0"])
+
+    assert result.exit_code == 0
+    assert "Memory per phase" in result.stdout
+    assert "Largest allocation sites" in result.stdout
+    assert "module_0.py: Peak memory of" in result.stdout
+    assert "exceeds 0.0 MB" in result.stdout
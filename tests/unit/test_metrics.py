@@ -0,0 +1,89 @@
+from pathlib import Path
+from typing import List
+
+import pytest
+from astroid.exceptions import AstroidSyntaxError
+from typer.testing import CliRunner
+
+from lintel import (
+    Configuration,
+    DocstringError,
+    MetricsExporter,
+    Observer,
+    check_source,
+    combine_observers,
+)
+from lintel.cli import app
+
+_runner = CliRunner(mix_stderr=False, env={"LINTEL_TESTING": "True"})
+
+
+class _Recorder(Observer):
+    def __init__(self) -> None:
+        self.errors: List[DocstringError] = []
+
+    def error_found(self, error: DocstringError) -> None:
+        self.errors.append(error)
+
+
+def _write_project(directory: Path) -> List[Path]:
+    directory.mkdir()
+    valid = directory / "valid.py"
+    valid.write_text('"""Module."""\n\n\ndef function():\n    pass\n')
+    invalid = directory / "invalid.py"
+    invalid.write_text("def function(:\n    pass\n")
+
+    return [valid, invalid]
+
+
+def test_error_found_hook_receives_every_error(tmp_path: Path) -> None:
+    valid, _ = _write_project(tmp_path / "project")
+    recorder = _Recorder()
+
+    errors = check_source(valid, Configuration(), recorder)
+
+    assert [error.error_code() for error in errors] == ["D103"]
+    assert recorder.errors == errors
+
+
+def test_metrics_exporter(tmp_path: Path) -> None:
+    valid, invalid = _write_project(tmp_path / "project")
+    exporter = MetricsExporter()
+    recorder = _Recorder()
+    observer = combine_observers([exporter, recorder])
+
+    with observer.run():
+        check_source(valid, Configuration(), observer)
+
+        with pytest.raises(AstroidSyntaxError):
+            check_source(invalid, Configuration(), observer)
+
+    assert exporter.files_checked == 1
+    assert exporter.files_failed == 1
+    assert exporter.errors == {"D103": 1}
+    assert len(recorder.errors) == 1
+    assert exporter.run_seconds >= exporter.file_seconds > 0
+
+    text = exporter.as_text()
+
+    assert "lintel_files_checked_total 1\n" in text
+    assert "lintel_files_failed_total 1\n" in text
+    assert 'lintel_errors_total{code="D103"} 1\n' in text
+    assert "lintel_file_duration_seconds_count 2\n" in text
+    assert text.endswith("# EOF\n")
+
+
+def test_metrics_cli(tmp_path: Path) -> None:
+    _write_project(tmp_path / "project")
+    metrics = tmp_path / "metrics" / "lintel.prom"
+
+    result = _runner.invoke(app, [str(tmp_path / "project"), "--metrics", str(metrics)])
+
+    assert result.exit_code == 1
+
+    text = metrics.read_text()
+
+    assert "lintel_files_checked_total 1\n" in text
+    assert "lintel_files_failed_total 1\n" in text
+    assert "lintel_last_run_timestamp_seconds" in text
+    assert not list(metrics.parent.glob(".*.tmp"))
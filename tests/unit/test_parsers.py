@@ -0,0 +1,50 @@
+from pathlib import Path
+from typing import List
+
+import pytest
+from astroid import AstroidSyntaxError, FunctionDef
+
+from lintel import Configuration, Convention, Parser, check_source, parse_module
+
+RESOURCE_DIR = Path(__file__).parents[1] / "resources"
+
+
+def _check(file: Path, parser: Parser) -> List[str]:
+    config = Configuration(convention=Convention.ALL, parser=parser)
+
+    return sorted(str(error) for error in check_source(file, config))
+
+
+@pytest.mark.parametrize("file", sorted(RESOURCE_DIR.glob("*.py")), ids=lambda file: file.name)
+def test_parsers_find_the_same_errors(file: Path) -> None:
+    assert _check(file, Parser.AST) == _check(file, Parser.ASTROID)
+
+
+def test_ast_parser_only_keeps_what_checks_need(tmp_path: Path) -> None:
+    source = (
+        "def function():\n"
+        '    """Docstring."""\n'
+        "    import os\n"
+        "    value = os.sep\n"
+        "\n"
+        "    def nested():\n"
+        "        return value\n"
+        "\n"
+        "    return nested\n"
+    )
+
+    module = parse_module(source, tmp_path / "module.py", Parser.AST)
+    (function_,) = module.body
+
+    assert isinstance(function_, FunctionDef)
+    assert function_.doc_node.value == "Docstring."
+    assert function_.end_lineno == 9
+    assert [type(node).__name__ for node in function_.body] == ["Import", "FunctionDef"]
+    assert function_.body[1].body == []
+    assert module.file == str(tmp_path / "module.py")
+
+
+@pytest.mark.parametrize("parser", list(Parser))
+def test_syntax_errors_are_raised_as_astroid_errors(tmp_path: Path, parser: Parser) -> None:
+    with pytest.raises(AstroidSyntaxError):
+        parse_module("def function(:\n", tmp_path / "module.py", parser)
@@ -0,0 +1,73 @@
+import json
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+from lintel import PHASES, Configuration, Profiler, check_source, get_error_codes
+from lintel.bench import CorpusSpec, generate_corpus
+from lintel.cli import app
+
+_runner = CliRunner(mix_stderr=False, env={"LINTEL_TESTING": "True"})
+
+
+def test_profiler_records_phases_checks_files_and_definitions(tmp_path: Path) -> None:
+    corpus = generate_corpus(tmp_path, CorpusSpec(n_files=2, definitions_per_file=5))
+    config = Configuration(convention=corpus.spec.style.convention)
+    profiler = Profiler()
+
+    for file in corpus.files:
+        check_source(file, config, profiler)
+
+    assert set(profiler.phases) == set(PHASES)
+
+    for phase in ("read", "parse", "noqa", "traversal", "checks"):
+        assert profiler.phases[phase] > 0
+
+    assert set(profiler.checks) == get_error_codes(config)
+
+    for timing in profiler.checks.values():
+        assert timing.calls == 2 * 6  # Five definitions plus the module per file
+        assert 0 < timing.mean <= timing.max <= timing.total
+
+    assert set(profiler.files) == set(corpus.files)
+    assert len(profiler.definitions) == 2 * 6
+
+
+def test_slowest_files_and_definitions_are_sorted(tmp_path: Path) -> None:
+    corpus = generate_corpus(tmp_path, CorpusSpec(n_files=3, definitions_per_file=5))
+    profiler = Profiler()
+
+    for file in corpus.files:
+        check_source(file, Configuration(convention=corpus.spec.style.convention), profiler)
+
+    slowest_files = profiler.slowest_files(2)
+    slowest_definitions = profiler.slowest_definitions(4)
+
+    assert [seconds for _, seconds in slowest_files] == sorted(
+        profiler.files.values(), reverse=True
+    )[:2]
+    assert len(slowest_definitions) == 4
+    assert [seconds for _, seconds in slowest_definitions] == sorted(
+        profiler.definitions.values(), reverse=True
+    )[:4]
+
+
+def test_profile_cli(tmp_path: Path) -> None:
+    generate_corpus(tmp_path / "project", CorpusSpec(n_files=2, definitions_per_file=5))
+    output = tmp_path / "profile.json"
+
+    result = _runner.invoke(
+        app, [str(tmp_path / "project"), "--profile-output", str(output), "--profile-top", "1"]
+    )
+
+    assert result.exit_code == 0
+    assert "Phases" in result.stdout
+    assert "Slowest definitions" in result.stdout
+
+    profile = json.loads(output.read_text())
+
+    assert list(profile["phases"]) == list(PHASES)
+    assert profile["phases"]["discovery"] > 0
+    assert len(profile["slowest_files"]) == 1
+    assert len(profile["slowest_definitions"]) == 1
+    assert profile["checks"]
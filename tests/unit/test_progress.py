@@ -0,0 +1,108 @@
+import io
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+from lintel import Configuration, ProgressMeter, check_source
+from lintel.bench import CorpusSpec, generate_corpus
+from lintel.cli import app
+
+_runner = CliRunner(mix_stderr=False, env={"LINTEL_TESTING": "True"})
+
+
+def test_periodic_status_lines(tmp_path: Path) -> None:
+    corpus = generate_corpus(tmp_path, CorpusSpec(n_files=3, definitions_per_file=2))
+    stream = io.StringIO()
+    meter = ProgressMeter(stream, interactive=False, interval=0)
+
+    with meter.run():
+        meter.files_discovered(len(corpus.files))
+
+        for file in corpus.files:
+            check_source(file, Configuration(convention=corpus.spec.style.convention), meter)
+
+    lines = stream.getvalue().splitlines()
+
+    assert lines[0].startswith("Checked 0/3 files | 0.0 files/s | ETA ? |")
+    assert lines[1].startswith("Checked 1/3 files")
+    assert lines[-1].startswith("Checked 3/3 files")
+    assert "ETA 0:00:00" in lines[-1]
+    assert meter.done == 3
+    assert 0 < meter.utilization <= 1
+
+
+def test_updates_are_throttled() -> None:
+    stream = io.StringIO()
+    meter = ProgressMeter(stream, interactive=False, interval=3600)
+
+    with meter.run():
+        meter.files_discovered(100)
+
+        for i_file in range(100):
+            with meter.file(Path(f"file_{i_file}.py")):
+                pass
+
+    # The first update and the final status
+    assert len(stream.getvalue().splitlines()) == 2
+
+
+def test_periodic_status_only_shows_long_runs() -> None:
+    for interval, n_lines in [(3600, 0), (0, 3)]:
+        stream = io.StringIO()
+        meter = ProgressMeter(
+            stream, interactive=False, interval=interval, report_start_and_end=False
+        )
+
+        with meter.run():
+            meter.files_discovered(2)
+
+            with meter.file(Path("file.py")):
+                pass
+
+        assert len(stream.getvalue().splitlines()) == n_lines
+
+
+def test_interactive_status_is_redrawn_in_place() -> None:
+    stream = io.StringIO()
+    meter = ProgressMeter(stream, interactive=True, interval=0)
+
+    with meter.run():
+        meter.files_discovered(2)
+
+        with meter.file(Path("file.py")):
+            pass
+
+    output = stream.getvalue()
+
+    assert output.count("\r\x1b[KChecked") == 3
+    assert output.endswith("\n")
+    assert output.count("\n") == 1
+
+
+def test_interactive_status_makes_room_for_errors(tmp_path: Path) -> None:
+    file = tmp_path / "file.py"
+    file.write_text("def function():\n    pass\n")
+    stream = io.StringIO()
+    meter = ProgressMeter(stream, interactive=True, interval=0)
+
+    with meter.run():
+        meter.files_discovered(1)
+        check_source(file, Configuration(), meter)
+        end_of_file = len(stream.getvalue())
+
+    # The status line was cleared and not redrawn before the errors are reported
+    assert stream.getvalue()[:end_of_file].endswith("\r\x1b[K")
+
+
+def test_progress_cli(tmp_path: Path) -> None:
+    generate_corpus(tmp_path, CorpusSpec(n_files=2, definitions_per_file=2))
+
+    with_progress = _runner.invoke(app, [str(tmp_path), "--progress"])
+    by_default = _runner.invoke(app, [str(tmp_path)])
+    without_progress = _runner.invoke(app, [str(tmp_path), "--no-progress"])
+
+    assert with_progress.exit_code == 0
+    assert "Checked 2/2 files" in with_progress.stderr
+    # Stderr is not a terminal and the run is shorter than the interval of periodic updates
+    assert by_default.stderr == ""
+    assert without_progress.stderr == ""
@@ -0,0 +1,133 @@
+import io
+import json
+import xml.etree.ElementTree as ElementTree
+from pathlib import Path
+from typing import List, Tuple
+
+import pytest
+from typer.testing import CliRunner
+
+from lintel import (
+    REPORTERS,
+    Configuration,
+    Convention,
+    ErrorRecord,
+    GitHubReporter,
+    JUnitReporter,
+    OutputFormat,
+    check_source,
+)
+from lintel.cli import app
+
+_runner = CliRunner(mix_stderr=False, env={"LINTEL_TESTING": "True"})
+
+
+def _write_project(directory: Path) -> List[Path]:
+    directory.mkdir()
+    files = [directory / "a.py", directory / "b.py", directory / "c.py"]
+    files[0].write_text("def function():\n    pass\n\n\ndef other():\n    pass\n")
+    files[1].write_text('"""Module."""\n')
+    files[2].write_text("class Class:\n    pass\n")
+
+    return files
+
+
+def _report(directory: Path, output_format: OutputFormat) -> Tuple[List[ErrorRecord], str]:
+    config = Configuration(convention=Convention.NONE, select={"D101", "D103"})
+    stream = io.StringIO()
+    reporter = REPORTERS[output_format](stream)
+    all_records: List[ErrorRecord] = []
+
+    reporter.start()
+
+    for file in _write_project(directory):
+        records = [error.to_record() for error in check_source(file, config)]
+        all_records.extend(records)
+        reporter.report(file, records)
+
+    reporter.finish()
+
+    return all_records, stream.getvalue()
+
+
+def test_record_matches_error(tmp_path: Path) -> None:
+    file = tmp_path / "file.py"
+    file.write_text("def function():\n    pass\n")
+
+    (error,) = check_source(file, Configuration(convention=Convention.NONE, select={"D103"}))
+    record = error.to_record()
+
+    assert str(record) == str(error)
+    assert record.message == error.message
+    assert record == ErrorRecord("D103", error.file_name, 1, "function", "function", record[-1])
+
+
+def test_jsonl(tmp_path: Path) -> None:
+    records, output = _report(tmp_path / "project", OutputFormat.JSONL)
+
+    assert [json.loads(line) for line in output.splitlines()] == [r.as_dict() for r in records]
+
+
+def test_sarif(tmp_path: Path) -> None:
+    records, output = _report(tmp_path / "project", OutputFormat.SARIF)
+
+    (run,) = json.loads(output)["runs"]
+
+    assert [rule["id"] for rule in run["tool"]["driver"]["rules"]] == ["D103", "D101"]
+    assert [result["ruleId"] for result in run["results"]] == [r.code for r in records]
+    assert [
+        result["locations"][0]["physicalLocation"]["region"]["startLine"]
+        for result in run["results"]
+    ] == [r.line for r in records]
+
+
+def test_junit(tmp_path: Path) -> None:
+    _, output = _report(tmp_path / "project", OutputFormat.JUNIT)
+
+    testcases = ElementTree.fromstring(output).findall("./testsuite/testcase")
+
+    assert [Path(case.attrib["name"]).name for case in testcases] == ["a.py", "b.py", "c.py"]
+    assert [case.find("failure") is not None for case in testcases] == [True, False, True]
+    assert testcases[0].find("failure").attrib["message"] == "2 docstring errors"  # type: ignore
+
+
+def test_github_escapes_values() -> None:
+    stream = io.StringIO()
+    record = ErrorRecord("D400", "dir,1/file:a.py", 0, "module", "file", "100% wrong\nreally")
+
+    GitHubReporter(stream).report(Path(record.file), [record])
+
+    assert stream.getvalue() == (
+        "::error file=dir%2C1/file%3Aa.py,line=1,title=lintel D400::D400: 100%25 wrong%0Areally\n"
+    )
+
+
+@pytest.mark.parametrize("output_format", [f.value for f in REPORTERS])
+def test_only_the_report_goes_to_stdout(tmp_path: Path, output_format: str) -> None:
+    _write_project(tmp_path / "project")
+    (tmp_path / "project" / "invalid.py").write_text("def function(:\n")
+
+    result = _runner.invoke(
+        app,
+        [str(tmp_path / "project"), "--format", output_format, "--convention", "none"],
+        catch_exceptions=False,
+    )
+
+    assert result.exit_code == 1
+    assert "Cannot parse file" in result.stderr
+    assert "Found 0 errors in 4 files." in result.stderr
+    assert "Found" not in result.stdout
+
+
+def test_junit_marks_skipped_files() -> None:
+    stream = io.StringIO()
+    reporter = JUnitReporter(stream)
+
+    reporter.start()
+    reporter.skip(Path("file.py"))
+    reporter.finish()
+
+    (testcase,) = ElementTree.fromstring(stream.getvalue()).findall("./testsuite/testcase")
+
+    assert testcase.attrib["name"] == "file.py"
+    assert testcase.find("skipped") is not None
@@ -0,0 +1,180 @@
+import ast
+import time
+from pathlib import Path
+from typing import List
+
+import pytest
+from astroid import AstroidSyntaxError
+
+from lintel import (
+    Configuration,
+    Convention,
+    Parser,
+    Skeleton,
+    check_source,
+    count_operations,
+    get_all_error_codes,
+    scan_skeleton,
+)
+from lintel.bench import CorpusSpec, generate_corpus
+
+
+def _scan(source: str) -> Skeleton:
+    return scan_skeleton(ast.parse(source), source)
+
+
+def test_skeleton_finds_checked_definitions_and_docstrings() -> None:
+    skeleton = _scan(
+        '"""Module."""\n'
+        "\n"
+        "@decorator\n"
+        "class Class:\n"
+        "    r'''Class.'''\n"
+        "\n"
+        "    async def __call__(self, value={'a': 'b'}): u'Method.'\n"
+        "\n"
+        "    attribute: 'str' = call('not a docstring')\n"
+        "\n"
+        "    if condition:\n"
+        "        def unchecked(): 'Not checked.'\n"
+    )
+
+    assert skeleton.n_definitions == 2
+    assert skeleton.has_module_docstring
+    assert skeleton.docstring_lines == (1, 5, 7)
+    assert skeleton.dunder_definitions == (7,)
+    assert skeleton.skipped_error_codes == set()
+
+
+def test_skeleton_finds_module_wide_suppressions() -> None:
+    skeleton = _scan("# noqa: D100,D101\nimport os  # lintel: noqa\n# lintel: noqa\n")
+
+    assert skeleton.skipped_error_codes == get_all_error_codes()
+
+    skeleton = _scan("# noqa: D100,D101\nimport os  # noqa: D102\n")
+
+    assert skeleton.skipped_error_codes == {"D100", "D101"}
+
+
+@pytest.mark.parametrize(
+    ("source", "select"),
+    [
+        ("# lintel: noqa\ndef function():\n    pass\n", "D100,D103"),
+        ("# noqa: D100,D103\ndef function():\n    pass\n", "D100,D103"),
+        ("def function():\n    pass\n", "D200,D300,D400"),
+        ('"""Module."""\n', "D103,D201"),
+        ("import os\n", "D101,D103,D200"),
+    ],
+)
+def test_files_without_work_are_not_built(tmp_path: Path, source: str, select: str) -> None:
+    file = tmp_path / "file.py"
+    file.write_text(source)
+
+    with count_operations() as counts:
+        errors = check_source(file, Configuration(convention=Convention.NONE, select=select))
+
+    assert errors == []
+    assert counts["ast_parse"] == 1
+    assert counts["tokenize"] == 0
+    assert counts["astroid_parse"] == 0
+
+
+@pytest.mark.parametrize("parser", list(Parser))
+def test_syntax_errors_are_reported_for_files_without_work(tmp_path: Path, parser: Parser) -> None:
+    file = tmp_path / "file.py"
+    file.write_text("x = = 1\n")
+    config = Configuration(convention=Convention.NONE, select="D400", parser=parser)
+
+    with pytest.raises(AstroidSyntaxError):
+        check_source(file, config)
+
+
+@pytest.mark.parametrize(
+    ("source", "select"),
+    [
+        ("def function():\n    pass\n", "D103"),
+        ("import os\n", "D100"),
+        ('"""module"""\n', "D400"),
+        ("def function(): '''docstring'''\n", "D400"),
+    ],
+)
+def test_files_with_work_are_parsed(tmp_path: Path, source: str, select: str) -> None:
+    file = tmp_path / "file.py"
+    file.write_text(source)
+
+    with count_operations() as counts:
+        errors = check_source(file, Configuration(convention=Convention.NONE, select=select))
+
+    assert [error.error_code() for error in errors] == [select]
+    assert counts["astroid_parse"] == 1
+
+
+def test_skeleton_finds_parenthesized_docstrings() -> None:
+    skeleton = _scan(
+        '("""Module.""")\n'
+        "\n"
+        "\n"
+        "def function():\n"
+        "    (\n"
+        "        (\n"
+        "            r'Function.'\n"
+        "        )\n"
+        "    )\n"
+    )
+
+    assert skeleton.has_module_docstring
+    assert skeleton.docstring_lines == (1, 7)
+
+
+@pytest.mark.parametrize("parser", list(Parser))
+def test_parenthesized_docstrings_are_checked(tmp_path: Path, parser: Parser) -> None:
+    file = tmp_path / "file.py"
+    file.write_text(
+        '"""Module."""\n'
+        "\n"
+        "\n"
+        "def function():\n"
+        "    (\n"
+        '        """Function"""\n'
+        "    )\n"
+        "\n"
+        "\n"
+        "def _private():\n"
+        "    (\n"
+        '        """Private"""\n'
+        "    )\n"
+    )
+    config = Configuration(convention=Convention.NONE, select="D103,D300,D400", parser=parser)
+
+    assert [error.message for error in check_source(file, config)] == [
+        "D400: First line should end with a period (not 'e').",
+        "D400: First line should end with a period (not 'n').",
+    ]
+
+
+def _min_seconds(files: List[Path], config: Configuration) -> float:
+    seconds = []
+
+    for _ in range(3):
+        start = time.perf_counter()
+
+        for file in files:
+            check_source(file, config)
+
+        seconds.append(time.perf_counter() - start)
+
+    return min(seconds)
+
+
+def test_skipping_files_is_faster_than_checking_them(tmp_path: Path) -> None:
+    corpus = generate_corpus(tmp_path, CorpusSpec(n_files=5))
+    config = Configuration(convention=Convention.GOOGLE)
+    skipped_files = []
+
+    for file in corpus.files:
+        skipped_file = file.with_name(f"skipped_{file.name}")
+        skipped_file.write_text("# lintel: noqa\n" + file.read_text())
+        skipped_files.append(skipped_file)
+
+    # The margin is generous, because skipped files are only parsed with the 'ast' module
+    assert _min_seconds(skipped_files, config) < 0.5 * _min_seconds(corpus.files, config)
@@ -0,0 +1,141 @@
+import json
+from pathlib import Path
+from typing import List, NoReturn
+
+import pytest
+from typer.testing import CliRunner
+
+from lintel import Configuration, Convention, DocstringError, Statistics, check_source
+from lintel.checks.mood import D401
+from lintel.cli import app
+
+_runner = CliRunner(mix_stderr=False, env={"LINTEL_TESTING": "True"})
+
+
+def _write_project(directory: Path) -> None:
+    (directory / "package").mkdir(parents=True)
+    (directory / "a.py").write_text("def a():\n    pass\n\n\ndef b():\n    pass\n")
+    (directory / "package" / "c.py").write_text('def c():\n    """Returns c."""\n')
+
+
+def _fail(*args: object) -> NoReturn:
+    raise AssertionError("Error messages must not be formatted")
+
+
+@pytest.fixture(name="no_messages")
+def no_messages_fixture(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(DocstringError, "to_record", _fail)
+    monkeypatch.setattr(DocstringError, "__str__", _fail)
+    monkeypatch.setattr(DocstringError, "formatted_description", property(_fail))
+    monkeypatch.setattr(D401, "formatted_description", property(_fail))
+
+
+def test_statistics_count_per_code_and_directory(tmp_path: Path, no_messages: None) -> None:
+    _write_project(tmp_path)
+    config = Configuration(convention=Convention.NONE, select={"D103", "D401"})
+    statistics = Statistics()
+
+    for file in (tmp_path / "a.py", tmp_path / "package" / "c.py"):
+        check_source(file, config, statistics)
+
+    assert statistics.total == 3
+    assert statistics.sorted_codes() == [("D103", 2), ("D401", 1)]
+    assert statistics.sorted_directories() == [
+        (str(tmp_path), 2),
+        (str(tmp_path / "package"), 1),
+    ]
+
+
+def test_imperative_suggestion_is_computed_lazily(tmp_path: Path) -> None:
+    _write_project(tmp_path)
+
+    (error,) = check_source(
+        tmp_path / "package" / "c.py", Configuration(convention=Convention.NONE, select={"D401"})
+    )
+
+    assert error.parameters is None
+    assert (
+        error.message
+        == "D401: First line should be in imperative mood (perhaps 'Return', not 'Returns')."
+    )
+
+
+def test_statistics_cli(tmp_path: Path, no_messages: None) -> None:
+    _write_project(tmp_path)
+    output = tmp_path / "statistics.json"
+
+    result = _runner.invoke(
+        app,
+        [
+            str(tmp_path),
+            "--convention",
+            "none",
+            "--select",
+            "D103,D401",
+            "--statistics",
+            "--statistics-output",
+            str(output),
+        ],
+    )
+
+    assert result.exit_code == 1
+    assert "Errors per code" in result.stdout
+    assert "Found 3 errors in 2 files." in result.stdout
+    assert json.loads(output.read_text()) == {
+        "total": 3,
+        "codes": {"D103": 2, "D401": 1},
+        "directories": {str(tmp_path): 2, str(tmp_path / "package"): 1},
+    }
+
+
+def test_count_cli(tmp_path: Path, no_messages: None) -> None:
+    _write_project(tmp_path)
+
+    result = _runner.invoke(
+        app, [str(tmp_path), "--convention", "none", "--select", "D103,D401", "--count"]
+    )
+
+    assert result.exit_code == 1
+    assert result.stdout == "3\n"
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_statistics_only_count_returned_errors(
+    tmp_path: Path, no_messages: None, columnar: bool
+) -> None:
+    _write_project(tmp_path)
+    config = Configuration(convention=Convention.NONE, select={"D103", "D400"}, columnar=columnar)
+    statistics = Statistics()
+
+    errors = check_source(tmp_path / "a.py", config, statistics, max_errors=1)
+
+    assert [error.node_name for error in errors] == [
+        error.node_name for error in check_source(tmp_path / "a.py", config)
+    ][:1]
+    assert statistics.total == 1
+
+
+@pytest.mark.parametrize(("args", "n_errors"), [(["--fail-fast"], 1), (["--max-errors", "2"], 2)])
+def test_statistics_cli_respects_error_limit(
+    tmp_path: Path, no_messages: None, args: List[str], n_errors: int
+) -> None:
+    _write_project(tmp_path)
+    output = tmp_path / "statistics.json"
+
+    result = _runner.invoke(
+        app,
+        [
+            str(tmp_path),
+            "--convention",
+            "none",
+            "--select",
+            "D103,D401",
+            "--statistics-output",
+            str(output),
+            *args,
+        ],
+    )
+
+    assert result.exit_code == 1
+    assert f"Found {n_errors} error" in result.stdout
+    assert json.loads(output.read_text())["total"] == n_errors
@@ -0,0 +1,82 @@
+import json
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+from lintel import (
+    CompositeObserver,
+    Configuration,
+    Observer,
+    Profiler,
+    Tracer,
+    check_source,
+    combine_observers,
+)
+from lintel.bench import CorpusSpec, generate_corpus
+from lintel.cli import app
+
+_runner = CliRunner(mix_stderr=False, env={"LINTEL_TESTING": "True"})
+
+
+def test_tracer_records_file_and_phase_spans(tmp_path: Path) -> None:
+    corpus = generate_corpus(tmp_path, CorpusSpec(n_files=2, definitions_per_file=3))
+    tracer = Tracer()
+
+    for file in corpus.files:
+        check_source(file, Configuration(convention=corpus.spec.style.convention), tracer)
+
+    trace = tracer.as_dict()
+    spans = [event for event in trace["traceEvents"] if event["ph"] == "X"]
+    file_spans = [span for span in spans if span["cat"] == "file"]
+
+    assert [span["args"]["path"] for span in file_spans] == [str(f) for f in corpus.files]
+    assert {span["name"] for span in spans if span["cat"] == "phase"} == {
+        "read",
+        "parse",
+        "noqa",
+        "traversal",
+        "checks",
+    }
+
+    for span in spans:
+        file_span = next(f for f in file_spans if f["ts"] <= span["ts"] <= f["ts"] + f["dur"])
+
+        assert span["ts"] + span["dur"] <= file_span["ts"] + file_span["dur"]
+        assert span["tid"] == file_span["tid"]
+
+    assert {event["name"] for event in trace["traceEvents"] if event["ph"] == "M"} == {
+        "process_name",
+        "thread_name",
+    }
+
+
+def test_combine_observers() -> None:
+    profiler = Profiler()
+    tracer = Tracer()
+
+    assert type(combine_observers([])) is Observer
+    assert combine_observers([tracer]) is tracer
+
+    combined = combine_observers([profiler, tracer])
+
+    assert isinstance(combined, CompositeObserver)
+
+    with combined.phase("read"):
+        pass
+
+    assert profiler.phases["read"] > 0
+    assert [event["name"] for event in tracer.events] == ["read"]
+
+
+def test_trace_cli(tmp_path: Path) -> None:
+    generate_corpus(tmp_path / "project", CorpusSpec(n_files=2, definitions_per_file=3))
+    trace = tmp_path / "trace.json"
+
+    result = _runner.invoke(app, [str(tmp_path / "project"), "--trace", str(trace), "--profile"])
+
+    assert result.exit_code == 0
+    assert "Phases" in result.stdout
+
+    span_names = {event["name"] for event in json.loads(trace.read_text())["traceEvents"]}
+
+    assert {"discovery", "reporting", "module_0.py", "module_1.py"} <= span_names
@@ -1,9 +1,11 @@
+from pathlib import Path
 from typing import List, Set
 
 import astroid
 import pytest
+from astroid import AstroidSyntaxError
 
-from lintel import Configuration, _utils
+from lintel import Configuration, Convention, _utils, check_source, count_operations
 
 __all__ = ()
 
@@ -56,3 +58,67 @@ def test_get_decorator_names(code: str, expected_decorators: Set[str]) -> None:
     node = list(f for f in astroid.parse(code).get_children() if f.name == "func")[0]
     assert isinstance(node, astroid.FunctionDef)
     assert _utils.get_decorator_names(node) == expected_decorators
+
+
+@pytest.mark.parametrize(
+    ("data", "expected_text", "expected_encoding"),
+    [
+        (b"x = '\xc3\xa9'\n", "x = '\u00e9'\n", "utf-8"),
+        (b"\xef\xbb\xbfx = 1\n", "x = 1\n", "utf-8-sig"),
+        (
+            b"# -*- coding: latin-1 -*-\nx = '\xe9'\n",
+            "# -*- coding: latin-1 -*-\nx = '\u00e9'\n",
+            "iso-8859-1",
+        ),
+        (
+            b"#!/usr/bin/env python\n# coding=cp1252\nx = '\x80'\n",
+            "#!/usr/bin/env python\n# coding=cp1252\nx = '\u20ac'\n",
+            "cp1252",
+        ),
+    ],
+)
+def test_read_source_detects_the_declared_encoding(
+    tmp_path: Path, data: bytes, expected_text: str, expected_encoding: str
+) -> None:
+    file = tmp_path / "module.py"
+    file.write_bytes(data)
+
+    source = _utils.read_source(file)
+
+    assert source == (data, expected_text, expected_encoding)
+
+
+@pytest.mark.parametrize(
+    "data", [b"x = '\xe9'\n", b"# coding: unknown-encoding\nx = 1\n"], ids=["invalid", "unknown"]
+)
+def test_read_source_fails_on_undecodable_files(tmp_path: Path, data: bytes) -> None:
+    file = tmp_path / "module.py"
+    file.write_bytes(data)
+
+    with pytest.raises(AstroidSyntaxError):
+        _utils.read_source(file)
+
+
+def test_source_lines_are_split_like_python_counts_lines() -> None:
+    module = astroid.parse("x = 1\r\ny = '\x0c\u2028'\rz = 3\n\n")
+
+    assert _utils.get_source_lines(module) == ["x = 1", "y = '\x0c\u2028'", "z = 3", ""]
+
+
+def test_files_with_coding_comments_are_decoded_once(tmp_path: Path) -> None:
+    file = tmp_path / "module.py"
+    file.write_bytes(
+        b"# -*- coding: latin-1 -*-\n"
+        b'"""Caf\xe9 module."""\n\n\n'
+        b"def function():  # noqa: D103\n    pass\n\n\n"
+        b"class Class:\n"
+        b'    """\xc9t\xe9 class"""\n'
+    )
+
+    with count_operations() as counts:
+        errors = check_source(file, Configuration(convention=Convention.DEFAULT))
+
+    assert [error.message for error in errors] == [
+        "D400: First line should end with a period (not 's').",
+    ]
+    assert counts["source_decode"] == 1
@@ -0,0 +1,56 @@
+import pkgutil
+import subprocess
+import sys
+
+import pytest
+
+import lintel
+from lintel import _wordlists, get_imperative_blacklist, get_imperative_verbs, stem
+
+
+def test_shipped_imperative_stems_are_up_to_date() -> None:
+    """Regenerate the table with `lintel._wordlists.write_imperative_stems()` if this fails."""
+    imperative_verbs = _wordlists.make_imperative_verbs_dict(
+        _wordlists.load_wordlist('imperatives.txt')
+    )
+
+    shipped = pkgutil.get_data('lintel', 'data/' + _wordlists.IMPERATIVE_STEMS_FILE)
+
+    assert shipped is not None
+    assert shipped.decode('utf8') == _wordlists.dump_imperative_verbs(imperative_verbs)
+    assert get_imperative_verbs() == {
+        stemmed: frozenset(forms) for stemmed, forms in imperative_verbs.items()
+    }
+
+
+def test_imperative_tables() -> None:
+    assert get_imperative_verbs()[stem("returns")] == {"return"}
+    assert "this" in get_imperative_blacklist()
+
+
+def test_stem_is_memoized() -> None:
+    stem.cache_clear()
+
+    assert stem("returns") == stem("returns")
+    assert stem.cache_info().hits == 1
+
+
+def test_wordlists_are_not_loaded_on_import() -> None:
+    code = (
+        "import sys, lintel;"
+        "from lintel.cli import app;"
+        "assert lintel.get_imperative_verbs.cache_info().currsize == 0;"
+        "assert 'snowballstemmer' not in sys.modules"
+    )
+
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+
+    assert result.returncode == 0, result.stderr
+
+
+def test_wordlists_are_still_available_as_module_attributes() -> None:
+    assert lintel.IMPERATIVE_VERBS == get_imperative_verbs()
+    assert lintel.IMPERATIVE_BLACKLIST == get_imperative_blacklist()
+
+    with pytest.raises(AttributeError, match="has no attribute 'IMPERATIVE_NOUNS'"):
+        lintel.IMPERATIVE_NOUNS